@@ -3,14 +3,115 @@ Pac-Man Game - Main Entry Point
 Simple Pac-Man game implementation using Pygame
 """
 
+import argparse
 import pygame
 import sys
 from src.game import Game
+from src.game_loop import FixedStepLoop, TIME_SCALES, UNLIMITED
 from src.constants import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
 
+# Obergrenze für gezeichnete Frames pro Sekunde (0 = so schnell wie möglich)
+RENDER_FPS = 144
+
+
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Pac-Man Game")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="simulate without window and sound as fast as possible",
+    )
+    parser.add_argument(
+        "--games", type=int, default=1, help="number of headless games to simulate"
+    )
+    parser.add_argument(
+        "--frames",
+        type=int,
+        default=FPS * 60 * 5,
+        help="maximum logical frames per headless game",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="time the game subsystems every frame (F3 shows the graph)",
+    )
+    parser.add_argument(
+        "--profile-out",
+        metavar="FILE",
+        help="export the profile of the last frames on exit (.csv or .json)",
+    )
+    parser.add_argument(
+        "--render-fps",
+        type=int,
+        default=RENDER_FPS,
+        help="maximum drawn frames per second, 0 = unlimited (simulation is 60 Hz)",
+    )
+    parser.add_argument(
+        "--time-scale",
+        type=lambda value: UNLIMITED if value == "max" else float(value),
+        default=1.0,
+        help=f"game speed {', '.join(f'{s:g}' for s in TIME_SCALES[:-1])} or max "
+        "(F5/F6 while playing)",
+    )
+    parser.add_argument(
+        "--seed", type=int, help="seed for all randomness (reproducible games)"
+    )
+    parser.add_argument(
+        "--record", metavar="FILE", help="save a replay of the last game on exit"
+    )
+    parser.add_argument(
+        "--replay", metavar="FILE", help="play a recorded replay headless and check it"
+    )
+    return parser.parse_args(argv)
+
+
+def run_headless(games, max_frames, profile=False, seed=None):
+    """Run headless games and print simulated frames per wall-clock second"""
+    from src.headless import run_headless_games
+
+    results = run_headless_games(games, max_frames, profile=profile, seed=seed)
+    total_frames = 0
+    total_time = 0.0
+    for i, stats in enumerate(results, start=1):
+        total_frames += stats["frames"]
+        total_time += stats["wall_seconds"]
+        print(
+            f"Game {i}: {stats['frames']} frames, score {stats['score']}, "
+            f"{stats['simulated_fps']:.0f} simulated FPS "
+            f"({stats['speedup']:.1f}x real time), state {stats['state_hash']}"
+        )
+        for section, (p50, p95, p99) in stats.get("profile", {}).items():
+            print(f"  {section:<14} p50 {p50:.3f}  p95 {p95:.3f}  p99 {p99:.3f} ms")
+    if total_time > 0:
+        print(f"Total: {total_frames / total_time:.0f} simulated FPS")
+
+
+def run_replay(path):
+    """Play a replay headless and report whether the end state matches"""
+    from src.replay import ReplayPlayer, load_replay
+
+    replay = load_replay(path)
+    player = ReplayPlayer(replay)
+    identical, game = player.verify()
+    print(
+        f"Replay {path}: {game.frame} frames, score {game.score}, "
+        f"lives {game.lives} - {'identical' if identical else 'DIFFERENT'}"
+    )
+    if player.first_divergence is not None:
+        print(f"First diverging frame: {player.first_divergence}")
+    return identical
+
 
 def main():
     """Main function to start the Pac-Man game"""
+    args = parse_args()
+    if args.replay:
+        sys.exit(0 if run_replay(args.replay) else 1)
+    if args.headless:
+        run_headless(args.games, args.frames, args.profile, args.seed)
+        return
+
     # Initialize Pygame
     pygame.init()
     pygame.mixer.init()
@@ -27,11 +128,16 @@ def main():
     except (pygame.error, FileNotFoundError) as e:
         print(f"Could not load game icon: {e}")
 
-    # Create clock for FPS control
+    # Create clock for FPS control - the simulation runs at a fixed FPS,
+    # drawing as often as --render-fps allows
     clock = pygame.time.Clock()
+    loop = FixedStepLoop()
 
     # Create game instance
-    game = Game(screen)
+    game = Game(
+        screen, profile=args.profile or args.profile_out is not None, seed=args.seed
+    )
+    game.set_time_scale(args.time_scale)
 
     # Main game loop
     running = True
@@ -46,21 +152,31 @@ def main():
                 if result == "quit":
                     running = False
 
-        # Update game state and check for quit signal
-        result = game.update()
-        if result == "quit":
-            running = False
-
-        # Draw everything
-        game.draw()
+        # Update game state (as many fixed steps as are due at the current time
+        # scale - frames in between are not drawn) and check for quit
+        time_scale = game.get_time_scale()
+        for _ in loop.updates(clock.tick(args.render_fps) / 1000, time_scale):
+            result = game.update()
+            if result == "quit":
+                running = False
 
-        # Update display
-        pygame.display.flip()
+        # Draw everything, sprites interpolated between the last two updates
+        game.draw(loop.get_alpha() if time_scale != UNLIMITED else 1.0)
 
-        # Control frame rate
-        clock.tick(FPS)
+        # Update display - only the changed areas while playing
+        dirty_rects = game.get_dirty_rects()
+        if dirty_rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty_rects)
 
     # Clean up
+    if args.record and game.replay is not None:
+        game.replay.save(args.record, game)
+        print(f"Replay saved to {args.record}")
+    if args.profile_out:
+        game.profiler.export(args.profile_out)
+        print(f"Profile exported to {args.profile_out}")
     pygame.quit()
     sys.exit()
 
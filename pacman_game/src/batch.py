@@ -0,0 +1,960 @@
+"""
+Batch Simulation
+Steps many Pac-Man games in lockstep: the state of all games lives in NumPy
+arrays and every frame is one vectorized call instead of thousands of
+Game/Pacman/Ghost method calls (e.g. for evaluating AI policies)
+
+The rules are the ones of the object engine (Game.update, Pacman.update,
+GhostSquad.update, Ghost.choose_direction_at_intersection and
+PelletManager.update/check_collection), frame for frame - every game has its
+own random.Random that is consumed in exactly the same order, so a batch
+game with seed s matches Game(seed=s).
+Not simulated: animations and sounds (they do not affect the game)
+
+Conformance check against the object engine:
+    python -m src.batch --verify
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import time
+import numpy as np
+from .constants import *
+from .maze import Maze, EXIT_BITS, EXIT_PADDING
+from .player import Pacman
+from .ghost import (
+    Ghost,
+    SCATTER_CORNERS,
+    HOUSE_EXIT_TIMERS,
+    PINKY_OFFSETS,
+    INKY_OFFSETS,
+    DIRECTION_PRIORITY,
+)
+from .pellets import PelletManager, SpecialPellet
+from .nodes import find_nearest_node, graph_to_arrays, NO_LINK
+from .return_field import FIELD_DIRECTIONS
+
+GHOST_NAMES = ["blinky", "pinky", "inky", "clyde"]
+
+# Richtungs-Codes: Index in DIRECTION_NAMES (wie Pacman.current_direction)
+DIRECTION_NAMES = [None, "up", "down", "left", "right"]
+DIRECTION_VECTORS = [STOP, UP, DOWN, LEFT, RIGHT]
+DIRECTION_CODES = {vector: code for code, vector in enumerate(DIRECTION_VECTORS)}
+DIR_LEFT = DIRECTION_NAMES.index("left")
+DIR_RIGHT = DIRECTION_NAMES.index("right")
+
+# Eingabe pro Spiel für step(): NO_INPUT oder ein Richtungs-Code
+# (0 = STOP löscht die gewünschte Richtung wie Pacman.set_direction(STOP))
+NO_INPUT = -1
+
+# Reihenfolge, in der Ghost.choose_direction_at_intersection die Richtungen prüft
+GHOST_DIRECTIONS = [UP, DOWN, LEFT, RIGHT]
+# Dieselben Richtungen nach DIRECTION_PRIORITY sortiert (für argmin bei Gleichstand)
+GHOST_PRIORITY_ORDER = [
+    GHOST_DIRECTIONS.index(direction)
+    for direction in sorted(GHOST_DIRECTIONS, key=DIRECTION_PRIORITY.get)
+]
+
+# Rand um die Wand-Tabelle (Geister können im Tunnel außerhalb des Grids sein)
+PAD = 2
+
+
+class BatchSimulator:
+    """
+    Simulates `games` independent games (one seed each) at once
+    All per-game state is stored in arrays with one entry per game,
+    ghost arrays have the shape (4, games)
+    """
+
+    def __init__(self, games, seeds=None, maze=None):
+        self.games = games
+        self.seeds = list(seeds) if seeds is not None else list(range(games))
+        if len(self.seeds) != games:
+            raise ValueError("Need exactly one seed per game")
+        self.maze = maze if maze is not None else Maze(load_assets=False)
+        self.build_tables()
+        self.reset()
+
+    # ------------------------------------------------------------------
+    # Static tables (derived from the maze and the object classes)
+    # ------------------------------------------------------------------
+
+    def build_tables(self):
+        """Lookup tables for walls, nodes, tunnels and the start positions"""
+        maze = self.maze
+        width, height = maze.width, maze.height
+
+        # Pac-Man bewegt sich über den Node-Graphen (ohne Tunnel-Kanten, wie
+        # Node.get_neighbor_in_direction) - Slots 0..3 = Codes 1..4
+        graph = graph_to_arrays(maze.nodes)
+        tunnel = (graph["tunnel_mask"][:, None] >> np.arange(4)) & 1
+        self.node_ok = np.zeros((height, width), dtype=bool)
+        self.node_ok[graph["grid_y"], graph["grid_x"]] = True
+        self.pac_neighbors = np.zeros((height, width, 5), dtype=bool)
+        self.pac_neighbors[graph["grid_y"], graph["grid_x"], 1:] = (
+            graph["links"] != NO_LINK
+        ) & (tunnel == 0)
+
+        # Tunnel-Ausgänge (Pacman prüft sie nur in Richtung left/right)
+        self.tunnel_x = np.full((height, width, 5), -1, dtype=np.int64)
+        self.tunnel_y = np.full((height, width, 5), -1, dtype=np.int64)
+        for y in range(height):
+            for x in range(width):
+                for code in (DIR_LEFT, DIR_RIGHT):
+                    dx, dy = DIRECTION_VECTORS[code]
+                    tunnel_exit = maze.get_tunnel_exit(x, y, dx, dy)
+                    if tunnel_exit:
+                        self.tunnel_x[y, x, code], self.tunnel_y[y, x, code] = (
+                            tunnel_exit
+                        )
+
+        # Nächster Node für jedes Tile (falls Pac-Man einmal keinen Node hat)
+        self.nearest_x = np.zeros((height, width), dtype=np.int64)
+        self.nearest_y = np.zeros((height, width), dtype=np.int64)
+        for y in range(height):
+            for x in range(width):
+                node = find_nearest_node(maze.node_map, x, y)
+                self.nearest_x[y, x] = node.grid_x
+                self.nearest_y[y, x] = node.grid_y
+
+        # Offene Richtungen der Geister pro Tile (Maze.exit_masks, gleicher Rand)
+        self.exit_masks = np.array(maze.exit_masks, dtype=np.int64).reshape(
+            height + 2 * EXIT_PADDING, width + 2 * EXIT_PADDING
+        )
+        self.exit_bits = np.array([EXIT_BITS[d] for d in GHOST_DIRECTIONS])
+
+        # Weglängen für Clydes Abstand (entspricht dem FlowField der Objekte):
+        # Node-Index pro Tile (-1 = kein Node) und die All-Pairs-Distanzen
+        table = maze.get_distance_table()
+        self.tile_nodes = np.full((height + 2 * PAD, width + 2 * PAD), -1, np.int64)
+        self.tile_nodes[PAD:-PAD, PAD:-PAD] = table.tile_index
+        self.path_distance = table.dist.astype(np.int64)
+
+        # Rückweg-Feld der gefressenen Geister (-1 = greedy wie bisher)
+        self.return_codes = np.full((height + 2 * PAD, width + 2 * PAD), -1, np.int64)
+        self.return_codes[PAD:-PAD, PAD:-PAD] = maze.get_return_field().directions
+        self.return_vectors = np.array(FIELD_DIRECTIONS, dtype=np.int64)
+
+        # Ziel-Offsets der Geister pro Richtungs-Code von Pac-Man
+        self.pinky_offsets = np.array([PINKY_OFFSETS[n] for n in DIRECTION_NAMES])
+        self.inky_offsets = np.array([INKY_OFFSETS[n] for n in DIRECTION_NAMES])
+        self.vectors = np.array(DIRECTION_VECTORS, dtype=np.int64)
+
+        # Startzustand aus frisch zurückgesetzten Objekten übernehmen
+        pacman = Pacman(11, 15, load_assets=False)
+        pacman.reset(1, 1)
+        pacman.initialize_nodes(maze.node_map)
+        self.pacman_template = pacman
+
+        self.ghost_start = (maze.width // 2, maze.height // 2)
+        self.ghost_templates = []
+        for name in GHOST_NAMES:
+            ghost = Ghost(*self.ghost_start, WHITE, name, load_assets=False)
+            ghost.reset(*self.ghost_start)
+            self.ghost_templates.append(ghost)
+
+        pellets = PelletManager(maze)
+        self.pellet_template = np.frombuffer(bytes(pellets.pellet_grid), np.uint8) > 0
+        self.corners = pellets.power_pellet_positions
+        self.corner_x = np.array([x for x, _ in self.corners], dtype=np.int64)
+        self.corner_y = np.array([y for _, y in self.corners], dtype=np.int64)
+        self.power_spawn_delay = pellets.power_pellet_spawn_delay
+        self.speed_spawn_delay = pellets.speed_pellet_spawn_delay
+        self.speed_pellet_points = SpecialPellet(0, 0).get_points()
+        self.speed_boost_duration = pacman.speed_boost_duration
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def reset(self):
+        """Start all games (same state as Game.start_game on a new Game)"""
+        n = self.games
+        self.rngs = [random.Random(seed) for seed in self.seeds]
+        self.frames = np.zeros(n, dtype=np.int64)
+        self.state = np.full(n, PLAYING, dtype=np.int64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.lives = np.full(n, 3, dtype=np.int64)
+
+        # Pac-Man
+        self.pac_x = np.zeros(n)
+        self.pac_y = np.zeros(n)
+        self.pac_grid_x = np.zeros(n, dtype=np.int64)
+        self.pac_grid_y = np.zeros(n, dtype=np.int64)
+        self.pac_pos_x = np.zeros(n, dtype=np.int64)  # Aktueller Node (-1 = None)
+        self.pac_pos_y = np.zeros(n, dtype=np.int64)
+        self.pac_target_x = np.zeros(n, dtype=np.int64)  # Ziel-Node (-1 = None)
+        self.pac_target_y = np.zeros(n, dtype=np.int64)
+        self.pac_direction = np.zeros(n, dtype=np.int64)
+        self.pac_next_direction = np.zeros(n, dtype=np.int64)
+        self.pac_velocity_x = np.zeros(n)
+        self.pac_velocity_y = np.zeros(n)
+        self.pac_speed = np.zeros(n)
+        self.boost_active = np.zeros(n, dtype=bool)
+        self.boost_timer = np.zeros(n, dtype=np.int64)
+        self.reset_pacman(np.ones(n, dtype=bool))
+
+        # Geister (Zeile = Geist in GHOST_NAMES-Reihenfolge)
+        shape = (len(GHOST_NAMES), n)
+        self.ghost_pixel_x = np.zeros(shape)
+        self.ghost_pixel_y = np.zeros(shape)
+        self.ghost_x = np.zeros(shape, dtype=np.int64)
+        self.ghost_y = np.zeros(shape, dtype=np.int64)
+        self.ghost_grid_x = np.zeros(shape, dtype=np.int64)
+        self.ghost_grid_y = np.zeros(shape, dtype=np.int64)
+        self.ghost_dx = np.zeros(shape, dtype=np.int64)
+        self.ghost_dy = np.zeros(shape, dtype=np.int64)
+        self.ghost_mode = np.zeros(shape, dtype=np.int64)
+        self.ghost_previous_mode = np.zeros(shape, dtype=np.int64)
+        self.ghost_mode_timer = np.zeros(shape, dtype=np.int64)
+        self.ghost_scatter_timer = np.zeros(shape, dtype=np.int64)
+        self.ghost_target_x = np.zeros(shape, dtype=np.int64)
+        self.ghost_target_y = np.zeros(shape, dtype=np.int64)
+        self.ghost_in_house = np.zeros(shape, dtype=bool)
+        self.ghost_exit_timer = np.zeros(shape, dtype=np.int64)
+        self.ghost_can_reverse = np.zeros(shape, dtype=bool)
+        self.reset_ghosts(np.ones(n, dtype=bool))
+
+        # Pellets: ein Bit pro Tile, Special Pellets als Index in self.corners
+        self.pellets = np.tile(self.pellet_template, (n, 1))
+        self.remaining = self.pellets.sum(axis=1)
+        self.power_slots = np.full(
+            (n, 2), -1, dtype=np.int64
+        )  # Max 2, in Spawn-Reihenfolge
+        self.power_timer = np.zeros(n, dtype=np.int64)
+        self.power_delay = np.full(n, self.power_spawn_delay, dtype=np.int64)
+        self.speed_slot = np.full(n, -1, dtype=np.int64)
+        self.speed_timer = np.zeros(n, dtype=np.int64)
+        self.speed_delay = np.full(n, self.speed_spawn_delay, dtype=np.int64)
+
+    def reset_pacman(self, mask):
+        """Pacman.reset(1, 1) + initialize_nodes for the masked games"""
+        pacman = self.pacman_template
+        self.pac_x[mask] = pacman.x
+        self.pac_y[mask] = pacman.y
+        self.pac_grid_x[mask] = pacman.grid_x
+        self.pac_grid_y[mask] = pacman.grid_y
+        self.pac_pos_x[mask] = pacman.pos.grid_x
+        self.pac_pos_y[mask] = pacman.pos.grid_y
+        self.pac_target_x[mask] = -1
+        self.pac_target_y[mask] = -1
+        self.pac_direction[mask] = 0
+        self.pac_next_direction[mask] = 0
+        self.pac_velocity_x[mask] = 0
+        self.pac_velocity_y[mask] = 0
+        self.pac_speed[mask] = pacman.base_speed
+        self.boost_active[mask] = False
+        self.boost_timer[mask] = 0
+
+    def reset_ghosts(self, mask):
+        """Ghost.reset for all ghosts of the masked games (target is kept)"""
+        for g, ghost in enumerate(self.ghost_templates):
+            self.ghost_pixel_x[g, mask] = ghost.pixel_x
+            self.ghost_pixel_y[g, mask] = ghost.pixel_y
+            self.ghost_x[g, mask] = ghost.x
+            self.ghost_y[g, mask] = ghost.y
+            self.ghost_grid_x[g, mask] = ghost.grid_x
+            self.ghost_grid_y[g, mask] = ghost.grid_y
+            self.ghost_dx[g, mask], self.ghost_dy[g, mask] = ghost.direction
+            self.ghost_mode[g, mask] = ghost.mode
+            self.ghost_previous_mode[g, mask] = ghost.previous_mode
+            self.ghost_mode_timer[g, mask] = ghost.mode_timer
+            self.ghost_scatter_timer[g, mask] = ghost.scatter_timer
+            self.ghost_in_house[g, mask] = ghost.in_house
+            self.ghost_exit_timer[g, mask] = ghost.house_exit_timer
+            self.ghost_can_reverse[g, mask] = ghost.can_reverse
+
+    # ------------------------------------------------------------------
+    # Frame update (Game.update for all games)
+    # ------------------------------------------------------------------
+
+    def step(self, actions=None):
+        """
+        Advance every running game by one frame
+        actions: optional array with one input per game (NO_INPUT or direction code)
+        """
+        playing = self.state == PLAYING
+        if not playing.any():
+            return
+
+        if actions is not None:
+            actions = np.asarray(actions)
+            pressed = playing & (actions != NO_INPUT)
+            self.pac_next_direction[pressed] = actions[pressed]
+
+        self.update_pacman(playing)
+        # Wie GhostSquad.update: erst alle Modi, dann alle Ziele, dann bewegen
+        ghosts = range(len(GHOST_NAMES))
+        active = [self.update_ghost_mode(g, playing) for g in ghosts]
+        for g in ghosts:
+            self.set_target(g, active[g])
+        for g in ghosts:
+            self.move_ghost(g, active[g])
+        self.update_pellets(playing)
+        self.check_collection(playing)
+        self.check_ghost_collisions(playing)
+
+        victory = playing & (self.remaining == 0)
+        self.state[victory] = VICTORY
+        self.frames[playing] += 1
+
+    def run(self, frames, policy=None):
+        """Step up to `frames` frames, policy(sim) returns the actions per frame"""
+        for _ in range(frames):
+            if not (self.state == PLAYING).any():
+                break
+            self.step(policy(self) if policy is not None else None)
+
+    def update_pacman(self, m):
+        """Pacman.update: node-based movement"""
+        # Speed Boost
+        boost = m & self.boost_active
+        self.boost_timer[boost] -= 1
+        ended = boost & (self.boost_timer <= 0)
+        self.boost_active[ended] = False
+        self.pac_speed[ended] = self.pacman_template.base_speed
+
+        x, y = self.pac_x, self.pac_y
+        self.pac_grid_x[m] = x[m] // GRID_SIZE
+        self.pac_grid_y[m] = y[m] // GRID_SIZE
+
+        # Kein aktueller Node: auf den nächsten Node setzen
+        lost = m & (self.pac_pos_x < 0)
+        if lost.any():
+            gx = self.pac_grid_x[lost]
+            gy = self.pac_grid_y[lost]
+            self.place_pacman(lost, self.nearest_x[gy, gx], self.nearest_y[gy, gx])
+
+        # Ziel-Node erreicht (Mittelpunkt weniger als 5 Pixel entfernt)
+        has_target = m & (self.pac_target_x >= 0)
+        distance_x = x + PACMAN_SIZE / 2 - (self.pac_target_x * GRID_SIZE + 10)
+        distance_y = y + PACMAN_SIZE / 2 - (self.pac_target_y * GRID_SIZE + 10)
+        arrived = has_target & (np.sqrt(distance_x**2 + distance_y**2) < 5)
+        if arrived.any():
+            self.place_pacman(
+                arrived, self.pac_target_x[arrived], self.pac_target_y[arrived]
+            )
+            self.pac_target_x[arrived] = -1
+            self.pac_target_y[arrived] = -1
+            self.pac_velocity_x[arrived] = 0
+            self.pac_velocity_y[arrived] = 0
+
+            # Tunnel: Teleport zum Ausgang
+            gx = self.pac_grid_x[arrived]
+            gy = self.pac_grid_y[arrived]
+            direction = self.pac_direction[arrived]
+            exit_x = np.full(len(gx), -1)
+            exit_y = np.full(len(gx), -1)
+            sideways = (direction == DIR_LEFT) | (direction == DIR_RIGHT)
+            exit_x[sideways] = self.tunnel_x[gy, gx, direction][sideways]
+            exit_y[sideways] = self.tunnel_y[gy, gx, direction][sideways]
+            teleport = np.zeros_like(arrived)
+            teleport[arrived] = exit_x >= 0
+            if teleport.any():
+                tx = exit_x[exit_x >= 0]
+                ty = exit_y[exit_x >= 0]
+                self.place_pacman(teleport, tx, ty)
+                # Kein Node am Ausgang -> pos = None
+                no_node = ~self.node_ok[ty, tx]
+                self.pac_pos_x[teleport] = np.where(no_node, -1, tx)
+                self.pac_pos_y[teleport] = np.where(no_node, -1, ty)
+
+        # Am Node ohne Ziel: gewünschte Richtung, sonst aktuelle Richtung
+        idle = m & (self.pac_pos_x >= 0) & (self.pac_target_x < 0)
+        if idle.any():
+            pos_x = self.pac_pos_x[idle]
+            pos_y = self.pac_pos_y[idle]
+            wanted = self.pac_next_direction[idle]
+            current = self.pac_direction[idle]
+            take_wanted = self.pac_neighbors[pos_y, pos_x, wanted]
+            take_current = ~take_wanted & self.pac_neighbors[pos_y, pos_x, current]
+            direction = np.where(take_wanted, wanted, current)
+            go = take_wanted | take_current
+
+            start = np.zeros_like(idle)
+            start[idle] = go
+            direction = direction[go]
+            vx = self.vectors[direction, 0]
+            vy = self.vectors[direction, 1]
+            self.pac_target_x[start] = pos_x[go] + vx
+            self.pac_target_y[start] = pos_y[go] + vy
+            self.pac_velocity_x[start] = vx * self.pac_speed[start]
+            self.pac_velocity_y[start] = vy * self.pac_speed[start]
+            self.pac_direction[start] = direction
+
+        # Bewegung zum Ziel
+        moving = m & (self.pac_target_x >= 0)
+        x[moving] += self.pac_velocity_x[moving]
+        y[moving] += self.pac_velocity_y[moving]
+        standing = m & ~moving
+        self.pac_velocity_x[standing] = 0
+        self.pac_velocity_y[standing] = 0
+
+    def place_pacman(self, mask, grid_x, grid_y):
+        """Put Pac-Man exactly on a node (pos, pixel and grid position)"""
+        self.pac_pos_x[mask] = grid_x
+        self.pac_pos_y[mask] = grid_y
+        self.pac_x[mask] = grid_x * GRID_SIZE
+        self.pac_y[mask] = grid_y * GRID_SIZE
+        self.pac_grid_x[mask] = grid_x
+        self.pac_grid_y[mask] = grid_y
+
+    def update_ghost_mode(self, g, m):
+        """Ghost.update_mode for ghost g, returns the games where it moves on"""
+        name = GHOST_NAMES[g]
+        self.ghost_mode_timer[g, m] += 1
+
+        # Geisterhaus: Timer bis zum Verlassen, sonst im Haus bewegen
+        in_house = m & self.ghost_in_house[g]
+        self.ghost_exit_timer[g, in_house] += 1
+        leaving = in_house & (self.ghost_exit_timer[g] >= HOUSE_EXIT_TIMERS[name])
+        self.exit_house(g, leaving)
+        staying = in_house & ~leaving
+        self.move_in_house(g, staying)
+        active = m & ~staying
+
+        # Mode-Wechsel-Timing
+        mode = self.ghost_mode[g]
+        timer = self.ghost_mode_timer[g]
+        to_chase = active & (mode == SCATTER) & (timer > 420)
+        to_scatter = active & (mode == CHASE) & (timer > 1200)
+        self.switch_mode(g, to_chase, CHASE)
+        self.switch_mode(g, to_scatter, SCATTER)
+        self.ghost_scatter_timer[g, to_scatter] += 1
+        forever = to_scatter & (self.ghost_scatter_timer[g] >= 4)
+        mode[forever] = CHASE
+        timer[forever] = 999999
+
+        # Frightened endet nach 8 Sekunden
+        calm = active & (mode == FRIGHTENED) & (timer > 480)
+        self.switch_mode(g, calm, self.ghost_previous_mode[g].copy())
+
+        # Gefressene Geister am Geisterhaus wiederbeleben
+        center_x = MAZE_WIDTH // 2
+        center_y = MAZE_HEIGHT // 2
+        home = (
+            active
+            & (mode == EATEN)
+            & (np.abs(self.ghost_grid_x[g] - center_x) <= 1)
+            & (np.abs(self.ghost_grid_y[g] - center_y) <= 2)
+        )
+        if home.any():
+            previous = self.ghost_previous_mode[g, home]
+            mode[home] = np.where(previous != FRIGHTENED, previous, SCATTER)
+            self.ghost_in_house[g, home] = True
+            self.set_ghost_tile(g, home, center_x, center_y)
+            self.ghost_exit_timer[g, home] = 120
+        return active
+
+    def exit_house(self, g, mask):
+        """Ghost.exit_house: place the ghost above the house, heading left"""
+        self.ghost_in_house[g, mask] = False
+        self.set_ghost_tile(g, mask, MAZE_WIDTH // 2, MAZE_HEIGHT // 2 - 3)
+        self.ghost_dx[g, mask], self.ghost_dy[g, mask] = LEFT
+        self.ghost_can_reverse[g, mask] = False
+
+    def set_ghost_tile(self, g, mask, grid_x, grid_y):
+        """Put a ghost exactly on a tile"""
+        self.ghost_grid_x[g, mask] = grid_x
+        self.ghost_grid_y[g, mask] = grid_y
+        self.ghost_x[g, mask] = grid_x * GRID_SIZE
+        self.ghost_y[g, mask] = grid_y * GRID_SIZE
+        self.ghost_pixel_x[g, mask] = grid_x * GRID_SIZE
+        self.ghost_pixel_y[g, mask] = grid_y * GRID_SIZE
+
+    def move_in_house(self, g, mask):
+        """Ghost.move_in_house: to the middle, then up to the exit"""
+        center_x = MAZE_WIDTH // 2
+        sideways = mask & (self.ghost_grid_x[g] != center_x)
+        step = np.where(self.ghost_grid_x[g] < center_x, 0.5, -0.5)
+        self.ghost_pixel_x[g, sideways] += step[sideways]
+        self.ghost_x[g, sideways] = np.trunc(self.ghost_pixel_x[g, sideways])
+        self.ghost_grid_x[g, sideways] = self.ghost_x[g, sideways] // GRID_SIZE
+
+        upwards = mask & ~sideways
+        self.ghost_pixel_y[g, upwards] -= 0.5
+        self.ghost_y[g, upwards] = np.trunc(self.ghost_pixel_y[g, upwards])
+        self.ghost_grid_y[g, upwards] = self.ghost_y[g, upwards] // GRID_SIZE
+        at_exit = upwards & (self.ghost_grid_y[g] <= MAZE_HEIGHT // 2 - 3)
+        self.exit_house(g, at_exit)
+
+    def switch_mode(self, g, mask, new_mode):
+        """Ghost.switch_mode: new mode, reset timer and reverse direction"""
+        if not mask.any():
+            return
+        if isinstance(new_mode, np.ndarray):
+            new_mode = new_mode[mask]
+        self.ghost_previous_mode[g, mask] = self.ghost_mode[g, mask]
+        self.ghost_mode[g, mask] = new_mode
+        self.ghost_mode_timer[g, mask] = 0
+        outside = mask & ~self.ghost_in_house[g]
+        self.ghost_can_reverse[g, outside] = True
+        self.ghost_dx[g, outside] *= -1
+        self.ghost_dy[g, outside] *= -1
+
+    def set_frightened(self, g, mask):
+        """Ghost.set_frightened (eaten ghosts and ghosts in the house ignore it)"""
+        mode = self.ghost_mode[g]
+        mask = mask & (mode != EATEN) & ~self.ghost_in_house[g]
+        keep = mask & (mode == FRIGHTENED)
+        self.ghost_previous_mode[g, mask & ~keep] = mode[mask & ~keep]
+        self.switch_mode(g, mask, FRIGHTENED)
+
+    def set_target(self, g, m):
+        """GhostSquad.set_targets: target tile by mode and personality"""
+        name = GHOST_NAMES[g]
+        mode = self.ghost_mode[g]
+        target_x = self.ghost_target_x[g]
+        target_y = self.ghost_target_y[g]
+        pac_x = self.pac_grid_x
+        pac_y = self.pac_grid_y
+
+        scatter = m & (mode == SCATTER)
+        target_x[scatter], target_y[scatter] = SCATTER_CORNERS[name]
+
+        chase = m & (mode == CHASE)
+        if chase.any():
+            if name == "blinky":
+                target_x[chase] = pac_x[chase]
+                target_y[chase] = pac_y[chase]
+            elif name == "pinky":
+                offset = self.pinky_offsets[self.pac_direction[chase]]
+                target_x[chase] = pac_x[chase] + offset[:, 0]
+                target_y[chase] = pac_y[chase] + offset[:, 1]
+            elif name == "inky":
+                offset = self.inky_offsets[self.pac_direction[chase]]
+                pivot_x = pac_x[chase] + offset[:, 0]
+                pivot_y = pac_y[chase] + offset[:, 1]
+                blinky = GHOST_NAMES.index("blinky")
+                target_x[chase] = 2 * pivot_x - self.ghost_grid_x[blinky, chase]
+                target_y[chase] = 2 * pivot_y - self.ghost_grid_y[blinky, chase]
+            elif name == "clyde":
+                # Weglänge, Luftlinie wenn ein Tile kein Node ist
+                distance = np.sqrt(
+                    (self.ghost_grid_x[g] - pac_x) ** 2
+                    + (self.ghost_grid_y[g] - pac_y) ** 2
+                )
+                ghost_node = self.get_tile_nodes(
+                    self.ghost_grid_x[g], self.ghost_grid_y[g]
+                )
+                pac_node = self.get_tile_nodes(pac_x, pac_y)
+                steps = self.path_distance[ghost_node, pac_node]
+                known = (ghost_node >= 0) & (pac_node >= 0) & (steps >= 0)
+                distance = np.where(known, steps, distance)
+                far = chase & (distance > 8)
+                near = chase & ~far
+                target_x[far] = pac_x[far]
+                target_y[far] = pac_y[far]
+                target_x[near], target_y[near] = SCATTER_CORNERS["clyde"]
+
+        # Zufallsziel im Frightened-Modus (pro Spiel eigener Zufallsgenerator)
+        for i in np.nonzero(m & (mode == FRIGHTENED))[0]:
+            rng = self.rngs[i]
+            target_x[i] = rng.randint(0, MAZE_WIDTH - 1)
+            target_y[i] = rng.randint(0, MAZE_HEIGHT - 1)
+
+        eaten = m & (mode == EATEN)
+        target_x[eaten] = MAZE_WIDTH // 2
+        target_y[eaten] = MAZE_HEIGHT // 2
+
+    def get_tile_nodes(self, grid_x, grid_y):
+        """Node index per game for the given tiles (-1 = wall or outside)"""
+        height, width = self.tile_nodes.shape
+        x = grid_x + PAD
+        y = grid_y + PAD
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        nodes = self.tile_nodes[np.clip(y, 0, height - 1), np.clip(x, 0, width - 1)]
+        return np.where(inside, nodes, -1)
+
+    def move_ghost(self, g, m):
+        """Ghost.move: new direction at tile centers, then move and wrap"""
+        speed = np.where(self.ghost_mode[g] == EATEN, GHOST_SPEED * 2, GHOST_SPEED)
+        pixel_x = self.ghost_pixel_x[g]
+        pixel_y = self.ghost_pixel_y[g]
+
+        at_intersection = (
+            m
+            & (np.abs(pixel_x - self.ghost_grid_x[g] * GRID_SIZE) < 2)
+            & (np.abs(pixel_y - self.ghost_grid_y[g] * GRID_SIZE) < 2)
+        )
+        if at_intersection.any():
+            self.choose_direction(g, at_intersection)
+            self.ghost_can_reverse[g, at_intersection] = False
+
+        dx = self.ghost_dx[g]
+        dy = self.ghost_dy[g]
+        moving = m & ((dx != 0) | (dy != 0))
+        pixel_x[moving] += dx[moving] * speed[moving]
+        pixel_y[moving] += dy[moving] * speed[moving]
+        self.ghost_x[g, moving] = np.trunc(pixel_x[moving])
+        self.ghost_y[g, moving] = np.trunc(pixel_y[moving])
+        self.ghost_grid_x[g, moving] = (pixel_x[moving] + GRID_SIZE // 2) // GRID_SIZE
+        self.ghost_grid_y[g, moving] = (pixel_y[moving] + GRID_SIZE // 2) // GRID_SIZE
+
+        # Tunnel: links raus, rechts wieder rein (und umgekehrt)
+        x = self.ghost_x[g]
+        wrap_right = m & (x < -GRID_SIZE)
+        wrap_left = m & ~wrap_right & (x > SCREEN_WIDTH)
+        for mask, new_x in ((wrap_right, SCREEN_WIDTH), (wrap_left, -GRID_SIZE)):
+            x[mask] = new_x
+            pixel_x[mask] = new_x
+            self.ghost_grid_x[g, mask] = new_x // GRID_SIZE
+
+    def choose_direction(self, g, mask):
+        """Ghost.choose_direction_at_intersection for the masked games"""
+        games = np.nonzero(mask)[0]
+        grid_x = self.ghost_grid_x[g, games]
+        grid_y = self.ghost_grid_y[g, games]
+        dx = self.ghost_dx[g, games]
+        dy = self.ghost_dy[g, games]
+        can_reverse = self.ghost_can_reverse[g, games]
+
+        # Mögliche Richtungen (keine Wand, keine 180°-Wende ohne Mode-Wechsel)
+        possible = np.zeros((len(games), len(GHOST_DIRECTIONS)), dtype=bool)
+        distances = np.zeros(possible.shape, dtype=np.int64)
+        target_x = self.ghost_target_x[g, games]
+        target_y = self.ghost_target_y[g, games]
+        exits = self.exit_masks[
+            np.clip(grid_y + EXIT_PADDING, 0, self.exit_masks.shape[0] - 1),
+            np.clip(grid_x + EXIT_PADDING, 0, self.exit_masks.shape[1] - 1),
+        ]
+        for k, (cx, cy) in enumerate(GHOST_DIRECTIONS):
+            next_x = grid_x + cx
+            next_y = grid_y + cy
+            reverse = (cx == -dx) & (cy == -dy)
+            open_tile = (exits & self.exit_bits[k]) != 0
+            possible[:, k] = open_tile & ~(reverse & ~can_reverse)
+            # Quadrat der Distanz zum Ziel (gleiche Reihenfolge wie math.sqrt)
+            distances[:, k] = (next_x - target_x) ** 2 + (next_y - target_y) ** 2
+
+        # Sackgasse: nur Umkehr möglich
+        dead_end = ~possible.any(axis=1)
+
+        # Nächste Richtung zum Ziel, bei Gleichstand UP > LEFT > DOWN > RIGHT
+        ranked = np.where(possible, distances, np.iinfo(np.int64).max)
+        ranked = ranked[:, GHOST_PRIORITY_ORDER]
+        best = np.array(GHOST_PRIORITY_ORDER)[np.argmin(ranked, axis=1)]
+        choices = np.array(GHOST_DIRECTIONS)
+        new_dx = np.where(dead_end, -dx, choices[best, 0])
+        new_dy = np.where(dead_end, -dy, choices[best, 1])
+
+        # Eaten: Richtung aus dem Rückweg-Feld, wo es eine kennt
+        codes = self.return_codes[
+            np.clip(grid_y + PAD, 0, self.return_codes.shape[0] - 1),
+            np.clip(grid_x + PAD, 0, self.return_codes.shape[1] - 1),
+        ]
+        home = (self.ghost_mode[g, games] == EATEN) & (codes >= 0)
+        new_dx[home] = self.return_vectors[codes[home], 0]
+        new_dy[home] = self.return_vectors[codes[home], 1]
+
+        # Frightened: zufällige Richtung (in Prüf-Reihenfolge wie im Original)
+        frightened = self.ghost_mode[g, games] == FRIGHTENED
+        for j in np.nonzero(frightened)[0]:
+            if dead_end[j]:
+                options = [(-int(dx[j]), -int(dy[j]))]
+            else:
+                options = [d for d, ok in zip(GHOST_DIRECTIONS, possible[j]) if ok]
+            new_dx[j], new_dy[j] = self.rngs[games[j]].choice(options)
+
+        self.ghost_dx[g, games] = new_dx
+        self.ghost_dy[g, games] = new_dy
+
+    def update_pellets(self, m):
+        """PelletManager.update: spawn power pellets (max 2) and one speed pellet"""
+        power_count = (self.power_slots >= 0).sum(axis=1)
+        counting = m & (power_count < 2)
+        self.power_timer[counting] += 1
+        for i in np.nonzero(counting & (self.power_timer >= self.power_delay))[0]:
+            occupied = set(self.power_slots[i]) | {self.speed_slot[i]}
+            available = [c for c in range(len(self.corners)) if c not in occupied]
+            if available:
+                rng = self.rngs[i]
+                self.power_slots[i, power_count[i]] = rng.choice(available)
+                self.power_timer[i] = 0
+                self.power_delay[i] = rng.randint(300, 480)
+
+        counting = m & (self.speed_slot < 0)
+        self.speed_timer[counting] += 1
+        for i in np.nonzero(counting & (self.speed_timer >= self.speed_delay))[0]:
+            occupied = set(self.power_slots[i])
+            available = [c for c in range(len(self.corners)) if c not in occupied]
+            if available:
+                rng = self.rngs[i]
+                self.speed_slot[i] = rng.choice(available)
+                self.speed_timer[i] = 0
+                self.speed_delay[i] = rng.randint(600, 900)
+
+    def check_collection(self, m):
+        """PelletManager.check_collection plus the scoring in Game.update"""
+        x, y = self.pac_x, self.pac_y
+        positions = [
+            (self.pac_grid_x, self.pac_grid_y),
+            ((x // GRID_SIZE).astype(np.int64), (y // GRID_SIZE).astype(np.int64)),
+            (
+                ((x + PACMAN_SIZE / 2) // GRID_SIZE).astype(np.int64),
+                ((y + PACMAN_SIZE / 2) // GRID_SIZE).astype(np.int64),
+            ),
+        ]
+        width, height = self.maze.width, self.maze.height
+        games = np.arange(self.games)
+        points = np.zeros(self.games, dtype=np.int64)
+
+        # Normale Pellets
+        for check_x, check_y in positions:
+            inside = m & (check_x >= 0) & (check_x < width)
+            inside &= (check_y >= 0) & (check_y < height)
+            index = np.where(inside, check_y * width + check_x, 0)
+            hit = inside & self.pellets[games, index]
+            self.pellets[games[hit], index[hit]] = False
+            self.remaining[hit] -= 1
+            points[hit] += SMALL_PELLET_POINTS
+
+        # Special Pellets - selten, daher pro Spiel
+        def touches(slot):
+            corner = np.maximum(slot, 0)
+            match = np.zeros(self.games, dtype=bool)
+            for check_x, check_y in positions:
+                match |= (self.corner_x[corner] == check_x) & (
+                    self.corner_y[corner] == check_y
+                )
+            return m & (slot >= 0) & match
+
+        power_hits = [touches(self.power_slots[:, s]) for s in range(2)]
+        speed_hit = touches(self.speed_slot)
+        power_eaten = power_hits[0] | power_hits[1]
+        for i in np.nonzero(power_eaten | speed_hit)[0]:
+            rng = self.rngs[i]
+            remaining_slots = []
+            for s in range(2):
+                if power_hits[s][i]:
+                    points[i] += LARGE_PELLET_POINTS
+                    self.power_timer[i] = 0
+                    self.power_delay[i] = rng.randint(360, 600)
+                elif self.power_slots[i, s] >= 0:
+                    remaining_slots.append(self.power_slots[i, s])
+            self.power_slots[i] = (remaining_slots + [-1, -1])[:2]
+            if speed_hit[i]:
+                points[i] += self.speed_pellet_points
+                self.speed_slot[i] = -1
+                self.speed_timer[i] = 0
+                self.speed_delay[i] = rng.randint(720, 900)
+
+        self.score += points
+
+        # Speed Pellet -> Speed Boost, sonst Power Pellet -> Geister verängstigen
+        self.boost_active[speed_hit] = True
+        self.boost_timer[speed_hit] = self.speed_boost_duration
+        self.pac_speed[speed_hit] = PACMAN_SPEED_BOOST
+        frighten = power_eaten & ~speed_hit
+        if frighten.any():
+            for g in range(len(GHOST_NAMES)):
+                self.set_frightened(g, frighten)
+
+    def check_ghost_collisions(self, m):
+        """Game.check_ghost_collisions for all games (ghost by ghost)"""
+        collision_distance = (PACMAN_SIZE + GHOST_SIZE) / 2 * 0.8
+        for g in range(len(GHOST_NAMES)):
+            distance_x = (
+                self.pac_x + PACMAN_SIZE / 2 - (self.ghost_x[g] + GHOST_SIZE // 2)
+            )
+            distance_y = (
+                self.pac_y + PACMAN_SIZE / 2 - (self.ghost_y[g] + GHOST_SIZE // 2)
+            )
+            hit = m & (np.sqrt(distance_x**2 + distance_y**2) < collision_distance)
+            mode = self.ghost_mode[g]
+
+            eaten = hit & (mode == FRIGHTENED)
+            mode[eaten] = EATEN
+            self.score[eaten] += 200
+
+            killed = hit & ~eaten & (mode != EATEN)
+            self.lives[killed] -= 1
+            game_over = killed & (self.lives <= 0)
+            self.state[game_over] = GAME_OVER
+            self.reset_after_death(killed & ~game_over)
+
+    def reset_after_death(self, mask):
+        """Game.reset_after_death: positions reset, pellets stay eaten"""
+        if mask.any():
+            self.reset_pacman(mask)
+            self.reset_ghosts(mask)
+
+    # ------------------------------------------------------------------
+    # Comparison with the object engine
+    # ------------------------------------------------------------------
+
+    def snapshot(self, i):
+        """State of game i in the same format as snapshot_game()"""
+        ghosts = tuple(
+            (
+                float(self.ghost_pixel_x[g, i]),
+                float(self.ghost_pixel_y[g, i]),
+                int(self.ghost_grid_x[g, i]),
+                int(self.ghost_grid_y[g, i]),
+                (int(self.ghost_dx[g, i]), int(self.ghost_dy[g, i])),
+                int(self.ghost_mode[g, i]),
+                int(self.ghost_previous_mode[g, i]),
+                int(self.ghost_mode_timer[g, i]),
+                bool(self.ghost_in_house[g, i]),
+                (int(self.ghost_target_x[g, i]), int(self.ghost_target_y[g, i])),
+            )
+            for g in range(len(GHOST_NAMES))
+        )
+        pacman = (
+            float(self.pac_x[i]),
+            float(self.pac_y[i]),
+            int(self.pac_grid_x[i]),
+            int(self.pac_grid_y[i]),
+            DIRECTION_NAMES[self.pac_direction[i]],
+            bool(self.boost_active[i]),
+        )
+        specials = (
+            tuple(self.corners[c] for c in self.power_slots[i] if c >= 0),
+            self.corners[self.speed_slot[i]] if self.speed_slot[i] >= 0 else None,
+        )
+        return (
+            int(self.state[i]),
+            int(self.score[i]),
+            int(self.lives[i]),
+            int(self.remaining[i]),
+            self.pellets[i].astype(np.uint8).tobytes(),
+            pacman,
+            ghosts,
+            specials,
+        )
+
+
+def snapshot_game(game):
+    """State of an object-engine Game in the format of BatchSimulator.snapshot"""
+    pacman = game.pacman
+    manager = game.pellet_manager
+    ghosts = tuple(
+        (
+            float(ghost.pixel_x),
+            float(ghost.pixel_y),
+            int(ghost.grid_x),
+            int(ghost.grid_y),
+            ghost.direction,
+            ghost.mode,
+            ghost.previous_mode,
+            ghost.mode_timer,
+            ghost.in_house,
+            (ghost.target_x, ghost.target_y),
+        )
+        for ghost in game.ghosts
+    )
+    specials = (
+        tuple((pellet.x, pellet.y) for pellet in manager.active_power_pellets),
+        (
+            (manager.active_speed_pellet.x, manager.active_speed_pellet.y)
+            if manager.active_speed_pellet
+            else None
+        ),
+    )
+    return (
+        game.state,
+        game.score,
+        game.lives,
+        manager.remaining,
+        bytes(manager.pellet_grid),
+        (
+            float(pacman.x),
+            float(pacman.y),
+            int(pacman.grid_x),
+            int(pacman.grid_y),
+            pacman.current_direction,
+            pacman.speed_boost_active,
+        ),
+        ghosts,
+        specials,
+    )
+
+
+def random_inputs(seeds, frames, interval=23):
+    """Reproducible test inputs: a random direction every `interval` frames"""
+    inputs = np.full((frames, len(seeds)), NO_INPUT, dtype=np.int64)
+    for i, seed in enumerate(seeds):
+        rng = random.Random(seed + 1000)
+        for frame in range(0, frames, interval):
+            inputs[frame, i] = rng.randint(1, 4)
+    return inputs
+
+
+def verify_against_objects(seeds, frames=3600, interval=23):
+    """
+    Run every seed through the object engine (Game) and the batch engine with
+    the same inputs and compare the complete state after every frame
+    Returns {seed: first differing frame or None}
+    """
+    from .game import Game
+
+    inputs = random_inputs(seeds, frames, interval)
+    batch = BatchSimulator(len(seeds), seeds)
+    object_traces = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i, seed in enumerate(seeds):
+            game = Game(None, headless=True, seed=seed)
+            game.start_game()
+            trace = []
+            for frame in range(frames):
+                if game.state != PLAYING:
+                    break
+                if inputs[frame, i] != NO_INPUT:
+                    game.pacman.set_direction(DIRECTION_VECTORS[inputs[frame, i]])
+                game.update()
+                trace.append(snapshot_game(game))
+            object_traces.append(trace)
+
+    results = {seed: None for seed in seeds}
+    for frame in range(frames):
+        batch.step(inputs[frame])
+        for i, seed in enumerate(seeds):
+            trace = object_traces[i]
+            if results[seed] is not None or frame >= len(trace):
+                continue
+            if batch.snapshot(i) != trace[frame]:
+                results[seed] = frame
+    return results
+
+
+def main(argv=None):
+    """Benchmark the batch engine or verify it against the object engine"""
+    parser = argparse.ArgumentParser(description="Pac-Man batch simulation")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--frames", type=int, default=FPS * 60)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="compare frame by frame with the object engine",
+    )
+    args = parser.parse_args(argv)
+    seeds = range(args.seed, args.seed + args.games)
+
+    if args.verify:
+        results = verify_against_objects(list(seeds), args.frames)
+        failed = {seed: f for seed, f in results.items() if f is not None}
+        for seed, frame in failed.items():
+            print(f"Seed {seed}: first difference in frame {frame}")
+        print(f"{len(results) - len(failed)}/{len(results)} games identical")
+        return 1 if failed else 0
+
+    inputs = random_inputs(list(seeds), args.frames)
+    sim = BatchSimulator(args.games, seeds)
+    start = time.perf_counter()
+    for frame in range(args.frames):
+        sim.step(inputs[frame])
+    elapsed = time.perf_counter() - start
+    game_frames = int(sim.frames.sum())
+    print(
+        f"{args.games} games, {game_frames} game frames in {elapsed:.2f}s "
+        f"({game_frames / elapsed:.0f} game frames/s), "
+        f"mean score {sim.score.mean():.0f}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
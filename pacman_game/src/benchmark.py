@@ -0,0 +1,487 @@
+"""
+Benchmark Suite
+Times the hot paths of the game (Game.update in scripted headless scenarios,
+pellet collection, ghost AI, node graph, path finding and all draw methods)
+and compares the results against a JSON baseline. Timings only compare on
+the same machine, so the baseline is created locally (benchmarks/ is not
+part of the repository):
+
+    python -m src.benchmark run --out benchmarks/baseline.json
+    python -m src.benchmark compare
+
+compare exits with 1 if a benchmark got slower than its allowed slowdown -
+the threshold or, for noisy benchmarks, NOISE_FACTOR times the spread
+between best and median time - or if a benchmark is missing in the baseline
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import time
+from types import SimpleNamespace
+import pygame
+from .constants import *
+
+# Baselines neben dem src-Ordner (pacman_game/benchmarks)
+BENCHMARK_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks")
+)
+DEFAULT_BASELINE = os.path.join(BENCHMARK_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 0.5
+# Erlaubte Verlangsamung mindestens so oft die Streuung (median / best - 1)
+NOISE_FACTOR = 3
+BENCHMARK_VERSION = 1
+
+BENCHMARK_SEED = 1234
+# Frames, die das Spiel vor den Komponenten-Benchmarks läuft (Spielmitte)
+WARMUP_FRAMES = FPS * 5
+# Länge der Update-Szenarien in logischen Frames
+SCENARIO_FRAMES = FPS * 10
+
+
+class Benchmark:
+    """
+    One timed function: `func` is called `number` times per repeat,
+    `setup` (optional) runs before every repeat and is not timed
+    ops: operations per call (e.g. frames), results are per operation
+    """
+
+    def __init__(self, name, func, number, setup=None, ops=1):
+        self.name = name
+        self.func = func
+        self.number = number
+        self.setup = setup
+        self.ops = ops
+
+    def measure(self, repeat):
+        """Nanoseconds per operation of every repeat (GC off like timeit)"""
+        clock = time.perf_counter_ns
+        func = self.func
+        loops = range(self.number)
+        times = []
+        for _ in range(repeat):
+            if self.setup is not None:
+                self.setup()
+            gc_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                start = clock()
+                for _ in loops:
+                    func()
+                elapsed = clock() - start
+            finally:
+                if gc_enabled:
+                    gc.enable()
+            times.append(elapsed / (self.number * self.ops))
+        return times
+
+
+# ----------------------------------------------------------------------
+# Scenarios
+# ----------------------------------------------------------------------
+
+
+def wander_script(game, rng, frame):
+    """Pac-Man changes direction every 23 frames"""
+    if frame % 23 == 0:
+        game.set_pacman_direction(rng.choice([UP, DOWN, LEFT, RIGHT]))
+
+
+def idle_script(game, rng, frame):
+    """No input at all - only the ghosts and pellets do work"""
+
+
+def frightened_script(game, rng, frame):
+    """Wander and scare the ghosts every two seconds (random ghost moves)"""
+    wander_script(game, rng, frame)
+    if frame % (FPS * 2) == 0:
+        for ghost in game.ghosts:
+            ghost.set_frightened()
+
+
+SCENARIOS = {
+    "wander": wander_script,
+    "idle": idle_script,
+    "frightened": frightened_script,
+}
+
+
+def play_scenario(game, script, frames, seed=BENCHMARK_SEED):
+    """Start a seeded game and run `frames` updates of the script"""
+    game.start_game(seed)
+    rng = random.Random(seed)
+    for frame in range(frames):
+        if game.state != PLAYING:
+            break
+        script(game, rng, frame)
+        game.update()
+    return game
+
+
+# ----------------------------------------------------------------------
+# Suite
+# ----------------------------------------------------------------------
+
+
+def make_screen():
+    """Display surface for the draw benchmarks (dummy driver if no window)"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+
+def build_suite(screen):
+    """All benchmarks of the suite (games are created once and reused)"""
+    from .game import Game
+    from .nodes import build_nodes_and_graph, find_nearest_node
+    from .pathing import JUNCTION_DISTANCE
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        headless = Game(None, headless=True, seed=BENCHMARK_SEED)
+        game = Game(screen, seed=BENCHMARK_SEED)
+    game.music_manager.enabled = False
+    game.fast_forward = True
+    game.sound_enabled = False
+    maze = headless.maze
+    suite = []
+
+    # Game.update über ganze Szenarien, Ergebnis pro Frame
+    for name, script in SCENARIOS.items():
+        suite.append(
+            Benchmark(
+                f"update_{name}",
+                lambda script=script: play_scenario(headless, script, SCENARIO_FRAMES),
+                1,
+                ops=SCENARIO_FRAMES,
+            )
+        )
+
+    # Komponenten auf einem Spiel in der Spielmitte
+    def warm_up():
+        play_scenario(headless, wander_script, WARMUP_FRAMES)
+
+    pacman = headless.pacman
+    squad = headless.ghost_squad
+    suite.append(
+        Benchmark(
+            "ghost_squad_targets",
+            lambda: squad.set_targets(squad.plans, maze, pacman),
+            FPS * 30,
+            warm_up,
+        )
+    )
+    suite.append(
+        Benchmark(
+            "ghost_squad_update",
+            lambda: squad.update(maze, pacman),
+            FPS * 30,
+            warm_up,
+        )
+    )
+
+    # Pellet-Einsammeln: ein Stellvertreter läuft über alle begehbaren Tiles
+    tiles = [
+        (x, y)
+        for y in range(maze.height)
+        for x in range(maze.width)
+        if not maze.is_wall(x, y)
+    ]
+    walker = SimpleNamespace(x=0, y=0, grid_x=0, grid_y=0, size=GRID_SIZE - 4)
+    walk = []
+
+    def reset_pellets():
+        headless.pellet_manager.reset()
+        walk[:] = [itertools.cycle(tiles)]
+
+    def collect_step():
+        walker.grid_x, walker.grid_y = next(walk[0])
+        walker.x = walker.grid_x * GRID_SIZE + 2
+        walker.y = walker.grid_y * GRID_SIZE + 2
+        headless.pellet_manager.check_collection(walker)
+
+    suite.append(
+        Benchmark(
+            "pellets_check_collection", collect_step, len(tiles) * 10, reset_pellets
+        )
+    )
+
+    # Node-Graph, Pfadsuche und nächster Node
+    suite.append(
+        Benchmark("build_nodes_and_graph", lambda: build_nodes_and_graph(maze), 5)
+    )
+
+    rng = random.Random(BENCHMARK_SEED)
+    pairs = [(rng.choice(tiles), rng.choice(tiles)) for _ in range(200)]
+    pair_cycle = [None]
+
+    def reset_pairs():
+        pair_cycle[0] = itertools.cycle(pairs)
+
+    suite.append(
+        Benchmark(
+            "maze_find_path",
+            lambda: maze.find_path(*next(pair_cycle[0])),
+            len(pairs) * 5,
+            reset_pairs,
+        )
+    )
+
+    # Ungecachte Suche für lange Wege: A* über alle Tiles gegen Dijkstra über
+    # den Kreuzungs-Graphen (PathService nimmt ab JUNCTION_DISTANCE letzteren)
+    service = maze.path_service
+    long_pairs = [
+        pair for pair in pairs if service.heuristic(*pair) >= JUNCTION_DISTANCE
+    ]
+    long_cycle = [None]
+
+    def reset_long_pairs():
+        maze.get_junction_graph()
+        long_cycle[0] = itertools.cycle(long_pairs)
+
+    suite.append(
+        Benchmark(
+            "path_search_tiles",
+            lambda: service.search_tiles(*next(long_cycle[0])),
+            len(long_pairs),
+            reset_long_pairs,
+        )
+    )
+    suite.append(
+        Benchmark(
+            "path_search_junctions",
+            lambda: service.search_junctions(*next(long_cycle[0])),
+            len(long_pairs),
+            reset_long_pairs,
+        )
+    )
+
+    cells = [(x, y) for y in range(maze.height) for x in range(maze.width)]
+    cell_cycle = [None]
+
+    def reset_cells():
+        cell_cycle[0] = itertools.cycle(cells)
+
+    suite.append(
+        Benchmark(
+            "find_nearest_node",
+            lambda: find_nearest_node(maze.node_map, *next(cell_cycle[0])),
+            len(cells),
+            reset_cells,
+        )
+    )
+
+    # Zeichnen - Spiel mit Grafik in der Spielmitte
+    def warm_up_drawing():
+        with contextlib.redirect_stdout(io.StringIO()):
+            play_scenario(game, wander_script, WARMUP_FRAMES)
+        game.draw()
+
+    def full_draw():
+        game.last_drawn_state = None
+        game.draw()
+
+    draws = [
+        ("draw_game_full", full_draw),
+        ("draw_game_dirty", game.draw),
+        ("draw_maze", lambda: game.maze.draw(screen)),
+        ("draw_pellets", lambda: game.pellet_manager.draw(screen)),
+        ("draw_pacman", lambda: game.pacman.draw(screen)),
+    ]
+    draws += [
+        (f"draw_ghost_{ghost.name}", lambda ghost=ghost: ghost.draw(screen))
+        for ghost in game.ghosts
+    ]
+    draws += [
+        ("draw_ui", game.draw_ui),
+        ("draw_pause_screen", game.draw_pause_screen),
+        ("draw_game_over", game.draw_game_over),
+        ("draw_victory", game.draw_victory),
+        ("draw_menu", lambda: game.menu.draw(screen)),
+    ]
+    for name, func in draws:
+        # Sprites sind billig - mehr Aufrufe für stabile Zeiten
+        number = FPS * 20 if name.startswith(("draw_pacman", "draw_ghost")) else FPS
+        suite.append(Benchmark(name, func, number, warm_up_drawing))
+    return suite
+
+
+def run_suite(repeat=7, only=None):
+    """
+    Run the suite and return the result dict that is stored as baseline
+    only: optional list of name fragments, only matching benchmarks run
+    """
+    suite = [
+        benchmark
+        for benchmark in build_suite(make_screen())
+        if not only or any(part in benchmark.name for part in only)
+    ]
+    # Runden statt Wiederholungen am Stück: kurze Lastspitzen der Maschine
+    # treffen so nicht alle Wiederholungen eines Benchmarks
+    times = {benchmark.name: [] for benchmark in suite}
+    for _ in range(repeat):
+        for benchmark in suite:
+            with contextlib.redirect_stdout(io.StringIO()):
+                times[benchmark.name] += benchmark.measure(1)
+
+    results = {}
+    for benchmark in suite:
+        results[benchmark.name] = {
+            "best_ns": min(times[benchmark.name]),
+            "median_ns": statistics.median(times[benchmark.name]),
+            "number": benchmark.number,
+            "repeat": repeat,
+        }
+    return {
+        "version": BENCHMARK_VERSION,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def save_results(data, path):
+    """Write results as JSON (creates the folder if needed)"""
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+
+
+def load_results(path):
+    """Read results written by save_results"""
+    with open(path) as file:
+        data = json.load(file)
+    if data.get("version") != BENCHMARK_VERSION:
+        raise ValueError(f"Unsupported benchmark version: {data.get('version')}")
+    return data
+
+
+def get_spread(result):
+    """Relative spread of a benchmark: median / best - 1"""
+    return result["median_ns"] / result["best_ns"] - 1
+
+
+def compare_results(baseline, current, threshold=DEFAULT_THRESHOLD, only=None):
+    """
+    Compare the best times of both runs
+    Returns [(name, baseline ns, current ns, ratio, status)] with status
+    "ok", "regressed", "new" (not in the baseline) or "missing" (in the
+    baseline but not measured) - ns and ratio are None if a side is missing
+    only: name fragments the current run was limited to
+    """
+    rows = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append((name, None, result["best_ns"], None, "new"))
+            continue
+        ratio = result["best_ns"] / base["best_ns"]
+        noise = NOISE_FACTOR * max(get_spread(base), get_spread(result))
+        status = "regressed" if ratio > 1 + max(threshold, noise) else "ok"
+        rows.append((name, base["best_ns"], result["best_ns"], ratio, status))
+
+    for name, base in baseline["results"].items():
+        if name in current["results"]:
+            continue
+        if only and not any(part in name for part in only):
+            continue
+        rows.append((name, base["best_ns"], None, None, "missing"))
+    return rows
+
+
+def print_results(data):
+    """Table of the best and median time per call"""
+    for name, result in data["results"].items():
+        print(
+            f"{name:<26} {result['best_ns'] / 1000:10.2f} us  "
+            f"(median {result['median_ns'] / 1000:.2f} us)"
+        )
+
+
+def main(argv=None):
+    """Run the benchmark suite or compare it against a baseline"""
+    parser = argparse.ArgumentParser(description="Pac-Man benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the suite")
+    run_parser.add_argument("--out", metavar="FILE", help="save the results as JSON")
+
+    compare_parser = commands.add_parser(
+        "compare", help="fail if a benchmark regressed against the baseline"
+    )
+    compare_parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    compare_parser.add_argument(
+        "--current", metavar="FILE", help="stored results instead of a new run"
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="allowed slowdown as fraction (0.5 = 50%% slower)",
+    )
+    compare_parser.add_argument(
+        "--out", metavar="FILE", help="save the new results as JSON"
+    )
+
+    for sub_parser in (run_parser, compare_parser):
+        sub_parser.add_argument("--repeat", type=int, default=7)
+        sub_parser.add_argument(
+            "--only", nargs="+", metavar="NAME", help="run matching benchmarks only"
+        )
+    args = parser.parse_args(argv)
+
+    if args.command == "compare" and args.current:
+        current = load_results(args.current)
+    else:
+        current = run_suite(args.repeat, args.only)
+    if args.out:
+        save_results(current, args.out)
+
+    if args.command == "run":
+        print_results(current)
+        return 0
+
+    try:
+        baseline = load_results(args.baseline)
+    except FileNotFoundError:
+        print(
+            f"No baseline at {args.baseline} - create one on this machine with "
+            f"'python -m src.benchmark run --out {args.baseline}'"
+        )
+        return 1
+    rows = compare_results(baseline, current, args.threshold, args.only)
+    counts = {"ok": 0, "regressed": 0, "new": 0, "missing": 0}
+    for name, base_ns, current_ns, ratio, status in rows:
+        counts[status] += 1
+        if status == "new":
+            print(f"{name:<26} {'-':>10} -> {current_ns / 1000:10.2f} us  NEW")
+        elif status == "missing":
+            print(f"{name:<26} {base_ns / 1000:10.2f} -> {'-':>10}     MISSING")
+        else:
+            print(
+                f"{name:<26} {base_ns / 1000:10.2f} -> {current_ns / 1000:10.2f} us "
+                f"{(ratio - 1) * 100:+7.1f}%"
+                f"{'  REGRESSION' if status == 'regressed' else ''}"
+            )
+    print(
+        f"{counts['regressed']} of {counts['ok'] + counts['regressed']} benchmarks "
+        f"regressed (threshold {args.threshold:.0%}, at least {NOISE_FACTOR}x the "
+        f"spread), {counts['new']} not in the baseline, "
+        f"{counts['missing']} not measured"
+    )
+    return 1 if counts["regressed"] or counts["new"] or counts["missing"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
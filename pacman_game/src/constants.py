@@ -32,6 +32,7 @@ PLAYING = 1
 PAUSED = 2
 GAME_OVER = 3
 VICTORY = 4
+DYING = 5  # Todesanimation läuft, danach Reset oder Game Over
 
 # Directions
 UP = (0, -1)
@@ -43,6 +44,7 @@ STOP = (0, 0)
 # Game settings
 FPS = 60
 LIVES = 3
+DEATH_ANIMATION_FRAMES = 90  # 1.5 Sekunden bei 60 FPS
 
 # Geschwindigkeiten - angepasst für größeres Spielfeld
 # Original Pac-Man: 80 Pixel/Sekunde = 1.33 Pixel/Frame bei 60 FPS
@@ -0,0 +1,185 @@
+"""
+Distanz-Tabelle für das Maze
+Kürzeste Wege zwischen allen begehbaren Tiles (inklusive Tunnel),
+einmal mit NumPy berechnet und auf der Festplatte zwischengespeichert
+"""
+
+import hashlib
+import os
+import numpy as np
+from .nodes import graph_to_arrays, SLOT_UP, SLOT_DOWN, SLOT_LEFT, SLOT_RIGHT
+
+# Cache-Ordner neben dem src-Ordner (pacman_game/cache)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cache")
+
+UNREACHABLE = -1
+
+# Format der Tabellen-Dateien - bei jeder Änderung an Inhalt oder Aufbau der
+# gespeicherten Arrays erhöhen, alte Cache-Dateien werden dann nicht geladen
+TABLE_VERSION = 1
+
+# Reihenfolge der Nachbarn bei gleich langen Wegen: UP > LEFT > DOWN > RIGHT
+# (gleiche Priorität wie bei der Geister-KI)
+_DIRECTION_SLOTS = [SLOT_UP, SLOT_LEFT, SLOT_DOWN, SLOT_RIGHT]
+
+
+def layout_hash(maze):
+    """Eindeutiger Schlüssel für ein Layout (inklusive Tunnel-Parameter)"""
+    key = "\n".join(maze.layout_strings)
+    key += f"\n{maze.TUNNEL_ROW},{maze.LEFT_TUNNEL_X},{maze.RIGHT_TUNNEL_X}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def get_index_dtype(count):
+    """Kleinster Integer-Typ für Node-Indizes und Weglängen bei count Nodes"""
+    if count < 2**15:
+        return np.int16
+    if count < 2**31:
+        return np.int32
+    raise ValueError(f"Maze mit {count} Nodes ist zu groß für die Distanz-Tabelle")
+
+
+class DistanceTable:
+    """
+    All-Pairs-Tabelle über die Nodes des Maze
+    dist[a, b] ist die Anzahl Schritte von Node a nach Node b,
+    next_hop[a, b] der Index des ersten Nodes auf diesem Weg
+    """
+
+    def __init__(self, tile_index, tile_x, tile_y, dist, next_hop):
+        self.tile_index = tile_index  # (Höhe, Breite) -> Node-Index oder -1
+        self.tile_x = tile_x  # Node-Index -> Grid-X
+        self.tile_y = tile_y  # Node-Index -> Grid-Y
+        self.dist = dist
+        self.next_hop = next_hop
+
+    @classmethod
+    def build(cls, maze):
+        """Berechnet die Tabelle aus dem Node-Graphen des Maze (eine BFS pro Node)"""
+        nodes = maze.nodes
+        count = len(nodes)
+        dtype = get_index_dtype(count)
+
+        tile_index = np.full((maze.height, maze.width), -1, dtype=dtype)
+        tile_x = np.zeros(count, dtype=dtype)
+        tile_y = np.zeros(count, dtype=dtype)
+        for i, node in enumerate(nodes):
+            tile_index[node.grid_y, node.grid_x] = i
+            tile_x[i] = node.grid_x
+            tile_y[i] = node.grid_y
+
+        # Nachbarn pro Richtung inklusive Tunnel-Kanten aus dem Node-Graphen,
+        # Spalten in der Reihenfolge von _DIRECTION_SLOTS
+        neighbors = graph_to_arrays(nodes)["links"][:, _DIRECTION_SLOTS]
+
+        # Distanzen: der Graph ist ungewichtet, also eine BFS pro Start-Node
+        # (O(n * Kanten) statt O(n³) mit Floyd-Warshall)
+        adjacency = [[i for i in row if i >= 0] for row in neighbors.tolist()]
+        dist = np.full((count, count), UNREACHABLE, dtype=dtype)
+        for source in range(count):
+            row = [UNREACHABLE] * count
+            row[source] = 0
+            frontier = [source]
+            steps = 0
+            while frontier:
+                steps += 1
+                next_frontier = []
+                for index in frontier:
+                    for neighbor in adjacency[index]:
+                        if row[neighbor] < 0:
+                            row[neighbor] = steps
+                            next_frontier.append(neighbor)
+                frontier = next_frontier
+            dist[source] = row
+
+        # Nächster Schritt: Nachbar, der genau einen Schritt näher am Ziel liegt
+        next_hop = np.full((count, count), -1, dtype=dtype)
+        for slot in reversed(range(4)):
+            rows = np.nonzero(neighbors[:, slot] >= 0)[0]
+            targets = neighbors[rows, slot]
+            closer = (dist[targets, :] == dist[rows, :] - 1) & (dist[rows, :] > 0)
+            hop = next_hop[rows, :]
+            hop[closer] = np.broadcast_to(targets[:, None], closer.shape)[closer]
+            next_hop[rows, :] = hop
+        np.fill_diagonal(next_hop, np.arange(count, dtype=dtype))
+
+        return cls(tile_index, tile_x, tile_y, dist, next_hop)
+
+    @classmethod
+    def load_or_build(cls, maze, cache_dir=CACHE_DIR):
+        """Lädt die Tabelle aus dem Cache oder berechnet und speichert sie"""
+        path = os.path.join(
+            cache_dir, f"distances_v{TABLE_VERSION}_{layout_hash(maze)}.npz"
+        )
+        try:
+            with np.load(path) as data:
+                return cls(
+                    data["tile_index"],
+                    data["tile_x"],
+                    data["tile_y"],
+                    data["dist"],
+                    data["next_hop"],
+                )
+        except (OSError, KeyError, ValueError):
+            pass
+
+        table = cls.build(maze)
+        table.save(path)
+        return table
+
+    def save(self, path):
+        """Speichert die Tabelle (atomar, damit parallele Prozesse nichts zerstören)"""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as file:
+                np.savez(
+                    file,
+                    tile_index=self.tile_index,
+                    tile_x=self.tile_x,
+                    tile_y=self.tile_y,
+                    dist=self.dist,
+                    next_hop=self.next_hop,
+                )
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Konnte Distanz-Tabelle nicht speichern: {e}")
+
+    def index_of(self, x, y):
+        """Node-Index eines Tiles oder -1 (Wand / außerhalb)"""
+        height, width = self.tile_index.shape
+        if 0 <= x < width and 0 <= y < height:
+            return int(self.tile_index[y, x])
+        return -1
+
+    def distance(self, start, goal):
+        """Weglänge in Tiles zwischen zwei Positionen oder None"""
+        a = self.index_of(*start)
+        b = self.index_of(*goal)
+        if a < 0 or b < 0:
+            return None
+        steps = int(self.dist[a, b])
+        return None if steps == UNREACHABLE else steps
+
+    def next_step(self, start, goal):
+        """Erstes Tile auf dem kürzesten Weg von start nach goal oder None"""
+        a = self.index_of(*start)
+        b = self.index_of(*goal)
+        if a < 0 or b < 0:
+            return None
+        hop = int(self.next_hop[a, b])
+        if hop < 0:
+            return None
+        return (int(self.tile_x[hop]), int(self.tile_y[hop]))
+
+    def path(self, start, goal):
+        """Kompletter Weg von start nach goal (inklusive beider Enden) oder []"""
+        a = self.index_of(*start)
+        b = self.index_of(*goal)
+        if a < 0 or b < 0 or self.dist[a, b] == UNREACHABLE:
+            return []
+        path = [(int(self.tile_x[a]), int(self.tile_y[a]))]
+        while a != b:
+            a = int(self.next_hop[a, b])
+            path.append((int(self.tile_x[a]), int(self.tile_y[a])))
+        return path
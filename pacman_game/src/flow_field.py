@@ -0,0 +1,83 @@
+"""
+Flow Field
+Shared distance map toward Pac-Man: for every walkable tile the number of
+steps to Pac-Man (tunnel included) and the direction of the first step.
+Both are read from the column of Pac-Man's tile in the all-pairs distance
+table, so following Pac-Man to a new tile needs no search - ghosts, bots
+and analytics can then query it in O(1) as often as they like
+"""
+
+from .constants import UP, DOWN, LEFT, RIGHT, STOP
+from .nodes import SLOT_UP, SLOT_DOWN, SLOT_LEFT, SLOT_RIGHT
+
+SLOT_DIRECTIONS = {SLOT_UP: UP, SLOT_DOWN: DOWN, SLOT_LEFT: LEFT, SLOT_RIGHT: RIGHT}
+
+UNREACHABLE = -1
+
+
+class FlowField:
+    """
+    distances[node index]: steps from the node to the source tile
+    hops[node index]: index of the first node on the way to the source
+    source: the tile the field points at, None if it is not walkable
+    """
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.source = None
+        self.tile = None  # Zuletzt übergebenes Tile (auch Wand / Tunnel)
+        self.distances = [UNREACHABLE] * len(maze.nodes)
+        self.hops = [-1] * len(maze.nodes)
+        self.rebuilds = 0
+
+    def update(self, grid_x, grid_y):
+        """Point the field at (grid_x, grid_y) - only changes on a new tile"""
+        tile = (int(grid_x), int(grid_y))
+        if tile == self.tile:
+            return False
+        self.tile = tile
+
+        node = self.maze.node_map.get(tile)
+        if node is None:
+            # Wand oder außerhalb (Tunnel) - kein gültiges Feld
+            self.source = None
+            return True
+        self.source = tile
+        self.build(node)
+        return True
+
+    def build(self, source):
+        """
+        Take the field of the source node from the distance table - the graph
+        is undirected, so the column holds the steps from every node to it
+        """
+        self.rebuilds += 1
+        table = self.maze.get_distance_table()
+        self.distances = table.dist[:, source.index].tolist()
+        self.hops = table.next_hop[:, source.index].tolist()
+
+    def get_distance(self, grid_x, grid_y):
+        """Steps from (grid_x, grid_y) to the source or None"""
+        if self.source is None:
+            return None
+        node = self.maze.node_map.get((grid_x, grid_y))
+        if node is None:
+            return None
+        steps = self.distances[node.index]
+        return None if steps == UNREACHABLE else steps
+
+    def get_direction(self, grid_x, grid_y):
+        """Direction of the first step toward the source (STOP there) or None"""
+        if self.source is None:
+            return None
+        node = self.maze.node_map.get((grid_x, grid_y))
+        if node is None or self.distances[node.index] == UNREACHABLE:
+            return None
+        hop = self.hops[node.index]
+        if hop == node.index:
+            return STOP
+        # Bei gleich langen Wegen wählt die Tabelle UP > LEFT > DOWN > RIGHT
+        for slot, neighbor in enumerate(node.links):
+            if neighbor is not None and neighbor.index == hop:
+                return SLOT_DIRECTIONS[slot]
+        return None
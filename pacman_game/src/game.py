@@ -6,12 +6,18 @@ School Project - Pac-Man Clone
 
 import pygame
 import os
+import random
 from .constants import *
 from .player import Pacman
 from .ghost import Ghost
+from .ghost_squad import GhostSquad
 from .maze import Maze
 from .pellets import PelletManager
 from .menu import Menu
+from .overlay_cache import overlay_cache
+from .profiler import FrameProfiler
+from .replay import ReplayRecorder
+from .game_loop import TIME_SCALES, format_time_scale
 
 
 class MusicManager:
@@ -20,7 +26,8 @@ class MusicManager:
     Handles loading, playing, pausing and volume control
     """
 
-    def __init__(self):
+    def __init__(self, enabled=True):
+        self.enabled = enabled  # False im Headless-Modus (kein Mixer)
         self.music_loaded = False
         self.music_playing = False
         self.music_volume = 1.0  # Reduziert von 0.5 auf 0.3
@@ -33,6 +40,8 @@ class MusicManager:
 
     def load_background_music(self, music_file=None):
         """Load background music from file"""
+        if not self.enabled:
+            return
         try:
             if music_file is None:
                 music_file = self.music_files["background"]
@@ -63,24 +72,30 @@ class MusicManager:
 
     def stop_background_music(self):
         """Stop background music completely"""
+        if not self.enabled:
+            return
         pygame.mixer.music.stop()
         self.music_playing = False
         print("Background music stopped")
 
     def pause_background_music(self):
         """Pause background music (can be resumed)"""
-        if self.music_playing:
+        if self.enabled and self.music_playing:
             pygame.mixer.music.pause()
             print("Background music paused")
 
     def unpause_background_music(self):
         """Resume paused background music"""
+        if not self.enabled:
+            return
         pygame.mixer.music.unpause()
         print("Background music resumed")
 
     def set_volume(self, volume):
         """Set music volume (0.0 to 1.0)"""
         self.music_volume = max(0.0, min(1.0, volume))
+        if not self.enabled:
+            return
         pygame.mixer.music.set_volume(
             self.music_volume * 0.15
         )  # Nur 15% der Lautstärke
@@ -103,6 +118,8 @@ class MusicManager:
 
     def is_playing(self):
         """Check if music is currently playing"""
+        if not self.enabled:
+            return False
         return pygame.mixer.music.get_busy()
 
 
@@ -112,12 +129,36 @@ class Game:
     Handles all game logic, rendering, and state transitions
     """
 
-    def __init__(self, screen):
+    def __init__(self, screen, headless=False, profile=False, seed=None):
         self.screen = screen
+        # Headless: keine Grafik, kein Sound, keine Assets (z.B. für KI-Auswertung)
+        self.headless = headless
+        # Schneller Vorlauf: keine Pausen wie die Todesanimation (headless immer)
+        self.fast_forward = False
+        # Spielsekunden pro echter Sekunde (F5 langsamer, F6 schneller)
+        self.time_scale = 1.0
         self.state = MENU
         self.score = 0
         self.lives = 3
 
+        # Zufall: ein geseedetes random.Random pro Spiel für Geister, Pellets und
+        # Menü. Mit festem seed startet jedes Spiel gleich (Benchmarks, Replays),
+        # sonst bekommt jedes Spiel einen neuen zufälligen Seed
+        self.seed = seed
+        self.game_seed = seed
+        self.rng = random.Random(seed)
+
+        # Logische Frames des laufenden Spiels und Aufzeichnung der Eingaben
+        self.frame = 0
+        self.replay = None
+
+        # Frames, die die Todesanimation noch läuft (Zustand DYING)
+        self.death_timer = 0
+
+        # Positionen vor dem letzten Update - draw() interpoliert zwischen
+        # ihnen und den aktuellen, wenn öfter gezeichnet als simuliert wird
+        self.previous_positions = None
+
         # Sound system initialization
         self.sound_enabled = True
         self.sound_loaded = False
@@ -131,29 +172,55 @@ class Game:
         self.wakawaka_interval = 200  # Milliseconds between sounds
 
         # Initialize music manager
-        self.music_manager = MusicManager()
+        self.music_manager = MusicManager(enabled=not headless)
 
         # Load sound effects
-        self.load_sounds()
+        if not headless:
+            self.load_sounds()
 
         # Initialize game components
-        self.maze = Maze()
-        self.pacman = Pacman(11, 15)  # Starting position optimized for gameplay
-        self.pellet_manager = PelletManager(self.maze)
-        self.menu = Menu()
+        load_assets = not headless
+        self.maze = Maze(load_assets=load_assets)
+        # Starting position optimized for gameplay
+        self.pacman = Pacman(11, 15, load_assets=load_assets)
+        self.pellet_manager = PelletManager(self.maze, rng=self.rng)
+        self.menu = Menu(load_assets=load_assets, rng=self.rng)
 
         # Initialize ghosts with classic names at center position
         ghost_start_x = self.maze.width // 2
         ghost_start_y = self.maze.height // 2
         self.ghosts = [
-            Ghost(ghost_start_x, ghost_start_y, RED, "blinky"),
-            Ghost(ghost_start_x, ghost_start_y, PINK, "pinky"),
-            Ghost(ghost_start_x, ghost_start_y, CYAN, "inky"),
-            Ghost(ghost_start_x, ghost_start_y, ORANGE, "clyde"),
+            Ghost(ghost_start_x, ghost_start_y, RED, "blinky", load_assets, self.rng),
+            Ghost(ghost_start_x, ghost_start_y, PINK, "pinky", load_assets, self.rng),
+            Ghost(ghost_start_x, ghost_start_y, CYAN, "inky", load_assets, self.rng),
+            Ghost(ghost_start_x, ghost_start_y, ORANGE, "clyde", load_assets, self.rng),
         ]
+        # Geister-KI aller Geister in einem Durchgang
+        self.ghost_squad = GhostSquad(self.ghosts)
 
         # Font for UI elements
-        self.font = pygame.font.Font(None, 36)
+        self.font = None if headless else pygame.font.Font(None, 36)
+
+        # Dirty-rect rendering: only changed screen areas are redrawn and
+        # pushed to the display while PLAYING (None = full flip needed)
+        self.use_dirty_rects = True
+        self.dirty_rects = None
+        self.last_drawn_state = None
+        self.previous_sprite_rects = []
+        self.hud_state = None
+
+        # Cached HUD surface, rebuilt only when get_hud_state() changes
+        self.hud_fonts = None
+        self.hud_surface = None
+        self.hud_key = None
+        if not headless:
+            self.get_hud_fonts()
+
+        # Optional frame profiler (F3 shows the graph, F4 exports a CSV)
+        self.profiler = None
+        if profile:
+            self.profiler = FrameProfiler()
+            self.profiler.instrument(self, draw=not headless)
 
     def load_sounds(self):
         """Load all game sound effects"""
@@ -229,6 +296,25 @@ class Game:
         Handle all input events based on current game state
         Returns False if game should quit, True otherwise
         """
+        if self.profiler and event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_F3:
+                self.profiler.toggle_overlay()
+                # Full redraw so the area below the graph is restored
+                self.last_drawn_state = None
+                return True
+            elif event.key == pygame.K_F4:
+                self.profiler.export("profile.csv")
+                print("Profile exported to profile.csv")
+                return True
+
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_F5, pygame.K_F6):
+            # Zeitlupe / Zeitraffer in Stufen
+            index = TIME_SCALES.index(self.time_scale)
+            step = -1 if event.key == pygame.K_F5 else 1
+            index = min(max(index + step, 0), len(TIME_SCALES) - 1)
+            self.set_time_scale(TIME_SCALES[index])
+            return True
+
         if self.state == MENU:
             # Forward events to menu system
             menu_result = self.menu.handle_event(event)
@@ -264,13 +350,13 @@ class Game:
                     self.music_manager.set_volume(current_vol + 0.1)
                 # Movement controls - WASD or arrow keys
                 elif event.key == pygame.K_w or event.key == pygame.K_UP:
-                    self.pacman.set_direction(UP)
+                    self.set_pacman_direction(UP)
                 elif event.key == pygame.K_s or event.key == pygame.K_DOWN:
-                    self.pacman.set_direction(DOWN)
+                    self.set_pacman_direction(DOWN)
                 elif event.key == pygame.K_a or event.key == pygame.K_LEFT:
-                    self.pacman.set_direction(LEFT)
+                    self.set_pacman_direction(LEFT)
                 elif event.key == pygame.K_d or event.key == pygame.K_RIGHT:
-                    self.pacman.set_direction(RIGHT)
+                    self.set_pacman_direction(RIGHT)
 
         elif self.state == PAUSED:
             if event.type == pygame.KEYDOWN:
@@ -313,12 +399,40 @@ class Game:
 
         return True
 
-    def start_game(self):
+    def set_time_scale(self, time_scale):
+        """
+        Game seconds per real second (e.g. 4.0, 0.25 or UNLIMITED)
+        Above real time the game counts as fast-forward (no death pause)
+        """
+        if time_scale not in TIME_SCALES:
+            time_scale = min(TIME_SCALES, key=lambda scale: abs(scale - time_scale))
+        self.time_scale = time_scale
+        self.fast_forward = time_scale > 1
+
+    def get_time_scale(self):
+        """Time scale for the game loop - menus and screens run in real time"""
+        return self.time_scale if self.state in (PLAYING, DYING) else 1.0
+
+    def set_pacman_direction(self, direction):
+        """Steer Pac-Man and record the input for the replay"""
+        self.pacman.set_direction(direction)
+        if self.replay is not None:
+            self.replay.record(self.frame, direction)
+
+    def start_game(self, seed=None):
         """Initialize a new game with fresh state"""
         self.state = PLAYING
         self.score = 0
         self.lives = 3
 
+        # Seed für dieses Spiel - alles Zufällige hängt nur noch davon ab
+        if seed is None:
+            seed = self.seed if self.seed is not None else random.randrange(2**32)
+        self.game_seed = seed
+        self.rng.seed(seed)
+        self.frame = 0
+        self.replay = ReplayRecorder(seed)
+
         # Reset Pac-Man to starting position (top-left corner)
         self.pacman.reset(1, 1)
 
@@ -353,12 +467,15 @@ class Game:
                 self.start_game()
 
         if self.state == PLAYING:
+            self.frame += 1
+            if not self.headless:
+                self.remember_positions()
+
             # Update Pac-Man movement and animation
             self.pacman.update(self.maze)
 
-            # Update all ghosts with AI
-            for ghost in self.ghosts:
-                ghost.update(self.maze, self.pacman, self.ghosts)
+            # Update all ghosts with AI (targets from one snapshot, then moves)
+            self.ghost_squad.update(self.maze, self.pacman)
 
             # Update pellet animations
             self.pellet_manager.update()
@@ -390,65 +507,165 @@ class Game:
                 self.pacman.set_eating(False)
 
             # Check ghost collisions
-            for ghost in self.ghosts:
-                if self.pacman.collides_with(ghost):
-                    if ghost.mode == FRIGHTENED:
-                        # Eat the ghost
-                        ghost.mode = EATEN
-                        self.score += 200
-                        self.play_eat_ghost_sound()
-                    elif ghost.mode != EATEN:  # Eaten ghosts can't kill
-                        # Pac-Man dies
-                        self.lives -= 1
-
-                        # Play death sound
-                        self.play_death_sound()
-
-                        # Pause for death animation
-                        pygame.time.wait(1500)  # 1.5 second pause
-
-                        if self.lives <= 0:
-                            self.state = GAME_OVER
-                            self.music_manager.stop_background_music()
-                        else:
-                            # Reset level - positions reset but pellets remain eaten
-                            self.reset_after_death()
+            self.check_ghost_collisions()
 
             # Check victory condition
             if self.pellet_manager.all_collected():
+                if self.state == DYING:
+                    self.finish_dying()
                 self.state = VICTORY
                 self.music_manager.stop_background_music()
 
-    def draw(self):
+            # State-Digest für das Replay (Desync-Erkennung) - beim Tod erst nach
+            # der Animation, damit er dem Digest ohne Animation entspricht
+            if self.replay is not None and self.state != DYING:
+                self.replay.record_state(self)
+
+        elif self.state == DYING:
+            # Spiel steht, Event-Loop, Zeichnen und Musik laufen weiter
+            self.death_timer -= 1
+            if self.death_timer <= 0:
+                self.finish_dying()
+                if self.replay is not None:
+                    self.replay.record_state(self)
+
+    def check_ghost_collisions(self):
+        """Eat frightened ghosts or lose a life when Pac-Man touches a ghost"""
+        for ghost in self.ghosts:
+            if self.pacman.collides_with(ghost):
+                if ghost.mode == FRIGHTENED:
+                    # Eat the ghost
+                    ghost.mode = EATEN
+                    self.score += 200
+                    self.play_eat_ghost_sound()
+                elif ghost.mode != EATEN:  # Eaten ghosts can't kill
+                    # Pac-Man dies
+                    self.lives -= 1
+
+                    # Play death sound
+                    self.play_death_sound()
+
+                    self.start_dying()
+                    if self.state == DYING and self.lives > 0:
+                        # Pac-Man wird erst nach der Animation zurückgesetzt, bis
+                        # dahin erwischt ihn kein weiterer Geist (wie beim Reset)
+                        break
+
+    def start_dying(self):
+        """
+        Start the death animation (state DYING, counted in frames)
+        Headless and in fast-forward there is no pause, the death is resolved
+        immediately
+        """
+        if self.headless or self.fast_forward:
+            self.finish_dying()
+            return
+        self.state = DYING
+        self.death_timer = DEATH_ANIMATION_FRAMES
+
+    def finish_dying(self):
+        """End of the death animation: game over or reset for the next life"""
+        self.death_timer = 0
+        if self.lives <= 0:
+            self.state = GAME_OVER
+            self.music_manager.stop_background_music()
+        else:
+            self.state = PLAYING
+            # Reset level - positions reset but pellets remain eaten
+            self.reset_after_death()
+
+    def remember_positions(self):
+        """Store the sprite positions before an update (start of interpolation)"""
+        self.previous_positions = [(self.pacman.x, self.pacman.y)]
+        for ghost in self.ghosts:
+            self.previous_positions.append((ghost.x, ghost.y))
+
+    def interpolate_positions(self, alpha):
+        """
+        Move Pac-Man and the ghosts to the point `alpha` of the way from their
+        previous to their current position, returns the values to restore
+        """
+        if alpha >= 1.0 or self.state != PLAYING or self.previous_positions is None:
+            return []
+        saved = []
+        sprites = [self.pacman] + self.ghosts
+        for sprite, (previous_x, previous_y) in zip(sprites, self.previous_positions):
+            dx = sprite.x - previous_x
+            dy = sprite.y - previous_y
+            # Tunnel und Reset springen - dort nicht über den Bildschirm gleiten
+            if abs(dx) > GRID_SIZE or abs(dy) > GRID_SIZE:
+                continue
+            saved.append((sprite, sprite.x, sprite.y))
+            sprite.x = previous_x + dx * alpha
+            sprite.y = previous_y + dy * alpha
+        return saved
+
+    def restore_positions(self, saved):
+        """Undo interpolate_positions (the simulation never sees the values)"""
+        for sprite, x, y in saved:
+            sprite.x = x
+            sprite.y = y
+
+    def draw(self, alpha=1.0):
         """
         Main rendering function
+        alpha: fraction of the next update that has already elapsed, sprites are
+        drawn interpolated between their last two positions (1.0 = current)
+        """
+        saved = self.interpolate_positions(alpha)
+        try:
+            self.draw_scene()
+        finally:
+            self.restore_positions(saved)
+
+    def draw_scene(self):
+        """
         Draws all game elements based on current state
         """
+        # While playing only the changed areas are redrawn
+        if (
+            self.use_dirty_rects
+            and self.state == PLAYING
+            and self.last_drawn_state == PLAYING
+        ):
+            self.draw_playing_dirty()
+            self.draw_profiler_overlay()
+            return
+
+        self.dirty_rects = None
+        self.last_drawn_state = self.state
         self.screen.fill(BLACK)
 
         if self.state == MENU:
             self.menu.draw(self.screen)
 
-        elif self.state in [PLAYING, PAUSED]:
-            # Draw game elements
-            self.maze.draw(self.screen)
+        elif self.state in [PLAYING, PAUSED, DYING]:
+            # Draw maze and all pellets (cached layer + animated pellets)
+            self.pellet_manager.draw(self.screen)
 
             # Debug: Show nodes (set to True for debugging pathfinding)
             self.maze.draw_nodes(self.screen, show_nodes=False)
 
-            # Draw all pellets
-            self.pellet_manager.draw(self.screen)
-
-            # Draw Pac-Man
-            self.pacman.draw(self.screen)
+            if self.state == DYING:
+                # Nur die Todesanimation, die Geister sind verschwunden
+                progress = 1 - self.death_timer / DEATH_ANIMATION_FRAMES
+                self.pacman.draw_dying(self.screen, progress)
+            else:
+                # Draw Pac-Man
+                self.pacman.draw(self.screen)
 
-            # Draw all ghosts
-            for ghost in self.ghosts:
-                ghost.draw(self.screen)
+                # Draw all ghosts
+                for ghost in self.ghosts:
+                    ghost.draw(self.screen)
 
             # Draw UI elements
             self.draw_ui()
 
+            # Remember what is on screen for the next dirty-rect frame
+            self.previous_sprite_rects = self.get_sprite_rects()
+            self.pellet_manager.pop_changed_rects()
+            self.hud_state = self.get_hud_state()
+
             if self.state == PAUSED:
                 self.draw_pause_screen()
 
@@ -458,24 +675,106 @@ class Game:
         elif self.state == VICTORY:
             self.draw_victory()
 
+        self.draw_profiler_overlay()
+
+    def draw_playing_dirty(self):
+        """
+        Redraw only what changed since the last frame: the areas Pac-Man,
+        the ghosts and the animated pellets covered before and cover now,
+        eaten pellets and the HUD if score, lives or music state changed
+        """
+        sprite_rects = self.get_sprite_rects()
+        game_area = pygame.Rect(0, 0, SCREEN_WIDTH, GAME_AREA_HEIGHT)
+
+        changed_rects = self.previous_sprite_rects + sprite_rects
+        changed_rects += self.pellet_manager.pop_changed_rects()
+        if self.profiler and self.profiler.overlay_visible:
+            changed_rects.append(self.profiler.get_overlay_rect())
+
+        dirty = []
+        for rect in changed_rects:
+            rect = rect.clip(game_area)
+            if rect.width > 0 and rect.height > 0:
+                dirty.append(rect)
+
+        # Restore background and pellets below all dirty areas first
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self.pellet_manager.draw_region(self.screen, rect)
+        self.screen.set_clip(None)
+
+        # Then draw the moving sprites on top
+        self.pacman.draw(self.screen)
+        for ghost in self.ghosts:
+            ghost.draw(self.screen)
+
+        hud_state = self.get_hud_state()
+        if hud_state != self.hud_state:
+            self.draw_ui()
+            dirty.append(pygame.Rect(0, GAME_AREA_HEIGHT, SCREEN_WIDTH, 60))
+            self.hud_state = hud_state
+
+        self.previous_sprite_rects = sprite_rects
+        self.dirty_rects = dirty
+
+    def draw_profiler_overlay(self):
+        """Draw the profiler graph on top of everything (if switched on)"""
+        if self.profiler and self.profiler.overlay_visible:
+            self.profiler.draw_overlay(self.screen)
+
+    def get_sprite_rects(self):
+        """Screen areas of everything that moves or animates while playing"""
+        rects = [self.pacman.get_draw_rect()]
+        for ghost in self.ghosts:
+            rects.append(ghost.get_draw_rect())
+        for pellet in self.pellet_manager.get_special_pellets():
+            rects.append(pellet.get_draw_rect())
+        return rects
+
+    def get_hud_state(self):
+        """Everything the HUD depends on (redrawn when this changes)"""
+        return (
+            self.score,
+            self.lives,
+            self.music_manager.music_playing,
+            self.time_scale,
+        )
+
+    def get_dirty_rects(self):
+        """Rects changed by the last draw() or None if the whole screen changed"""
+        return self.dirty_rects
+
     def draw_ui(self):
         """
         Draw the user interface elements
         Includes score, lives, legend, and music status
         """
-        # UI area starts after the game field
-        ui_y_start = GAME_AREA_HEIGHT + 5
+        # Cached HUD - only rebuilt when score, lives or music state change
+        hud_key = self.get_hud_state()
+        if self.hud_surface is None or hud_key != self.hud_key:
+            self.hud_surface = self.build_hud_surface()
+            self.hud_key = hud_key
+        self.screen.blit(self.hud_surface, (0, GAME_AREA_HEIGHT))
+
+    def build_hud_surface(self):
+        """Render the complete HUD (area below the game field) into a surface"""
+        hud = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT - GAME_AREA_HEIGHT))
+        if pygame.display.get_surface() is not None:
+            hud = hud.convert()
+        fonts = self.get_hud_fonts()
+
+        # UI area starts at the top of the HUD surface
+        ui_y_start = 5
 
         # Background for UI area
-        ui_rect = pygame.Rect(0, GAME_AREA_HEIGHT, SCREEN_WIDTH, 60)
-        pygame.draw.rect(self.screen, (10, 10, 30), ui_rect)
-        pygame.draw.rect(self.screen, (50, 50, 100), ui_rect, 3)
+        ui_rect = hud.get_rect()
+        pygame.draw.rect(hud, (10, 10, 30), ui_rect)
+        pygame.draw.rect(hud, (50, 50, 100), ui_rect, 3)
 
         # Score - Centered at top
-        score_font = pygame.font.Font(None, 32)
-        score_text = score_font.render(f"SCORE: {self.score}", True, WHITE)
+        score_text = fonts["score"].render(f"SCORE: {self.score}", True, WHITE)
         score_rect = score_text.get_rect(centerx=SCREEN_WIDTH // 2, y=ui_y_start + 5)
-        self.screen.blit(score_text, score_rect)
+        hud.blit(score_text, score_rect)
 
         # Lives - Top right as hearts or Pac-Man symbols
         lives_x_start = SCREEN_WIDTH - 100
@@ -485,10 +784,10 @@ class Game:
         for i in range(self.lives):
             heart_x = lives_x_start + (i * 25)
             # Simple heart shape using circles and triangle
-            pygame.draw.circle(self.screen, RED, (heart_x - 4, lives_y), 5)
-            pygame.draw.circle(self.screen, RED, (heart_x + 4, lives_y), 5)
+            pygame.draw.circle(hud, RED, (heart_x - 4, lives_y), 5)
+            pygame.draw.circle(hud, RED, (heart_x + 4, lives_y), 5)
             pygame.draw.polygon(
-                self.screen,
+                hud,
                 RED,
                 [
                     (heart_x - 8, lives_y + 2),
@@ -497,53 +796,61 @@ class Game:
                 ],
             )
 
+        # Zeitraffer / Zeitlupe - Top left, only when not in real time
+        if self.time_scale != 1.0:
+            label = f"SPEED {format_time_scale(self.time_scale)}"
+            scale_text = fonts["legend"].render(label, True, YELLOW)
+            hud.blit(scale_text, (10, ui_y_start + 8))
+
         # Legend - Bottom area
-        legend_font = pygame.font.Font(None, 20)
+        legend_font = fonts["legend"]
         legend_y = ui_y_start + 35
 
         # Power pellet legend (pink/white circle)
-        pygame.draw.circle(self.screen, (255, 184, 255), (20, legend_y + 5), 6)
-        pygame.draw.circle(self.screen, (255, 220, 255), (20, legend_y + 5), 7, 1)
+        pygame.draw.circle(hud, (255, 184, 255), (20, legend_y + 5), 6)
+        pygame.draw.circle(hud, (255, 220, 255), (20, legend_y + 5), 7, 1)
         power_text = legend_font.render("= Power Up", True, WHITE)
-        self.screen.blit(power_text, (30, legend_y))
+        hud.blit(power_text, (30, legend_y))
 
         # Speed pellet legend (cyan circle)
-        pygame.draw.circle(self.screen, CYAN, (150, legend_y + 5), 6)
+        pygame.draw.circle(hud, CYAN, (150, legend_y + 5), 6)
         # Speed effect rings
-        pygame.draw.circle(self.screen, (150, 255, 255), (150, legend_y + 5), 8, 1)
+        pygame.draw.circle(hud, (150, 255, 255), (150, legend_y + 5), 8, 1)
         speed_text = legend_font.render("= Speed Boost", True, WHITE)
-        self.screen.blit(speed_text, (160, legend_y))
+        hud.blit(speed_text, (160, legend_y))
 
         # Dot legend
-        pygame.draw.circle(self.screen, YELLOW, (300, legend_y + 5), 2)
+        pygame.draw.circle(hud, YELLOW, (300, legend_y + 5), 2)
         dot_text = legend_font.render("= 10 pts", True, WHITE)
-        self.screen.blit(dot_text, (310, legend_y))
+        hud.blit(dot_text, (310, legend_y))
 
         # Music status - Bottom right corner
-        music_font = pygame.font.Font(None, 18)
         music_color = GREEN if self.music_manager.music_playing else RED
-        music_text = music_font.render("Press M for Mute", True, music_color)
+        music_text = fonts["music"].render("Press M for Mute", True, music_color)
         music_rect = music_text.get_rect(
-            right=SCREEN_WIDTH - 10, bottom=SCREEN_HEIGHT - 5
+            right=SCREEN_WIDTH - 10, bottom=ui_rect.height - 5
         )
-        self.screen.blit(music_text, music_rect)
+        hud.blit(music_text, music_rect)
+
+        return hud
+
+    def get_hud_fonts(self):
+        """Load the HUD fonts once"""
+        if self.hud_fonts is None:
+            self.hud_fonts = {
+                "score": pygame.font.Font(None, 32),
+                "legend": pygame.font.Font(None, 20),
+                "music": pygame.font.Font(None, 18),
+            }
+        return self.hud_fonts
 
     def draw_pause_screen(self):
         """Draw pause overlay with instructions"""
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
+        overlay = overlay_cache.get_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), 128)
         self.screen.blit(overlay, (0, 0))
 
-        pause_text = self.font.render("PAUSED", True, WHITE)
-        text_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(pause_text, text_rect)
-
-        resume_text = self.font.render("Press ESC to resume", True, WHITE)
-        resume_rect = resume_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40)
-        )
-        self.screen.blit(resume_text, resume_rect)
+        self.draw_centered_text("PAUSED", WHITE, 0)
+        self.draw_centered_text("Press ESC to resume", WHITE, 40)
 
     def draw_game_over(self):
         """Draw game over screen with menu background"""
@@ -551,27 +858,13 @@ class Game:
         self.menu.draw(self.screen)
 
         # Dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
+        overlay = overlay_cache.get_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), 180)
         self.screen.blit(overlay, (0, 0))
 
         # Game over text
-        game_over_text = self.font.render("GAME OVER", True, RED)
-        text_rect = game_over_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)
-        )
-        self.screen.blit(game_over_text, text_rect)
-
-        score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(score_text, score_rect)
-
-        restart_text = self.font.render("Press SPACE or Q for menu", True, WHITE)
-        restart_rect = restart_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40)
-        )
-        self.screen.blit(restart_text, restart_rect)
+        self.draw_centered_text("GAME OVER", RED, -40)
+        self.draw_centered_text(f"Final Score: {self.score}", WHITE, 0)
+        self.draw_centered_text("Press SPACE or Q for menu", WHITE, 40)
 
     def draw_victory(self):
         """Draw victory screen with menu background"""
@@ -579,28 +872,20 @@ class Game:
         self.menu.draw(self.screen)
 
         # Dark overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
+        overlay = overlay_cache.get_overlay((SCREEN_WIDTH, SCREEN_HEIGHT), 180)
         self.screen.blit(overlay, (0, 0))
 
-        victory_text = self.font.render("VICTORY!", True, GREEN)
-        text_rect = victory_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40)
-        )
-        self.screen.blit(victory_text, text_rect)
-
-        score_text = self.font.render(f"Final Score: {self.score}", True, WHITE)
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-        self.screen.blit(score_text, score_rect)
+        self.draw_centered_text("VICTORY!", GREEN, -40)
+        self.draw_centered_text(f"Final Score: {self.score}", WHITE, 0)
+        self.draw_centered_text("Press SPACE to play again or Q for menu", WHITE, 40)
 
-        restart_text = self.font.render(
-            "Press SPACE to play again or Q for menu", True, WHITE
-        )
-        restart_rect = restart_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40)
+    def draw_centered_text(self, text, color, offset_y):
+        """Draw a cached text centered on screen, offset_y pixels below the middle"""
+        text_surface = overlay_cache.render_text(self.font, text, color)
+        text_rect = text_surface.get_rect(
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + offset_y)
         )
-        self.screen.blit(restart_text, restart_rect)
+        self.screen.blit(text_surface, text_rect)
 
     def reset_after_death(self):
         """
@@ -0,0 +1,73 @@
+"""
+Game Loop
+Fixed timestep: the simulation always advances in steps of 1 / FPS seconds,
+rendering runs as often as the display allows and interpolates in between
+"""
+
+import time
+from .constants import FPS
+
+# Frame-Skip: höchstens so viele Updates vor dem nächsten gezeichneten Frame,
+# danach wird der Rückstand verworfen (das Spiel läuft dann langsamer statt
+# immer weiter hinterherzulaufen)
+MAX_UPDATES_PER_FRAME = 5
+# Längere Aussetzer (Fenster verschoben, Debugger) zählen höchstens so lange
+MAX_FRAME_TIME = 0.25
+
+# Zeitraffer / Zeitlupe: Spielsekunden pro echter Sekunde. Die Geschwindigkeiten
+# und Timer bleiben pro Update, es laufen nur mehr oder weniger Updates
+UNLIMITED = float("inf")
+TIME_SCALES = [0.25, 0.5, 1.0, 2.0, 4.0, 16.0, UNLIMITED]
+# Unbegrenzt: so viele Updates, wie in diese Rechenzeit pro Frame passen
+UNLIMITED_BUDGET = 1 / 30
+
+
+def format_time_scale(time_scale):
+    """Short label like x4, x0.25 or max"""
+    if time_scale == UNLIMITED:
+        return "max"
+    return f"x{time_scale:g}"
+
+
+class FixedStepLoop:
+    """
+    Accumulator for a fixed simulation rate
+    advance() converts elapsed wall time into the number of updates due,
+    get_alpha() the fraction of the next update that has already elapsed
+    """
+
+    def __init__(self, step=1 / FPS, max_updates=MAX_UPDATES_PER_FRAME):
+        self.step = step
+        self.max_updates = max_updates
+        self.accumulator = 0.0
+        self.dropped_time = 0.0  # Verworfene Zeit in Sekunden (Frame-Skip)
+
+    def advance(self, elapsed, time_scale=1.0):
+        """Add elapsed seconds and return how many updates to run now"""
+        self.accumulator += min(elapsed, MAX_FRAME_TIME) * time_scale
+        updates = int(self.accumulator / self.step)
+        self.accumulator -= updates * self.step
+        # Im Zeitraffer entsprechend mehr Updates pro Frame erlauben
+        max_updates = self.max_updates * max(1, int(time_scale))
+        if updates > max_updates:
+            self.dropped_time += (updates - max_updates) * self.step
+            updates = max_updates
+        return updates
+
+    def updates(self, elapsed, time_scale=1.0):
+        """
+        Yield once per update that is due - with UNLIMITED as often as fits
+        into UNLIMITED_BUDGET, the frames in between are never drawn
+        """
+        if time_scale == UNLIMITED:
+            self.accumulator = 0.0
+            deadline = time.perf_counter() + UNLIMITED_BUDGET
+            while time.perf_counter() < deadline:
+                yield
+            return
+        for _ in range(self.advance(elapsed, time_scale)):
+            yield
+
+    def get_alpha(self):
+        """Interpolation factor between the last two updates (0..1)"""
+        return min(self.accumulator / self.step, 1.0)
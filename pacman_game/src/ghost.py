@@ -5,12 +5,186 @@ Handles ghost AI, movement, and behavior patterns
 
 import pygame
 import random
-import math
 from .constants import *
+from .maze import EXIT_UP, EXIT_DOWN, EXIT_LEFT, EXIT_RIGHT
+
+# Sprite-Atlas aus den Tilesets in assets/images/maze
+GHOST_SPRITE_PATH = "assets/images/maze/Teil_017_{}.png"
+GHOST_TILESETS = {
+    "blinky": "Blinky_tileset",
+    "pinky": "Pinky_tileset",
+    "inky": "Inky_tileset",
+    "clyde": "Clyde_tileset",
+}
+GHOST_COLORS = {"blinky": RED, "pinky": PINK, "inky": CYAN, "clyde": ORANGE}
+# Reihenfolge der Richtungen in den Tilesets (je 2 Animationsframes)
+TILESET_DIRECTIONS = [RIGHT, LEFT, UP, DOWN]
+# Tileset-Frames sind 48x42 Pixel, der Geister-Körper 42 Pixel hoch
+TILESET_FRAME_WIDTH = 48
+GHOST_SPRITE_HEIGHT = GRID_SIZE
+GHOST_SPRITE_SCALE = GHOST_SPRITE_HEIGHT / 42
+
+# Verhaltens-Tabellen (auch von der Batch-Simulation in batch.py genutzt)
+# Feste Ecke jedes Geistes im Scatter-Modus
+SCATTER_CORNERS = {
+    "blinky": (MAZE_WIDTH - 2, 0),  # Top-right
+    "pinky": (2, 0),  # Top-left
+    "inky": (MAZE_WIDTH - 1, MAZE_HEIGHT - 1),  # Bottom-right
+    "clyde": (0, MAZE_HEIGHT - 1),  # Bottom-left
+}
+# Frames bis zum Verlassen des Geisterhauses
+HOUSE_EXIT_TIMERS = {
+    "blinky": 0,  # Sofort (ist schon draußen)
+    "pinky": 60,  # 1 Sekunde
+    "inky": 180,  # 3 Sekunden
+    "clyde": 300,  # 5 Sekunden
+}
+# Pinky zielt 4 Tiles vor Pac-Man - berühmter "Bug": bei UP 4 hoch und 4 links
+PINKY_OFFSETS = {
+    "up": (-4, -4),
+    "down": (0, 4),
+    "left": (-4, 0),
+    "right": (4, 0),
+    None: (0, 0),
+}
+# Inky nimmt den Punkt 2 Tiles vor Pac-Man - gleicher "Bug" bei UP
+INKY_OFFSETS = {
+    "up": (-2, -2),
+    "down": (0, 2),
+    "left": (-2, 0),
+    "right": (2, 0),
+    None: (0, 0),
+}
+# Bei Gleichstand an Kreuzungen: Priorität UP > LEFT > DOWN > RIGHT
+DIRECTION_PRIORITY = {UP: 0, LEFT: 1, DOWN: 2, RIGHT: 3}
+# Richtungen in Prüf-Reihenfolge mit ihrem Bit aus Maze.get_exit_mask
+GHOST_EXITS = [(UP, EXIT_UP), (DOWN, EXIT_DOWN), (LEFT, EXIT_LEFT), (RIGHT, EXIT_RIGHT)]
+EXIT_DIRECTIONS = EXIT_UP | EXIT_DOWN | EXIT_LEFT | EXIT_RIGHT
+# Bit der Gegenrichtung (STOP hat keine)
+REVERSE_EXITS = {UP: EXIT_DOWN, DOWN: EXIT_UP, LEFT: EXIT_RIGHT, RIGHT: EXIT_LEFT}
+# Pro Maske die offenen Richtungen - in Prüf-Reihenfolge für die Zufallswahl
+# und in Prioritäts-Reihenfolge für die Zielsuche (einmal vorberechnet)
+EXIT_CHOICES = [
+    tuple(direction for direction, bit in GHOST_EXITS if mask & bit)
+    for mask in range(EXIT_DIRECTIONS + 1)
+]
+EXIT_PRIORITY = [
+    tuple(sorted(choices, key=DIRECTION_PRIORITY.get)) for choices in EXIT_CHOICES
+]
+
+_ghost_atlas = None
+
+
+def build_ghost_atlas():
+    """
+    Lädt alle Geister-Sprites einmal und indiziert sie nach
+    (Name, Zustand, Animationsframe, Richtung). Zustände: normal,
+    frightened, blink (weiß blinkend) und eaten (nur Augen).
+    Fehlen die Tilesets, werden die Frames prozedural gezeichnet.
+    """
+    global _ghost_atlas
+    if _ghost_atlas is not None:
+        return _ghost_atlas
+
+    try:
+        frames = {
+            name: _load_tileset(tileset, 8) for name, tileset in GHOST_TILESETS.items()
+        }
+        frightened = _load_tileset("Ghost_flucht", 2)
+        blink = _load_tileset("Ghost_blink", 4)
+        eyes = _load_tileset("Ghost_die", 4)
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"Konnte Geister-Tilesets nicht laden, zeichne Sprites selbst: {e}")
+        frames, frightened, blink, eyes = _render_procedural_frames()
+
+    atlas = {}
+    for name in GHOST_TILESETS:
+        for frame in range(2):
+            for index, direction in enumerate(TILESET_DIRECTIONS):
+                atlas[(name, "normal", frame, direction)] = frames[name][
+                    index * 2 + frame
+                ]
+                atlas[(name, "frightened", frame, direction)] = frightened[frame]
+                atlas[(name, "blink", frame, direction)] = blink[2 + frame]
+                atlas[(name, "eaten", frame, direction)] = eyes[index]
+            # Stillstand: wie nach rechts schauend
+            for state in ("normal", "frightened", "blink", "eaten"):
+                atlas[(name, state, frame, STOP)] = atlas[(name, state, frame, RIGHT)]
+
+    _ghost_atlas = atlas
+    return atlas
+
+
+def _load_tileset(tileset, count):
+    """Zerlegt ein Tileset in count Frames, skaliert auf Geister-Größe"""
+    sheet = pygame.image.load(GHOST_SPRITE_PATH.format(tileset))
+    if pygame.display.get_surface() is not None:
+        sheet = sheet.convert_alpha()
+
+    width = round(TILESET_FRAME_WIDTH * GHOST_SPRITE_SCALE)
+    height = round(sheet.get_height() * GHOST_SPRITE_SCALE)
+    frames = []
+    for i in range(count):
+        frame = sheet.subsurface(
+            (i * TILESET_FRAME_WIDTH, 0, TILESET_FRAME_WIDTH, sheet.get_height())
+        )
+        frames.append(pygame.transform.smoothscale(frame, (width, height)))
+    return frames
+
+
+def _render_procedural_frames():
+    """Fallback: zeichnet die Frames wie früher mit Kreisen und Polygonen"""
+    frames = {}
+    for name, color in GHOST_COLORS.items():
+        frames[name] = [
+            _render_ghost(color, direction, frame)
+            for direction in TILESET_DIRECTIONS
+            for frame in range(2)
+        ]
+    frightened = [_render_ghost(BLUE, STOP, frame) for frame in range(2)]
+    blink = frightened + [_render_ghost(WHITE, STOP, frame) for frame in range(2)]
+    eyes = [_render_ghost(None, direction, 0) for direction in TILESET_DIRECTIONS]
+    return frames, frightened, blink, eyes
+
+
+def _render_ghost(color, direction, frame):
+    """Zeichnet einen Geister-Frame (Körper mit Wellen-Unterseite und Augen)"""
+    surface = pygame.Surface((GRID_SIZE + 2, GRID_SIZE + 4), pygame.SRCALPHA)
+    draw_x = surface.get_width() // 2
+    draw_y = GHOST_SPRITE_HEIGHT // 2
+    radius = GHOST_SIZE // 2
+
+    if color:  # Zeichne Körper nur wenn nicht "gegessen"
+        pygame.draw.circle(surface, color, (draw_x, draw_y), radius)
+
+        # Wellen-Unterseite, zwei Animationsphasen
+        bottom_y = draw_y + radius
+        wave_points = []
+        for i in range(-radius, radius + 1, 4):
+            wave_y = bottom_y + (3 if (i + frame * 4) % 8 < 4 else 0)
+            wave_points.append((draw_x + i, wave_y))
+        pygame.draw.polygon(
+            surface,
+            color,
+            [(draw_x - radius, draw_y)] + wave_points + [(draw_x + radius, draw_y)],
+        )
+
+    # Augen - Pupillen schauen in Bewegungsrichtung
+    pupil_offset_x = direction[0] * 2
+    pupil_offset_y = direction[1] * 2
+    for eye_x in (draw_x - 6, draw_x + 6):
+        pygame.draw.circle(surface, WHITE, (eye_x, draw_y - 4), 3)
+        pygame.draw.circle(
+            surface,
+            BLACK,
+            (eye_x + pupil_offset_x, draw_y - 4 + pupil_offset_y),
+            1,
+        )
+    return surface
 
 
 class Ghost:
-    def __init__(self, start_x, start_y, color, name):
+    def __init__(self, start_x, start_y, color, name, load_assets=True, rng=None):
         self.start_x = start_x
         self.start_y = start_y
         self.x = start_x * GRID_SIZE
@@ -76,8 +250,17 @@ class Ghost:
         # Movement restrictions
         self.can_reverse = False  # Verhindert 180° Wendungen außer bei Mode-Wechsel
 
-    def update(self, maze, pacman, all_ghosts=None):
-        """Update ghost position and AI"""
+        # Zufallsgenerator (z.B. das geseedete random.Random des Spiels)
+        self.rng = rng if rng is not None else random
+
+        # Sprite-Atlas (geteilt von allen Geistern, nicht im Headless-Modus)
+        self.sprites = build_ghost_atlas() if load_assets else None
+
+    def update_mode(self, pacman):
+        """
+        Timers, ghost house and mode changes - returns False while the ghost
+        is still in the house (then there is no target and no move)
+        """
         # Update mode timer
         self.mode_timer += 1
 
@@ -86,7 +269,7 @@ class Ghost:
             self.handle_house_exit(pacman)
             if self.in_house:  # Immer noch im Haus
                 self.move_in_house()
-                return
+                return False
 
         # Mode-Wechsel-Timing (basierend auf original Pac-Man Level 1)
         if self.mode != FRIGHTENED and self.mode != EATEN:
@@ -123,11 +306,10 @@ class Ghost:
                 self.pixel_x = float(self.x)
                 self.pixel_y = float(self.y)
                 self.house_exit_timer = 120  # 2 Sekunden warten bevor wieder raus
+        return True
 
-        # Set target based on mode and ghost personality
-        self.set_target(pacman, maze, all_ghosts)
-
-        # Move ghost
+    def update_movement(self, maze):
+        """Move towards the current target and advance the animation"""
         self.move(maze)
 
         # Update animation
@@ -140,14 +322,7 @@ class Ghost:
         # Für diesen einfachen Ansatz: Timer-basiert
         self.house_exit_timer += 1
 
-        exit_timers = {
-            "blinky": 0,  # Sofort (ist schon draußen)
-            "pinky": 60,  # 1 Sekunde
-            "inky": 180,  # 3 Sekunden
-            "clyde": 300,  # 5 Sekunden
-        }
-
-        if self.house_exit_timer >= exit_timers.get(self.name, 0):
+        if self.house_exit_timer >= HOUSE_EXIT_TIMERS.get(self.name, 0):
             self.exit_house()
 
     def exit_house(self):
@@ -200,103 +375,6 @@ class Ghost:
             # Richtungsumkehr
             self.direction = (-self.direction[0], -self.direction[1])
 
-    def set_target(self, pacman, maze, all_ghosts=None):
-        """Set target position based on ghost behavior"""
-        pacman_x, pacman_y = pacman.grid_x, pacman.grid_y
-
-        if self.mode == SCATTER:
-            # Each ghost has a fixed corner in scatter mode
-            corners = {
-                "blinky": (MAZE_WIDTH - 2, 0),  # Top-right
-                "pinky": (2, 0),  # Top-left
-                "inky": (MAZE_WIDTH - 1, MAZE_HEIGHT - 1),  # Bottom-right
-                "clyde": (0, MAZE_HEIGHT - 1),  # Bottom-left
-            }
-            self.target_x, self.target_y = corners.get(self.name, (0, 0))
-
-        elif self.mode == CHASE:
-            # Each ghost has different targeting behavior
-            if self.name == "blinky":
-                # Red ghost - targets Pac-Man directly
-                self.target_x, self.target_y = pacman_x, pacman_y
-
-            elif self.name == "pinky":
-                # Pink ghost - targets 4 tiles ahead of Pac-Man
-                direction_offsets = {
-                    "up": (0, -4),
-                    "down": (0, 4),
-                    "left": (-4, 0),
-                    "right": (4, 0),
-                    None: (0, 0),
-                }
-                offset = direction_offsets.get(pacman.current_direction, (0, 0))
-
-                # Berühmter Pinky "Bug" - bei UP geht sie 4 hoch und 4 links
-                if pacman.current_direction == "up":
-                    offset = (-4, -4)
-
-                self.target_x = pacman_x + offset[0]
-                self.target_y = pacman_y + offset[1]
-
-            elif self.name == "inky":
-                # Cyan ghost - komplexestes Verhalten
-                # 1. Finde Punkt 2 Tiles vor Pac-Man
-                direction_offsets = {
-                    "up": (0, -2),
-                    "down": (0, 2),
-                    "left": (-2, 0),
-                    "right": (2, 0),
-                    None: (0, 0),
-                }
-                offset = direction_offsets.get(pacman.current_direction, (0, 0))
-
-                # Inky "Bug" - bei UP geht er 2 hoch und 2 links
-                if pacman.current_direction == "up":
-                    offset = (-2, -2)
-
-                pivot_x = pacman_x + offset[0]
-                pivot_y = pacman_y + offset[1]
-
-                # 2. Finde Blinky's Position
-                blinky_x, blinky_y = self.find_blinky_position(all_ghosts)
-
-                # 3. Verdopple den Vektor von Blinky zum Pivot-Punkt
-                self.target_x = pivot_x + (pivot_x - blinky_x)
-                self.target_y = pivot_y + (pivot_y - blinky_y)
-
-            elif self.name == "clyde":
-                # Orange ghost - schüchtern
-                distance = math.sqrt(
-                    (self.grid_x - pacman_x) ** 2 + (self.grid_y - pacman_y) ** 2
-                )
-
-                if distance > 8:
-                    # Weit weg: Verhalte dich wie Blinky
-                    self.target_x, self.target_y = pacman_x, pacman_y
-                else:
-                    # Zu nah: Gehe zur Scatter-Ecke
-                    self.target_x, self.target_y = (0, MAZE_HEIGHT - 1)
-
-        elif self.mode == FRIGHTENED:
-            # Random movement when frightened
-            self.target_x = random.randint(0, MAZE_WIDTH - 1)
-            self.target_y = random.randint(0, MAZE_HEIGHT - 1)
-
-        elif self.mode == EATEN:
-            # Return to ghost house
-            self.target_x = MAZE_WIDTH // 2
-            self.target_y = MAZE_HEIGHT // 2
-
-    def find_blinky_position(self, all_ghosts):
-        """Find Blinky's position for Inky's targeting"""
-        if all_ghosts:
-            for ghost in all_ghosts:
-                if ghost.name == "blinky":
-                    return (ghost.grid_x, ghost.grid_y)
-
-        # Fallback: Blinky's Scatter-Position
-        return (MAZE_WIDTH - 2, 0)
-
     def move(self, maze):
         """Move the ghost using the classic Pac-Man movement rules"""
         # Für EATEN mode - schnellere Bewegung zum Geisterhaus
@@ -307,7 +385,14 @@ class Ghost:
 
         # Nur an Kreuzungen kann die Richtung geändert werden
         if self.at_intersection():
-            self.choose_direction_at_intersection(maze)
+            home = None
+            if self.mode == EATEN:
+                # Kürzester Heimweg aus dem vorberechneten Rückweg-Feld
+                home = maze.get_return_field().get_direction(self.grid_x, self.grid_y)
+            if home is not None:
+                self.direction = home
+            else:
+                self.choose_direction_at_intersection(maze)
             self.can_reverse = False  # Reset nach möglicher Umkehr
 
         # Bewege den Geist in die aktuelle Richtung
@@ -341,126 +426,72 @@ class Ghost:
 
     def choose_direction_at_intersection(self, maze):
         """Choose direction at intersection using Pac-Man ghost AI rules"""
-        possible_directions = []
-
-        # Check all four directions
-        for direction in [UP, DOWN, LEFT, RIGHT]:
-            next_x = self.grid_x + direction[0]
-            next_y = self.grid_y + direction[1]
-
-            # Geister können normalerweise nicht umkehren (180°)
-            reverse_direction = (-self.direction[0], -self.direction[1])
-            if direction == reverse_direction and not self.can_reverse:
-                continue
-
-            # Check if the direction is valid (not a wall)
-            if (
-                0 <= next_x < MAZE_WIDTH
-                and 0 <= next_y < MAZE_HEIGHT
-                and not maze.is_wall(next_x, next_y)
-            ):
-                possible_directions.append(direction)
-
-        if not possible_directions:
+        # Offene Richtungen aus der Masken-Tabelle des Maze - ohne Tunnel-Bits,
+        # Geister wählen nie eine Richtung aus dem Grid heraus
+        exits = maze.get_exit_mask(self.grid_x, self.grid_y) & EXIT_DIRECTIONS
+        # Geister können normalerweise nicht umkehren (180°)
+        if not self.can_reverse:
+            exits &= ~REVERSE_EXITS.get(self.direction, 0)
+
+        if not exits:
             # Sackgasse - erlaube Umkehr
             reverse_direction = (-self.direction[0], -self.direction[1])
-            possible_directions = [reverse_direction]
-
-        if possible_directions:
             if self.mode == FRIGHTENED:
-                # Zufällige Bewegung wenn verängstigt
-                self.direction = random.choice(possible_directions)
+                # Zufallswahl trotzdem ziehen (gleiche Zufallsfolge wie zuvor)
+                self.direction = self.rng.choice((reverse_direction,))
             else:
-                # Wähle Richtung die am nächsten zum Ziel führt
-                best_direction = possible_directions[0]
-                best_distance = float("inf")
-
-                for direction in possible_directions:
-                    next_x = self.grid_x + direction[0]
-                    next_y = self.grid_y + direction[1]
-
-                    # Berechne Distanz zum Ziel (Pac-Man's Entfernungsberechnung)
-                    distance = math.sqrt(
-                        (next_x - self.target_x) ** 2 + (next_y - self.target_y) ** 2
-                    )
-
-                    # Bei Gleichstand: Priorität UP > LEFT > DOWN > RIGHT
-                    if distance < best_distance:
-                        best_distance = distance
-                        best_direction = direction
-                    elif distance == best_distance:
-                        # Richtungspriorität
-                        priority = {UP: 0, LEFT: 1, DOWN: 2, RIGHT: 3}
-                        if priority.get(direction, 4) < priority.get(best_direction, 4):
-                            best_direction = direction
-
-                self.direction = best_direction
+                self.direction = reverse_direction
+        elif self.mode == FRIGHTENED:
+            # Zufällige Bewegung wenn verängstigt
+            self.direction = self.rng.choice(EXIT_CHOICES[exits])
+        else:
+            # Wähle Richtung die am nächsten zum Ziel führt - Quadrat der
+            # Distanz (gleiche Reihenfolge wie math.sqrt), bei Gleichstand
+            # gewinnt die erste in Prioritäts-Reihenfolge UP > LEFT > DOWN > RIGHT
+            best_direction = None
+            best_distance = 0
+            for direction in EXIT_PRIORITY[exits]:
+                dx = self.grid_x + direction[0] - self.target_x
+                dy = self.grid_y + direction[1] - self.target_y
+                distance = dx * dx + dy * dy
+                if best_direction is None or distance < best_distance:
+                    best_distance = distance
+                    best_direction = direction
+            self.direction = best_direction
 
     def draw(self, screen):
-        """Draw the ghost to the screen"""
-        draw_x = self.x + GRID_SIZE // 2
-        draw_y = self.y + GRID_SIZE // 2
-        radius = self.size // 2
+        """Draw the ghost to the screen - one blit from the sprite atlas"""
+        if self.sprites is None:
+            self.sprites = build_ghost_atlas()
 
-        # Choose color based on mode
-        color = self.color
+        # Choose atlas state based on mode
         if self.mode == FRIGHTENED:
-            color = BLUE
-            # Blinken wenn Frightened-Mode bald endet
-            if self.mode_timer > 360:  # Letzte 2 Sekunden
-                if int(self.animation_frame * 4) % 2 == 0:
-                    color = WHITE
+            state = "frightened"
+            # Blinken wenn Frightened-Mode bald endet (letzte 2 Sekunden)
+            if self.mode_timer > 360 and int(self.animation_frame * 4) % 2 == 0:
+                state = "blink"
         elif self.mode == EATEN:
             # Nur Augen sichtbar
-            color = None
-
-        if color:  # Zeichne Körper nur wenn nicht "gegessen"
-            # Draw ghost body (circle)
-            pygame.draw.circle(screen, color, (int(draw_x), int(draw_y)), radius)
-
-            # Draw ghost bottom (wavy)
-            bottom_y = draw_y + radius
-            wave_points = []
-            for i in range(-radius, radius + 1, 4):
-                wave_y = bottom_y + (
-                    3 if (i + int(self.animation_frame * 10)) % 8 < 4 else 0
-                )
-                wave_points.append((draw_x + i, wave_y))
-
-            if len(wave_points) > 1:
-                pygame.draw.polygon(
-                    screen,
-                    color,
-                    [(draw_x - radius, draw_y)]
-                    + wave_points
-                    + [(draw_x + radius, draw_y)],
-                )
-
-        # Draw eyes (always visible)
-        eye_color = WHITE
-        pupil_color = BLACK
-
-        # Pupillen schauen in Bewegungsrichtung
-        pupil_offset_x = self.direction[0] * 2
-        pupil_offset_y = self.direction[1] * 2
-
-        # Left eye
-        pygame.draw.circle(screen, eye_color, (int(draw_x - 6), int(draw_y - 4)), 3)
-        pygame.draw.circle(
-            screen,
-            pupil_color,
-            (int(draw_x - 6 + pupil_offset_x), int(draw_y - 4 + pupil_offset_y)),
-            1,
+            state = "eaten"
+        else:
+            state = "normal"
+
+        frame = int(self.animation_frame) % 2
+        sprite = self.sprites[(self.name, state, frame, self.direction)]
+        screen.blit(
+            sprite,
+            (
+                self.x + GRID_SIZE // 2 - sprite.get_width() // 2,
+                self.y + GRID_SIZE // 2 - GHOST_SPRITE_HEIGHT // 2,
+            ),
         )
 
-        # Right eye
-        pygame.draw.circle(screen, eye_color, (int(draw_x + 6), int(draw_y - 4)), 3)
-        pygame.draw.circle(
-            screen,
-            pupil_color,
-            (int(draw_x + 6 + pupil_offset_x), int(draw_y - 4 + pupil_offset_y)),
-            1,
-        )
+    def get_draw_rect(self):
+        """Get the screen area covered by draw() (whole atlas frame)"""
+        half = GRID_SIZE // 2 + 3
+        left = int(self.x + GRID_SIZE // 2) - half
+        top = int(self.y + GRID_SIZE // 2) - half
+        return pygame.Rect(left, top, half * 2, half * 2 + 2)
 
     def get_position(self):
         """Get current grid position"""
@@ -0,0 +1,134 @@
+"""
+Ghost Squad
+Updates all ghosts of a game in one pass per phase: first timers and modes,
+then the targets of every ghost from one shared snapshot of Pac-Man and
+Blinky, then the movement. The personalities are read from tables built
+once, shared work (Blinky lookup, flow field) is done once per frame
+"""
+
+import math
+from .constants import *
+from .ghost import SCATTER_CORNERS, PINKY_OFFSETS, INKY_OFFSETS
+
+# Chase-Verhalten der Persönlichkeiten
+CHASE_DIRECT = 0  # Blinky: direkt auf Pac-Man
+CHASE_AHEAD = 1  # Pinky: Tiles vor Pac-Man
+CHASE_FLANK = 2  # Inky: Vektor von Blinky über den Punkt vor Pac-Man verdoppelt
+CHASE_SHY = 3  # Clyde: wie Blinky, aber in die Ecke wenn zu nah
+CHASE_RULES = {
+    "blinky": CHASE_DIRECT,
+    "pinky": CHASE_AHEAD,
+    "inky": CHASE_FLANK,
+    "clyde": CHASE_SHY,
+}
+CHASE_OFFSETS = {CHASE_AHEAD: PINKY_OFFSETS, CHASE_FLANK: INKY_OFFSETS}
+
+# Clyde: bis zu dieser Weglänge zu Pac-Man zieht er sich in seine Ecke zurück
+SHY_DISTANCE = 8
+# Ohne Blinky zielt Inky über Blinkys Scatter-Ecke
+BLINKY_FALLBACK = (MAZE_WIDTH - 2, 0)
+HOUSE_TARGET = (MAZE_WIDTH // 2, MAZE_HEIGHT // 2)
+
+
+class GhostSquad:
+    """
+    Controller and targeting AI for the ghosts of one game. All targets of a
+    frame see the same positions (before any ghost moves), the ghosts then
+    move in list order
+    """
+
+    def __init__(self, ghosts):
+        self.ghosts = ghosts
+        # Pro Geist: (Geist, Scatter-Ecke, Chase-Regel, Ziel-Offsets)
+        self.plans = []
+        for ghost in ghosts:
+            rule = CHASE_RULES.get(ghost.name)
+            self.plans.append(
+                (
+                    ghost,
+                    SCATTER_CORNERS.get(ghost.name, (0, 0)),
+                    rule,
+                    CHASE_OFFSETS.get(rule),
+                )
+            )
+        self.blinky = next((g for g in ghosts if g.name == "blinky"), None)
+
+    def update(self, maze, pacman):
+        """Modes, then targets, then movement of all ghosts"""
+        active = self.update_modes(pacman)
+        if not active:
+            return
+        self.set_targets(active, maze, pacman)
+        self.move(active, maze)
+
+    def update_modes(self, pacman):
+        """Timers and modes of all ghosts, returns the plans of those that move"""
+        return [plan for plan in self.plans if plan[0].update_mode(pacman)]
+
+    def move(self, plans, maze):
+        """Move the given ghosts in list order"""
+        for plan in plans:
+            plan[0].update_movement(maze)
+
+    def set_targets(self, plans, maze, pacman):
+        """Set the target tiles by mode and personality from one snapshot"""
+        pacman_x, pacman_y = pacman.grid_x, pacman.grid_y
+        direction = pacman.current_direction
+        if self.blinky is not None:
+            blinky_x, blinky_y = self.blinky.grid_x, self.blinky.grid_y
+        else:
+            blinky_x, blinky_y = BLINKY_FALLBACK
+        field = None
+
+        for ghost, corner, rule, offsets in plans:
+            mode = ghost.mode
+            if mode == SCATTER:
+                # Each ghost has a fixed corner in scatter mode
+                ghost.target_x, ghost.target_y = corner
+
+            elif mode == CHASE:
+                if rule == CHASE_DIRECT:
+                    # Red ghost - targets Pac-Man directly
+                    ghost.target_x, ghost.target_y = pacman_x, pacman_y
+
+                elif rule == CHASE_AHEAD:
+                    # Pink ghost - targets 4 tiles ahead of Pac-Man (inkl. UP-"Bug")
+                    offset_x, offset_y = offsets.get(direction, (0, 0))
+                    ghost.target_x = pacman_x + offset_x
+                    ghost.target_y = pacman_y + offset_y
+
+                elif rule == CHASE_FLANK:
+                    # Cyan ghost - Punkt 2 Tiles vor Pac-Man, dann den Vektor
+                    # von Blinky zu diesem Punkt verdoppeln
+                    offset_x, offset_y = offsets.get(direction, (0, 0))
+                    ghost.target_x = 2 * (pacman_x + offset_x) - blinky_x
+                    ghost.target_y = 2 * (pacman_y + offset_y) - blinky_y
+
+                elif rule == CHASE_SHY:
+                    # Orange ghost - schüchtern: echte Weglänge zu Pac-Man aus
+                    # dem geteilten Flow Field (erst hier auf Pac-Mans Tile
+                    # gesetzt), Luftlinie nur außerhalb des Graphen
+                    if field is None:
+                        field = maze.get_flow_field()
+                        field.update(pacman_x, pacman_y)
+                    distance = field.get_distance(ghost.grid_x, ghost.grid_y)
+                    if distance is None:
+                        distance = math.sqrt(
+                            (ghost.grid_x - pacman_x) ** 2
+                            + (ghost.grid_y - pacman_y) ** 2
+                        )
+                    if distance > SHY_DISTANCE:
+                        # Weit weg: Verhalte dich wie Blinky
+                        ghost.target_x, ghost.target_y = pacman_x, pacman_y
+                    else:
+                        # Zu nah: Gehe zur Scatter-Ecke
+                        ghost.target_x, ghost.target_y = corner
+
+            elif mode == FRIGHTENED:
+                # Random movement when frightened (Ziel zieht trotzdem Zufallszahlen)
+                ghost.target_x = ghost.rng.randint(0, MAZE_WIDTH - 1)
+                ghost.target_y = ghost.rng.randint(0, MAZE_HEIGHT - 1)
+
+            elif mode == EATEN:
+                # Return to ghost house
+                ghost.target_x, ghost.target_y = HOUSE_TARGET
@@ -0,0 +1,88 @@
+"""
+Headless Simulation
+Runs the game logic without window, mixer or frame limiter (e.g. for AI evaluation)
+"""
+
+import time
+from .constants import *
+from .game import Game
+from .state_hash import state_digest
+
+
+class HeadlessRunner:
+    """
+    Steps Game.update() in fixed logical frames as fast as the CPU allows
+    Every update counts as exactly 1 / FPS seconds of game time
+    """
+
+    def __init__(self, game=None, profile=False, seed=None):
+        if game is None:
+            game = Game(None, headless=True, profile=profile, seed=seed)
+        self.game = game
+        self.frames = 0
+        self.wall_time = 0.0
+
+    def run(self, max_frames=FPS * 60 * 5, policy=None):
+        """
+        Run the game until it ends or max_frames logical frames have passed
+        policy: optional callable(game) returning a direction (UP/DOWN/...) or None
+        Returns a dict with the simulation statistics
+        """
+        game = self.game
+        if game.state == MENU:
+            game.start_game()
+
+        frames = 0
+        start = time.perf_counter()
+        while frames < max_frames and game.state == PLAYING:
+            if policy is not None:
+                direction = policy(game)
+                if direction is not None:
+                    game.set_pacman_direction(direction)
+            game.update()
+            frames += 1
+        elapsed = time.perf_counter() - start
+
+        self.frames += frames
+        self.wall_time += elapsed
+        return self.get_stats(frames, elapsed)
+
+    def get_stats(self, frames=None, elapsed=None):
+        """Collect statistics (simulated frames per wall-clock second etc.)"""
+        if frames is None:
+            frames = self.frames
+        if elapsed is None:
+            elapsed = self.wall_time
+        fps = frames / elapsed if elapsed > 0 else 0.0
+        stats = {
+            "frames": frames,
+            "simulated_seconds": frames / FPS,
+            "wall_seconds": elapsed,
+            "simulated_fps": fps,
+            "speedup": fps / FPS,
+            "score": self.game.score,
+            "lives": self.game.lives,
+            "state": self.game.state,
+            "seed": self.game.game_seed,
+            # Gleicher Seed + gleiche Eingaben -> gleicher Hash (Regressionstest)
+            "state_hash": state_digest(self.game).hex(),
+        }
+        if self.game.profiler:
+            # Percentiles (p50, p95, p99 in ms) per subsystem
+            stats["profile"] = self.game.profiler.get_percentiles()
+        return stats
+
+
+def run_headless_games(
+    games=1, max_frames=FPS * 60 * 5, policy=None, profile=False, seed=None
+):
+    """
+    Run several headless games one after another and return their statistics
+    With a seed game i uses seed + i, so the whole run is reproducible
+    """
+    results = []
+    for i in range(games):
+        game_seed = seed + i if seed is not None else None
+        runner = HeadlessRunner(profile=profile, seed=game_seed)
+        results.append(runner.run(max_frames, policy))
+    return results
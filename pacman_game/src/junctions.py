@@ -0,0 +1,252 @@
+"""
+Junction Graph
+Compressed form of the node graph: only intersections and dead ends are
+vertices, the corridors between them become weighted edges (length in
+tiles). Every tile can be mapped back to its vertex or to its corridor and
+position, so path queries run over a few dozen vertices instead of
+hundreds of nodes
+"""
+
+import heapq
+
+# Gegenrichtung pro Slot (up <-> down, left <-> right, siehe nodes.SLOT_OFFSETS)
+OPPOSITE_SLOT = [1, 0, 3, 2]
+
+NO_VERTEX = -1
+
+
+class Corridor:
+    """
+    Edge between two vertices: the tiles in between (node indices from start
+    to end, without the vertices), the slot in which it leaves start and the
+    slot in which it leaves end
+    """
+
+    __slots__ = ("index", "start", "end", "start_slot", "end_slot", "tiles")
+
+    def __init__(self, index, start, end, start_slot, end_slot, tiles):
+        self.index = index
+        self.start = start
+        self.end = end
+        self.start_slot = start_slot
+        self.end_slot = end_slot
+        self.tiles = tiles
+
+    def __repr__(self):
+        return f"Corridor({self.start} -> {self.end}, length {self.get_length()})"
+
+    def get_length(self):
+        """Steps from one vertex to the other"""
+        return len(self.tiles) + 1
+
+
+class JunctionGraph:
+    """
+    vertices: nodes with other than two neighbours (tunnel links count)
+    exits[v][slot]: corridor leaving vertex v in direction slot (or None)
+    vertex_of[node index]: vertex id or NO_VERTEX
+    corridor_of[node index]: (corridor, position) for tiles inside a corridor
+    """
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        self.vertices = []
+        self.vertex_of = [NO_VERTEX] * len(nodes)
+        self.corridor_of = [None] * len(nodes)
+        self.corridors = []
+        self.exits = []
+
+        # Erst alle Kreuzungen und Sackgassen, dann die Korridore dazwischen
+        for node in nodes:
+            if self.get_degree(node) != 2:
+                self.add_vertex(node)
+        for vertex in range(len(self.vertices)):
+            self.follow_corridors(vertex)
+
+        # Reine Ringe ohne Kreuzung brauchen trotzdem einen Knoten
+        for node in nodes:
+            if self.vertex_of[node.index] == NO_VERTEX and (
+                self.corridor_of[node.index] is None
+            ):
+                self.follow_corridors(self.add_vertex(node))
+
+    @staticmethod
+    def get_degree(node):
+        """Number of neighbours including tunnel links"""
+        return sum(1 for link in node.links if link is not None)
+
+    def add_vertex(self, node):
+        """Make node a vertex, returns its id"""
+        vertex = len(self.vertices)
+        self.vertices.append(node)
+        self.vertex_of[node.index] = vertex
+        self.exits.append([None] * 4)
+        return vertex
+
+    def follow_corridors(self, vertex):
+        """Follow all corridors leaving vertex that are not known yet"""
+        for slot, link in enumerate(self.vertices[vertex].links):
+            if link is not None and self.exits[vertex][slot] is None:
+                self.follow_corridor(vertex, slot)
+
+    def follow_corridor(self, vertex, slot):
+        """Walk from vertex in direction slot up to the next vertex"""
+        tiles = []
+        current = self.vertices[vertex].links[slot]
+        entry = OPPOSITE_SLOT[slot]
+        while self.vertex_of[current.index] == NO_VERTEX:
+            tiles.append(current.index)
+            # Weiter über den anderen Ausgang des Korridor-Tiles
+            slot_out = next(
+                s for s, link in enumerate(current.links) if link and s != entry
+            )
+            current = current.links[slot_out]
+            entry = OPPOSITE_SLOT[slot_out]
+
+        end = self.vertex_of[current.index]
+        corridor = Corridor(len(self.corridors), vertex, end, slot, entry, tiles)
+        self.corridors.append(corridor)
+        self.exits[vertex][slot] = corridor
+        self.exits[end][entry] = corridor
+        for position, index in enumerate(tiles):
+            self.corridor_of[index] = (corridor, position)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_vertex_count(self):
+        """Number of vertices (intersections, dead ends, ring anchors)"""
+        return len(self.vertices)
+
+    def get_exits(self, vertex):
+        """[(slot, neighbour vertex, length)] of all corridors leaving vertex"""
+        exits = []
+        for slot, corridor in enumerate(self.exits[vertex]):
+            if corridor is not None:
+                if corridor.start == vertex and corridor.start_slot == slot:
+                    other = corridor.end
+                else:
+                    other = corridor.start
+                exits.append((slot, other, corridor.get_length()))
+        return exits
+
+    def get_corridor_tiles(self, corridor):
+        """Tiles (x, y) of a corridor from start to end vertex, both included"""
+        nodes = self.nodes
+        tiles = [self.vertices[corridor.start]]
+        tiles += [nodes[index] for index in corridor.tiles]
+        tiles.append(self.vertices[corridor.end])
+        return [(node.grid_x, node.grid_y) for node in tiles]
+
+    def get_anchors(self, node):
+        """
+        Vertices from which node is reached: [(vertex, steps)] - the node
+        itself or the two ends of its corridor
+        """
+        vertex = self.vertex_of[node.index]
+        if vertex != NO_VERTEX:
+            return [(vertex, 0)]
+        corridor, position = self.corridor_of[node.index]
+        return [
+            (corridor.start, position + 1),
+            (corridor.end, len(corridor.tiles) - position),
+        ]
+
+    def distance(self, start, goal):
+        """Shortest path length in tiles between two nodes (None if unreachable)"""
+        result = self.search(start, goal)
+        return result[0] if result else None
+
+    def path(self, start, goal):
+        """Shortest path as list of tiles (x, y) from start to goal (or [])"""
+        result = self.search(start, goal)
+        if not result:
+            return []
+        _, route = result
+        return [(node.grid_x, node.grid_y) for node in route]
+
+    def search(self, start, goal):
+        """Dijkstra over the vertices, returns (length, [nodes]) or None"""
+        if start is goal:
+            return 0, [start]
+
+        best = None
+        # Beide im selben Korridor: direkt entlang des Korridors
+        start_place = self.corridor_of[start.index]
+        goal_place = self.corridor_of[goal.index]
+        if start_place and goal_place and start_place[0] is goal_place[0]:
+            corridor = start_place[0]
+            a, b = start_place[1], goal_place[1]
+            step = 1 if b > a else -1
+            route = [self.nodes[corridor.tiles[i]] for i in range(a, b + step, step)]
+            best = (abs(b - a), route)
+
+        goal_steps = {}
+        for vertex, steps in self.get_anchors(goal):
+            goal_steps[vertex] = min(steps, goal_steps.get(vertex, steps))
+        dist = {}
+        previous = {}
+        queue = []
+        for vertex, steps in self.get_anchors(start):
+            if steps < dist.get(vertex, steps + 1):
+                dist[vertex] = steps
+                previous[vertex] = None
+                heapq.heappush(queue, (steps, vertex))
+
+        while queue:
+            steps, vertex = heapq.heappop(queue)
+            if steps > dist[vertex] or (best and steps >= best[0]):
+                continue
+            if vertex in goal_steps:
+                total = steps + goal_steps[vertex]
+                if best is None or total < best[0]:
+                    best = (total, self.build_route(start, goal, vertex, previous))
+            for corridor in self.exits[vertex]:
+                if corridor is None:
+                    continue
+                for other in (corridor.start, corridor.end):
+                    if other == vertex and corridor.start != corridor.end:
+                        continue
+                    total = steps + corridor.get_length()
+                    if total < dist.get(other, total + 1):
+                        dist[other] = total
+                        previous[other] = (vertex, corridor)
+                        heapq.heappush(queue, (total, other))
+        return best
+
+    def build_route(self, start, goal, last_vertex, previous):
+        """Tiles from start over the vertex chain ending in last_vertex to goal"""
+        chain = []
+        vertex = last_vertex
+        while previous[vertex] is not None:
+            from_vertex, corridor = previous[vertex]
+            chain.append((from_vertex, corridor, vertex))
+            vertex = from_vertex
+        first_vertex = vertex
+        chain.reverse()
+
+        route = self.walk_to_vertex(start, first_vertex)
+        for from_vertex, corridor, to_vertex in chain:
+            inner = [self.nodes[index] for index in corridor.tiles]
+            if corridor.start != from_vertex:
+                inner.reverse()
+            route += inner + [self.vertices[to_vertex]]
+        route += self.walk_to_vertex(goal, last_vertex)[::-1][1:]
+        return route
+
+    def walk_to_vertex(self, node, vertex):
+        """Nodes from node along its corridor up to vertex (both included)"""
+        if self.vertex_of[node.index] == vertex:
+            return [node]
+        corridor, position = self.corridor_of[node.index]
+        if corridor.start == vertex and corridor.end == vertex:
+            # Ring: der kürzere Weg zurück zum Knoten
+            toward_start = position + 1 <= len(corridor.tiles) - position
+        else:
+            toward_start = corridor.start == vertex
+        if toward_start:
+            inner = corridor.tiles[position::-1]
+        else:
+            inner = corridor.tiles[position:]
+        return [self.nodes[index] for index in inner] + [self.vertices[vertex]]
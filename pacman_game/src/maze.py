@@ -6,12 +6,21 @@ Handles the game maze/level layout, walls, and pathfinding
 import pygame
 from .constants import *
 from .nodes import build_nodes_and_graph
+from .pathing import PathService
+
+# Ausgänge eines Tiles als Bitmaske, Bit 1 << slot (Slots wie in nodes.py)
+EXIT_UP, EXIT_DOWN, EXIT_LEFT, EXIT_RIGHT = 1, 2, 4, 8
+EXIT_BITS = {UP: EXIT_UP, DOWN: EXIT_DOWN, LEFT: EXIT_LEFT, RIGHT: EXIT_RIGHT}
+# Ausgang über den Tunnel auf die andere Seite: Richtungs-Bit << TUNNEL_SHIFT
+TUNNEL_SHIFT = 4
+# Rand der Masken-Tabelle um das Maze (Geister im Tunnel außerhalb des Grids)
+EXIT_PADDING = 2
 
 
 class Maze:
-    def __init__(self):
+    def __init__(self, load_assets=True):
         # Original Spielfeld-Layout aus spielfeld.py
-        self.layout_strings = [
+        layout_strings = [
             "############################",
             "#............##............#",
             "#.####.#####.##.#####.####.#",
@@ -45,6 +54,24 @@ class Maze:
             "############################",
         ]
 
+        # Kürzeste Wege mit A* bzw. über den Kreuzungs-Graphen und LRU-Cache
+        # (wird bei Layout-Wechsel geleert)
+        self.path_service = PathService(self)
+        self.background_image = None
+        self.set_layout(layout_strings)
+
+        # Lade das Spielfeld-Bild als Hintergrund (nicht im Headless-Modus)
+        if load_assets:
+            self.load_background()
+
+    def set_layout(self, layout_strings):
+        """
+        Setzt ein (neues) Layout - Nodes, Distanztabellen und Pfad-Cache werden
+        neu aufgebaut, Pellets und Figuren muss der Aufrufer zurücksetzen
+        """
+        changed = getattr(self, "layout_strings", None) not in (None, layout_strings)
+        self.layout_strings = list(layout_strings)
+
         # Maze-Dimensionen
         self.height = len(self.layout_strings)
         self.width = len(self.layout_strings[0]) if self.layout_strings else 0
@@ -65,10 +92,28 @@ class Maze:
         self.LEFT_TUNNEL_X = 0
         self.RIGHT_TUNNEL_X = self.width - 1
 
+        # Offene Richtungen pro Tile für die Geister-Entscheidungen
+        self.exit_masks = self.build_exit_masks()
+
         # Erstelle Nodes für das Pathfinding
         self.nodes, self.node_map = build_nodes_and_graph(self)
 
-        # Lade das Spielfeld-Bild als Hintergrund
+        # All-Pairs-Distanztabelle - wird erst bei Bedarf geladen/berechnet
+        self.distance_table = None
+        # Komprimierter Graph aus Kreuzungen und Korridoren (bei Bedarf)
+        self.junction_graph = None
+        # Geteiltes Distanzfeld zu Pac-Man (bei Bedarf)
+        self.flow_field = None
+        # Rückweg-Feld für gefressene Geister (bei Bedarf, auf der Platte gecacht)
+        self.return_field = None
+        self.path_service.invalidate()
+
+        # Das Hintergrundbild zeigt nur das Original-Layout - sonst Wand-Tiles
+        if changed:
+            self.background_image = None
+
+    def load_background(self):
+        """Lädt das Spielfeld-Bild und skaliert es auf die Spielfeldgröße"""
         try:
             original_image = pygame.image.load(
                 "assets/images/maze/Teil_017_Spielfeld.png"
@@ -96,6 +141,35 @@ class Maze:
             return True
         return self.layout[y][x] == 1
 
+    def build_exit_masks(self):
+        """
+        Bitmaske der offenen Richtungen für jedes Tile plus EXIT_PADDING Tiles
+        Rand: EXIT_* für begehbare Nachbarn im Grid, EXIT_* << TUNNEL_SHIFT
+        für Richtungen, die durch den Tunnel auf die andere Seite führen
+        """
+        pad = EXIT_PADDING
+        masks = []
+        for y in range(-pad, self.height + pad):
+            for x in range(-pad, self.width + pad):
+                mask = 0
+                for (dx, dy), bit in EXIT_BITS.items():
+                    if not self.is_wall(x + dx, y + dy):
+                        mask |= bit
+                    tunnel_exit = self.get_tunnel_exit(x, y, dx, dy)
+                    if tunnel_exit and not self.is_wall(*tunnel_exit):
+                        mask |= bit << TUNNEL_SHIFT
+                masks.append(mask)
+        return masks
+
+    def get_exit_mask(self, x, y):
+        """Offene Richtungen eines Tiles (0 weit außerhalb des Maze)"""
+        x += EXIT_PADDING
+        y += EXIT_PADDING
+        table_width = self.width + 2 * EXIT_PADDING
+        if 0 <= x < table_width and 0 <= y < self.height + 2 * EXIT_PADDING:
+            return self.exit_masks[y * table_width + x]
+        return 0
+
     def is_empty(self, x, y):
         """Check if the given grid position is empty"""
         return not self.is_wall(x, y)
@@ -118,19 +192,38 @@ class Maze:
             # Fallback: Zeichne die Wände manuell, falls kein Bild geladen werden konnte
             for y in range(self.height):
                 for x in range(self.width):
-                    pixel_x = x * GRID_SIZE
-                    pixel_y = y * GRID_SIZE
+                    if self.is_wall(x, y):
+                        self.draw_wall_tile(screen, x, y)
 
+    def draw_region(self, screen, rect):
+        """Stellt den Maze-Hintergrund nur innerhalb von rect wieder her"""
+        if self.background_image:
+            screen.blit(self.background_image, rect.topleft, rect)
+        else:
+            screen.fill(BLACK, rect)
+            first_x = max(0, rect.left // GRID_SIZE)
+            last_x = min(self.width - 1, (rect.right - 1) // GRID_SIZE)
+            first_y = max(0, rect.top // GRID_SIZE)
+            last_y = min(self.height - 1, (rect.bottom - 1) // GRID_SIZE)
+            for y in range(first_y, last_y + 1):
+                for x in range(first_x, last_x + 1):
                     if self.is_wall(x, y):
-                        # Draw wall
-                        wall_rect = pygame.Rect(pixel_x, pixel_y, GRID_SIZE, GRID_SIZE)
-                        pygame.draw.rect(screen, BLUE, wall_rect)
+                        self.draw_wall_tile(screen, x, y)
+
+    def draw_wall_tile(self, screen, x, y):
+        """Zeichnet ein einzelnes Wand-Tile (Fallback ohne Hintergrundbild)"""
+        pixel_x = x * GRID_SIZE
+        pixel_y = y * GRID_SIZE
 
-                        # Add some depth with border
-                        border_rect = pygame.Rect(
-                            pixel_x + 1, pixel_y + 1, GRID_SIZE - 2, GRID_SIZE - 2
-                        )
-                        pygame.draw.rect(screen, (0, 0, 150), border_rect)
+        # Draw wall
+        wall_rect = pygame.Rect(pixel_x, pixel_y, GRID_SIZE, GRID_SIZE)
+        pygame.draw.rect(screen, BLUE, wall_rect)
+
+        # Add some depth with border
+        border_rect = pygame.Rect(
+            pixel_x + 1, pixel_y + 1, GRID_SIZE - 2, GRID_SIZE - 2
+        )
+        pygame.draw.rect(screen, (0, 0, 150), border_rect)
 
     def get_neighbors(self, x, y):
         """Get valid neighboring positions"""
@@ -145,28 +238,52 @@ class Maze:
                 neighbors.append((new_x, new_y))
         return neighbors
 
-    def find_path(self, start, end):
-        """Simple pathfinding using BFS (for AI)"""
-        from collections import deque
+    def get_distance_table(self):
+        """Liefert die (gecachte) All-Pairs-Distanztabelle des Layouts"""
+        if self.distance_table is None:
+            from .distances import DistanceTable
 
-        if self.is_wall(start[0], start[1]) or self.is_wall(end[0], end[1]):
-            return []
+            self.distance_table = DistanceTable.load_or_build(self)
+        return self.distance_table
+
+    def get_junction_graph(self):
+        """Liefert den (gecachten) Kreuzungs-Graphen des Layouts"""
+        if self.junction_graph is None:
+            from .junctions import JunctionGraph
 
-        queue = deque([(start, [start])])
-        visited = {start}
+            self.junction_graph = JunctionGraph(self.nodes)
+        return self.junction_graph
 
-        while queue:
-            (x, y), path = queue.popleft()
+    def get_flow_field(self):
+        """Liefert das geteilte Distanzfeld zu Pac-Man (siehe flow_field.py)"""
+        if self.flow_field is None:
+            from .flow_field import FlowField
 
-            if (x, y) == end:
-                return path
+            self.flow_field = FlowField(self)
+        return self.flow_field
 
-            for next_x, next_y in self.get_neighbors(x, y):
-                if (next_x, next_y) not in visited:
-                    visited.add((next_x, next_y))
-                    queue.append(((next_x, next_y), path + [(next_x, next_y)]))
+    def get_return_field(self):
+        """Liefert das (gecachte) Rückweg-Feld zum Geisterhaus"""
+        if self.return_field is None:
+            from .return_field import ReturnField
+
+            self.return_field = ReturnField.load_or_build(self)
+        return self.return_field
+
+    def get_distance(self, start, end):
+        """Kürzeste Weglänge in Tiles (inklusive Tunnel) oder None"""
+        return self.get_distance_table().distance(start, end)
+
+    def get_next_step(self, start, end):
+        """Nächstes Tile auf dem kürzesten Weg von start nach end oder None"""
+        return self.get_distance_table().next_step(start, end)
+
+    def find_path(self, start, end):
+        """Shortest path (for AI) including the tunnel - see pathing.PathService"""
+        if self.is_wall(start[0], start[1]) or self.is_wall(end[0], end[1]):
+            return []
 
-        return []  # No path found
+        return self.path_service.find_path(start, end)
 
     def get_center_position(self):
         """Get the center position of the maze"""
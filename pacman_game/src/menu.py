@@ -5,11 +5,15 @@ Includes main menu, credits, and horror transition effects
 """
 
 import pygame
-import pygame_gui
 import os
 import random
 from typing import Optional, Tuple
 
+try:
+    from .overlay_cache import overlay_cache
+except ImportError:  # Direkt als Skript gestartet (python menu.py)
+    from overlay_cache import overlay_cache
+
 
 class Menu:
     """
@@ -17,12 +21,16 @@ class Menu:
     um Kompatibilität mit game.py zu gewährleisten
     """
 
-    def __init__(self, screen_width=540, screen_height=720):
+    def __init__(
+        self, screen_width=540, screen_height=720, load_assets=True, rng=None
+    ):
         """Initialisiert das Menü-System"""
         # Verwende die tatsächliche Bildschirmgröße aus der Game-Klasse
         from .constants import SCREEN_WIDTH, SCREEN_HEIGHT
 
-        self.menu_system = MenuSystem(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.menu_system = MenuSystem(
+            SCREEN_WIDTH, SCREEN_HEIGHT, load_assets=load_assets, rng=rng
+        )
 
     def draw(self, surface):
         """Zeichnet das Menü auf die Oberfläche"""
@@ -41,15 +49,31 @@ class MenuSystem:
     HORROR_EFFECT = 1
     GAMEPLAY = 2
 
-    def __init__(self, screen_width: int = 540, screen_height: int = 720):
+    def __init__(
+        self,
+        screen_width: int = 540,
+        screen_height: int = 720,
+        load_assets: bool = True,
+        rng: Optional[random.Random] = None,
+    ):
         """Initialize the menu system"""
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.current_state = self.MENU
+        # Ohne Assets (Headless-Modus) gibt es weder UI-Manager noch Sound
+        self.load_assets = load_assets
+        # Zufallsgenerator für den Sternenhimmel (z.B. der geseedete des Spiels)
+        self.rng = rng if rng is not None else random
 
         # Initialize pygame components
-        self._init_display()
-        self._load_assets()
+        if load_assets:
+            self._init_display()
+            self._load_assets()
+        else:
+            self.manager = None
+            self.background_image = None
+            self.has_background_image = False
+            self.sounds = {}
         self._init_ui_elements()
 
         # Game state variables
@@ -78,6 +102,8 @@ class MenuSystem:
 
     def _init_display(self):
         """Initialize display and UI manager"""
+        import pygame_gui
+
         self.manager = pygame_gui.UIManager((self.screen_width, self.screen_height))
 
     def _load_assets(self):
@@ -156,10 +182,10 @@ class MenuSystem:
 
             # Füge ein paar "Sterne" hinzu für einen Weltraum-Effekt
             for _ in range(100):
-                star_x = random.randint(0, self.screen_width)
-                star_y = random.randint(0, self.screen_height)
-                star_size = random.randint(1, 3)
-                brightness = random.randint(150, 255)
+                star_x = self.rng.randint(0, self.screen_width)
+                star_y = self.rng.randint(0, self.screen_height)
+                star_size = self.rng.randint(1, 3)
+                brightness = self.rng.randint(150, 255)
                 pygame.draw.circle(
                     self.background_image,
                     (brightness, brightness, brightness),
@@ -174,6 +200,8 @@ class MenuSystem:
 
     def start_menu_music(self):
         """Startet die Menü-Hintergrundmusik"""
+        if not self.load_assets:
+            return
         try:
             menu_music_path = "assets/sounds/effects/menu_music.mp3"
             if os.path.exists(menu_music_path):
@@ -188,7 +216,8 @@ class MenuSystem:
 
     def stop_menu_music(self):
         """Stoppt die Menü-Musik"""
-        pygame.mixer.music.stop()
+        if self.load_assets:
+            pygame.mixer.music.stop()
 
     def _load_sounds(self):
         """Load all sound effects"""
@@ -442,10 +471,8 @@ class MenuSystem:
         self, surface, text: str, rect: pygame.Rect, hovered: bool, hover_color: str
     ):
         """Draw a button with hover effect"""
-        # Zeichne Button-Hintergrund
-        button_bg = pygame.Surface((rect.width, rect.height))
-        button_bg.set_alpha(150)
-        button_bg.fill(pygame.Color("#333333"))
+        # Zeichne Button-Hintergrund (vorab angelegte Surface aus dem Cache)
+        button_bg = overlay_cache.get_overlay(rect.size, 150, pygame.Color("#333333"))
         surface.blit(button_bg, rect)
 
         # Zeichne Button-Rahmen
@@ -453,7 +480,7 @@ class MenuSystem:
 
         # Zeichne Button-Text
         color = pygame.Color(hover_color) if hovered else pygame.Color("#FFFFFF")
-        text_surface = self.button_font.render(text, True, color)
+        text_surface = overlay_cache.render_text(self.button_font, text, color)
         text_rect = text_surface.get_rect(center=rect.center)
         surface.blit(text_surface, text_rect)
 
@@ -477,9 +504,9 @@ class MenuSystem:
 
         # Dann die Verdunkelung darüber
         if self.darkness_overlay > 0:
-            dark_surface = pygame.Surface((self.screen_width, self.screen_height))
-            dark_surface.fill((0, 0, 0))
-            dark_surface.set_alpha(self.darkness_overlay)
+            dark_surface = overlay_cache.get_overlay(
+                (self.screen_width, self.screen_height), self.darkness_overlay
+            )
             surface.blit(dark_surface, (0, 0))
 
             # # Optional: Zeige einen gruseligen Text während der Verdunkelung
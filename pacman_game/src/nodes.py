@@ -3,94 +3,191 @@ Node System für erweiterte Pathfinding
 Basiert auf dem ursprünglichen node.py Code und spielfeld.py
 """
 
+import numpy as np
 from .constants import GRID_SIZE
 
+# Rand der Nearest-Tabelle um das Maze (Koordinaten im Tunnel außerhalb)
+NEAREST_PADDING = 2
+
+
+# Nachbar-Slots pro Node, indiziert nach Richtung
+SLOT_UP, SLOT_DOWN, SLOT_LEFT, SLOT_RIGHT = range(4)
+DIRECTION_SLOTS = {
+    "up": SLOT_UP,
+    "down": SLOT_DOWN,
+    "left": SLOT_LEFT,
+    "right": SLOT_RIGHT,
+}
+SLOT_OFFSETS = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+
+NO_LINK = -1
+
 
 class Node:
-    def __init__(self, grid_x, grid_y):
+    """
+    Knoten des Maze-Graphen mit fester Nachbar-Tabelle: links[slot] ist der
+    Nachbar in Richtung slot (oder None), tunnel_mask markiert die Slots,
+    deren Nachbar über den Tunnel erreicht wird (Bit 1 << slot)
+    """
+
+    __slots__ = ("grid_x", "grid_y", "px", "py", "index", "links", "tunnel_mask")
+
+    def __init__(self, grid_x, grid_y, index=0):
         self.grid_x = grid_x
         self.grid_y = grid_y
         self.px = grid_x * GRID_SIZE + GRID_SIZE // 2  # Pixel-Koordinaten
         self.py = grid_y * GRID_SIZE + GRID_SIZE // 2
-        self.neighbors = []
+        self.index = index  # Position in der Node-Liste bzw. den Arrays
+        self.links = [None, None, None, None]
+        self.tunnel_mask = 0
 
     def __repr__(self):
         return f"Node({self.grid_x}, {self.grid_y})"
 
-    def get_neighbor_in_direction(self, direction):
-        """Gibt den Nachbar-Node in der angegebenen Richtung zurück (falls vorhanden)"""
-        # Konvertiere String-Richtung in dx, dy
-        dir_vectors = {"up": (0, -1), "down": (0, 1), "left": (-1, 0), "right": (1, 0)}
+    @property
+    def neighbors(self):
+        """
+        Direkt angrenzende Nachbarn ohne Tunnel-Kanten (links, rechts, oben,
+        unten) - wie die alte Liste nach der Prüfung in build_nodes_and_graph,
+        die den Tunnelausgang wieder entfernt hat. Tunnel-Nachbarn liefern
+        links zusammen mit tunnel_mask
+        """
+        return [
+            self.links[slot]
+            for slot in (SLOT_LEFT, SLOT_RIGHT, SLOT_UP, SLOT_DOWN)
+            if self.links[slot] is not None and not self.is_tunnel(slot)
+        ]
+
+    def is_tunnel(self, slot):
+        """Führt der Nachbar in Richtung slot durch den Tunnel?"""
+        return bool(self.tunnel_mask >> slot & 1)
 
-        if direction not in dir_vectors:
+    def get_neighbor_in_direction(self, direction):
+        """
+        Gibt den direkt angrenzenden Nachbar-Node in der angegebenen Richtung
+        zurück (falls vorhanden) - Tunnel-Übergänge behandelt Pac-Man selbst
+        """
+        slot = DIRECTION_SLOTS.get(direction)
+        if slot is None or self.tunnel_mask >> slot & 1:
             return None
-
-        dx, dy = dir_vectors[direction]
-
-        # Suche nach einem Nachbarn in der angegebenen Richtung
-        for neighbor in self.neighbors:
-            # Prüfe, ob der Nachbar in der gewünschten Richtung liegt
-            if (
-                neighbor.grid_x - self.grid_x == dx
-                and neighbor.grid_y - self.grid_y == dy
-            ):
-                return neighbor
-
-        # Kein Nachbar in dieser Richtung gefunden
-        return None
+        return self.links[slot]
+
+
+class NodeMap(dict):
+    """
+    node_map ((x, y) -> Node) mit Nachschlagetabelle für find_nearest_node:
+    für jedes Tile des Maze (auch Wände) plus NEAREST_PADDING Tiles Rand der
+    nächste Node - O(1) statt Suche über alle Nodes
+    """
+
+    def __init__(self, width, height):
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.nearest = None
+
+    def build_nearest_table(self):
+        """Nächsten Node für jedes Tile einmal mit NumPy bestimmen"""
+        pad = NEAREST_PADDING
+        nodes = list(self.values())
+        table_width = self.width + 2 * pad
+        table_height = self.height + 2 * pad
+        self.nearest = [None] * (table_width * table_height)
+        if not nodes:
+            return
+
+        node_x = np.array([n.grid_x for n in nodes], dtype=np.int32)
+        node_y = np.array([n.grid_y for n in nodes], dtype=np.int32)
+        tiles_x = np.arange(-pad, self.width + pad, dtype=np.int32)
+        # Quadrierte x-Abstände jeder Tabellenspalte zu allen Nodes
+        dx2 = (tiles_x[:, None] - node_x) ** 2
+
+        # Zeile für Zeile: Quadrat der euklidischen Distanz - argmin nimmt bei
+        # Gleichstand den ersten Node in node_map-Reihenfolge, genau wie die
+        # lineare Suche in find_nearest_node
+        for row, y in enumerate(range(-pad, self.height + pad)):
+            squared = dx2 + (y - node_y) ** 2
+            start = row * table_width
+            for offset, index in enumerate(squared.argmin(axis=1).tolist()):
+                self.nearest[start + offset] = nodes[index]
+
+    def get_nearest(self, grid_x, grid_y):
+        """Nächster Node aus der Tabelle oder None außerhalb der Tabelle"""
+        x = int(grid_x) + NEAREST_PADDING
+        y = int(grid_y) + NEAREST_PADDING
+        table_width = self.width + 2 * NEAREST_PADDING
+        if self.nearest is None or not (
+            0 <= x < table_width and 0 <= y < self.height + 2 * NEAREST_PADDING
+        ):
+            return None
+        return self.nearest[y * table_width + x]
 
 
 def build_nodes_and_graph(maze):
     """Erstellt Knoten und Graphen aus dem Maze - basierend auf ursprünglichem Code"""
     nodes = []
-    node_map = {}
+    node_map = NodeMap(maze.width, maze.height)
 
     # Erstelle Knoten für alle freien Felder
     for y in range(maze.height):
         for x in range(maze.width):
             if not maze.is_wall(x, y):
-                n = Node(x, y)
+                n = Node(x, y, len(nodes))
                 nodes.append(n)
                 node_map[(x, y)] = n
 
-    # Verbinde Nachbarn nur, wenn beide Weg sind und kein Hindernis dazwischen liegt
+    # Verbinde Nachbarn pro Richtung: direkt angrenzende freie Felder oder
+    # der Tunnelausgang (als Tunnel markiert)
     for n in nodes:
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = n.grid_x + dx, n.grid_y + dy
-
-            # Prüfe auf Tunnel-Teleportation
+        for slot, (dx, dy) in enumerate(SLOT_OFFSETS):
             tunnel_exit = maze.get_tunnel_exit(n.grid_x, n.grid_y, dx, dy)
             if tunnel_exit:
-                tx, ty = tunnel_exit
-                if (tx, ty) in node_map:
-                    n.neighbors.append(node_map[(tx, ty)])
-            # Normale Nachbarverbindung - nur wenn direkt angrenzend und kein Hindernis
-            elif (nx, ny) in node_map:
-                # Prüfe, ob der Weg zwischen den Nodes frei ist
-                # Direkte Nachbarn sind immer erreichbar, wenn beide keine Wände sind
-                n.neighbors.append(node_map[(nx, ny)])
-
-    # Entferne ungültige Verbindungen, die durch Wände führen würden
-    for n in nodes:
-        valid_neighbors = []
-        for neighbor in n.neighbors:
-            # Prüfe, ob direkt benachbart
-            dx = neighbor.grid_x - n.grid_x
-            dy = neighbor.grid_y - n.grid_y
-
-            # Wenn nicht direkt benachbart (dx oder dy > 1),
-            # prüfe ob ein gültiger Pfad existiert
-            if abs(dx) > 1 or abs(dy) > 1:
-                # Prüfe für Tunnel-Verbindungen (die sind auch erlaubt)
-                tunnel_exit = maze.get_tunnel_exit(n.grid_x, n.grid_y, dx, dy)
-                if tunnel_exit and tunnel_exit == (neighbor.grid_x, neighbor.grid_y):
-                    valid_neighbors.append(neighbor)
+                neighbor = node_map.get(tunnel_exit)
+                if neighbor is not None:
+                    n.links[slot] = neighbor
+                    n.tunnel_mask |= 1 << slot
             else:
-                valid_neighbors.append(neighbor)
+                n.links[slot] = node_map.get((n.grid_x + dx, n.grid_y + dy))
 
-        # Ersetze die Nachbarliste mit den gültigen Nachbarn
-        n.neighbors = valid_neighbors
+    node_map.build_nearest_table()
+    return nodes, node_map
 
+
+def graph_to_arrays(nodes):
+    """
+    Der Graph als flache Integer-Arrays (z.B. für Batch-Simulationen oder
+    np.savez): grid_x, grid_y, links (Node-Index pro Slot oder NO_LINK) und
+    tunnel_mask - Node i ist der Eintrag i in allen Arrays
+    """
+    links = np.full((len(nodes), 4), NO_LINK, dtype=np.int32)
+    for n in nodes:
+        for slot, neighbor in enumerate(n.links):
+            if neighbor is not None:
+                links[n.index, slot] = neighbor.index
+    return {
+        "grid_x": np.array([n.grid_x for n in nodes], dtype=np.int32),
+        "grid_y": np.array([n.grid_y for n in nodes], dtype=np.int32),
+        "links": links,
+        "tunnel_mask": np.array([n.tunnel_mask for n in nodes], dtype=np.uint8),
+    }
+
+
+def graph_from_arrays(arrays, width, height):
+    """Baut Nodes und node_map aus den Arrays von graph_to_arrays wieder auf"""
+    nodes = []
+    node_map = NodeMap(width, height)
+    for i, (x, y) in enumerate(
+        zip(arrays["grid_x"].tolist(), arrays["grid_y"].tolist())
+    ):
+        n = Node(x, y, i)
+        nodes.append(n)
+        node_map[(x, y)] = n
+    for n, row, mask in zip(
+        nodes, arrays["links"].tolist(), arrays["tunnel_mask"].tolist()
+    ):
+        n.links = [nodes[i] if i != NO_LINK else None for i in row]
+        n.tunnel_mask = mask
+    node_map.build_nearest_table()
     return nodes, node_map
 
 
@@ -100,7 +197,13 @@ def find_nearest_node(node_map, grid_x, grid_y):
     if (grid_x, grid_y) in node_map:
         return node_map[(grid_x, grid_y)]
 
-    # Wenn nicht, suche nach dem nächstgelegenen Node
+    # Vorberechnete Tabelle (node_map aus build_nodes_and_graph)
+    if isinstance(node_map, NodeMap):
+        nearest = node_map.get_nearest(grid_x, grid_y)
+        if nearest is not None:
+            return nearest
+
+    # Sonst (oder weit außerhalb des Maze) suche nach dem nächstgelegenen Node
     min_distance = float("inf")
     nearest_node = None
 
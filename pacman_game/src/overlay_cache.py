@@ -0,0 +1,53 @@
+"""
+Overlay and Text Cache
+Shared, preallocated surfaces for semi-transparent overlays and rendered texts
+so that pause, game over, victory and menu screens allocate nothing per frame
+"""
+
+import pygame
+
+
+class OverlayCache:
+    """
+    Holds one overlay surface per (size, color) - only the alpha value changes
+    between frames - and the rendered surfaces of texts drawn every frame
+    """
+
+    def __init__(self, max_texts=256):
+        self.overlays = {}
+        self.texts = {}
+        self.max_texts = max_texts
+
+    def get_overlay(self, size, alpha, color=(0, 0, 0)):
+        """Filled overlay surface of the given size with the given alpha"""
+        key = (tuple(size), tuple(color))
+        overlay = self.overlays.get(key)
+        if overlay is None:
+            overlay = pygame.Surface(key[0])
+            if pygame.display.get_surface() is not None:
+                overlay = overlay.convert()
+            overlay.fill(key[1])
+            self.overlays[key] = overlay
+        overlay.set_alpha(alpha)
+        return overlay
+
+    def render_text(self, font, text, color, antialias=True):
+        """Rendered text surface, rendered only the first time it is needed"""
+        key = (font, text, tuple(color), antialias)
+        surface = self.texts.get(key)
+        if surface is None:
+            if len(self.texts) >= self.max_texts:
+                # e.g. many different final scores - simply start over
+                self.texts.clear()
+            surface = font.render(text, antialias, color)
+            self.texts[key] = surface
+        return surface
+
+    def clear(self):
+        """Drop all cached surfaces (e.g. after the screen size changed)"""
+        self.overlays.clear()
+        self.texts.clear()
+
+
+# Shared by Game and MenuSystem
+overlay_cache = OverlayCache()
@@ -0,0 +1,148 @@
+"""
+Path Service
+Shortest paths between two tiles with A* (parent pointers, tunnel aware)
+for short distances and over the junction graph for long ones, with a
+bounded LRU cache that is cleared whenever the maze layout changes
+"""
+
+import heapq
+from collections import OrderedDict
+
+# Maximal gespeicherte (start, goal)-Ergebnisse
+PATH_CACHE_SIZE = 1024
+
+# Ab dieser geschätzten Weglänge sucht Dijkstra über die Kreuzungen
+# (junctions.py) statt A* über alle Tiles - bei langen Wegen 2-3x schneller
+JUNCTION_DISTANCE = 16
+
+# Reihenfolge, in der Nachbarn untersucht werden: UP, LEFT, DOWN, RIGHT
+NEIGHBOR_OFFSETS = [(0, -1), (-1, 0), (0, 1), (1, 0)]
+
+
+class PathService:
+    """
+    A* over the walkable tiles of a maze - the tunnel is one step from one
+    side to the other (Maze.get_tunnel_exit)
+    """
+
+    def __init__(self, maze, cache_size=PATH_CACHE_SIZE):
+        self.maze = maze
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # (start, goal) -> Weg als Tupel
+        self.neighbors = None  # Tile -> begehbare Nachbar-Tiles (bei Bedarf)
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self):
+        """Forget all paths and neighbours (the layout has changed)"""
+        self.cache.clear()
+        self.neighbors = None
+
+    def build_neighbors(self):
+        """Walkable neighbours of every tile including the tunnel exits"""
+        maze = self.maze
+        neighbors = {}
+        for y in range(maze.height):
+            for x in range(maze.width):
+                if maze.is_wall(x, y):
+                    continue
+                tiles = []
+                for dx, dy in NEIGHBOR_OFFSETS:
+                    tile = maze.get_tunnel_exit(x, y, dx, dy) or (x + dx, y + dy)
+                    if not maze.is_wall(*tile):
+                        tiles.append(tile)
+                neighbors[(x, y)] = tiles
+        self.neighbors = neighbors
+
+    def heuristic(self, tile, goal):
+        """Manhattan distance, or the way through the tunnel if shorter"""
+        maze = self.maze
+        x, y = tile
+        goal_x, goal_y = goal
+        direct = abs(x - goal_x) + abs(y - goal_y)
+
+        row = maze.TUNNEL_ROW
+        left = maze.LEFT_TUNNEL_X
+        right = maze.RIGHT_TUNNEL_X
+        through_left = abs(x - left) + abs(y - row) + 1
+        through_left += abs(right - goal_x) + abs(row - goal_y)
+        through_right = abs(x - right) + abs(y - row) + 1
+        through_right += abs(left - goal_x) + abs(row - goal_y)
+        return min(direct, through_left, through_right)
+
+    def find_path(self, start, goal):
+        """Shortest path from start to goal (both included) or [] if none"""
+        key = (int(start[0]), int(start[1])), (int(goal[0]), int(goal[1]))
+        path = self.cache.get(key)
+        if path is not None:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return list(path)
+
+        self.misses += 1
+        path = tuple(self.search(*key))
+        self.cache[key] = path
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)  # Am längsten nicht benutzt
+        return list(path)
+
+    def distance(self, start, goal):
+        """Length of the shortest path in steps or None"""
+        path = self.find_path(start, goal)
+        return len(path) - 1 if path else None
+
+    def search(self, start, goal):
+        """Shortest path as list of tiles - short ones A*, long ones by junctions"""
+        if self.heuristic(start, goal) >= JUNCTION_DISTANCE:
+            return self.search_junctions(start, goal)
+        return self.search_tiles(start, goal)
+
+    def search_junctions(self, start, goal):
+        """Dijkstra over the junction graph of the maze, [] if no path"""
+        node_map = self.maze.node_map
+        start_node = node_map.get(start)
+        goal_node = node_map.get(goal)
+        if start_node is None or goal_node is None:
+            return []
+        return self.maze.get_junction_graph().path(start_node, goal_node)
+
+    def search_tiles(self, start, goal):
+        """A* with parent pointers, returns the path as list of tiles"""
+        if self.neighbors is None:
+            self.build_neighbors()
+        neighbors = self.neighbors
+        if start not in neighbors or goal not in neighbors:
+            return []
+
+        parents = {start: None}
+        cost = {start: 0}
+        # (geschätzte Gesamtlänge, Reihenfolge, Tile) - Reihenfolge macht den
+        # Heap bei Gleichstand stabil
+        queue = [(self.heuristic(start, goal), 0, start)]
+        order = 0
+        closed = set()
+        while queue:
+            _, _, tile = heapq.heappop(queue)
+            if tile == goal:
+                break
+            if tile in closed:
+                continue
+            closed.add(tile)
+            steps = cost[tile] + 1
+            for neighbor in neighbors[tile]:
+                if steps < cost.get(neighbor, steps + 1):
+                    cost[neighbor] = steps
+                    parents[neighbor] = tile
+                    order += 1
+                    estimate = steps + self.heuristic(neighbor, goal)
+                    heapq.heappush(queue, (estimate, order, neighbor))
+        else:
+            return []
+
+        path = []
+        tile = goal
+        while tile is not None:
+            path.append(tile)
+            tile = parents[tile]
+        path.reverse()
+        return path
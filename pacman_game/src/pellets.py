@@ -71,6 +71,13 @@ class Pellet:
         """Get points value for this pellet"""
         return self.points
 
+    def get_draw_rect(self):
+        """Screen area covered by draw() (incl. power pellet glow)"""
+        half = LARGE_PELLET_SIZE + 6 if self.is_power_pellet else self.radius + 1
+        pixel_x = self.x * GRID_SIZE + GRID_SIZE // 2
+        pixel_y = self.y * GRID_SIZE + GRID_SIZE // 2
+        return pygame.Rect(pixel_x - half, pixel_y - half, half * 2, half * 2)
+
     def respawn(self, new_position=None):
         """Respawn power pellet at new position"""
         if self.is_power_pellet and new_position:
@@ -143,11 +150,30 @@ class SpecialPellet:
         """Get points value for this pellet"""
         return self.points
 
+    def get_draw_rect(self):
+        """Screen area covered by draw() (incl. glow rings)"""
+        half = self.radius + 9
+        pixel_x = self.x * GRID_SIZE + GRID_SIZE // 2
+        pixel_y = self.y * GRID_SIZE + GRID_SIZE // 2
+        return pygame.Rect(pixel_x - half, pixel_y - half, half * 2, half * 2)
+
 
 class PelletManager:
-    def __init__(self, maze):
+    def __init__(self, maze, rng=None):
         self.maze = maze
+        # Zufallsgenerator für das Spawnen (z.B. das geseedete random.Random des Spiels)
+        self.rng = rng if rng is not None else random
         self.pellets = []
+        # Grid-Index über alle Tiles (Index = y * Breite + x) für O(1)-Zugriffe:
+        # pellet_grid enthält 1 für jedes noch nicht gefressene normale Pellet,
+        # pellet_lookup das zugehörige Pellet-Objekt (oder None)
+        self.pellet_grid = bytearray(maze.width * maze.height)
+        self.pellet_lookup = [None] * (maze.width * maze.height)
+        self.remaining = 0
+        # Bildschirmbereiche von gefressenen Pellets (für Dirty-Rect-Rendering)
+        self.changed_rects = []
+        # Vorgerenderte Ebene: Maze-Hintergrund + alle kleinen Pellets
+        self.layer = None
         self.power_pellet_positions = []  # Mögliche Power Pellet Positionen
         self.active_power_pellets = []  # Liste aktiver Power Pellets (max 2)
         self.active_speed_pellet = None  # Nur EIN Speed Pellet
@@ -160,6 +186,11 @@ class PelletManager:
     def reset(self):
         """Reset all pellets"""
         self.pellets = []
+        self.changed_rects = []
+        self.layer = None  # Wird beim nächsten draw() neu aufgebaut
+        self.pellet_grid = bytearray(self.maze.width * self.maze.height)
+        self.pellet_lookup = [None] * (self.maze.width * self.maze.height)
+        self.remaining = 0
         self.power_pellet_timer = 0
         self.speed_pellet_timer = 0
         self.active_power_pellets = []
@@ -193,12 +224,15 @@ class PelletManager:
                     # Power Pellets werden separat gehandhabt
                     pellet = Pellet(x, y, False)
                     self.pellets.append(pellet)
+                    index = y * self.maze.width + x
+                    self.pellet_grid[index] = 1
+                    self.pellet_lookup[index] = pellet
+                    self.remaining += 1
 
     def update(self):
-        """Update all pellets and spawn special pellets"""
-        # Update normale Pellets
-        for pellet in self.pellets:
-            pellet.update()
+        """Animate the special pellets and spawn new ones"""
+        # Normale Pellets sind nicht animiert (Pellet.update tut für sie nichts),
+        # nur die aktiven Power- und Speed-Pellets werden aktualisiert
 
         # Power Pellet spawn logic (max 2)
         if len(self.active_power_pellets) < 2:
@@ -240,7 +274,7 @@ class PelletManager:
 
         if available_positions:
             # Wähle eine zufällige freie Position
-            position = random.choice(available_positions)
+            position = self.rng.choice(available_positions)
 
             # Erstelle das Power Pellet
             power_pellet = Pellet(position[0], position[1], True)
@@ -252,7 +286,7 @@ class PelletManager:
             # Reset timer
             self.power_pellet_timer = 0
             # Nächstes Pellet nach 5-8 Sekunden
-            self.power_pellet_spawn_delay = random.randint(300, 480)
+            self.power_pellet_spawn_delay = self.rng.randint(300, 480)
 
     def spawn_speed_pellet(self):
         """Spawn a speed pellet at available position"""
@@ -267,7 +301,7 @@ class PelletManager:
         ]
 
         if available_positions:
-            position = random.choice(available_positions)
+            position = self.rng.choice(available_positions)
 
             # Erstelle Speed Pellet als SpecialPellet
             self.active_speed_pellet = SpecialPellet(position[0], position[1], "speed")
@@ -275,22 +309,60 @@ class PelletManager:
             # Reset timer
             self.speed_pellet_timer = 0
             # Nächstes nach 10-15 Sekunden
-            self.speed_pellet_spawn_delay = random.randint(600, 900)
+            self.speed_pellet_spawn_delay = self.rng.randint(600, 900)
 
     def draw(self, screen):
-        """Draw all pellets"""
-        # Zeichne normale Pellets
-        for pellet in self.pellets:
+        """
+        Draw the maze background with all small pellets (one cached blit)
+        and the animated power and speed pellets on top
+        """
+        screen.blit(self.get_layer(), (0, 0))
+
+        for pellet in self.get_special_pellets():
             pellet.draw(screen)
 
-        # Zeichne aktive Power Pellets
-        for pellet in self.active_power_pellets:
-            if not pellet.collected:
+    def draw_region(self, screen, rect):
+        """Redraw background, pellets and animated pellets only inside rect"""
+        screen.blit(self.get_layer(), rect.topleft, rect)
+
+        for pellet in self.get_special_pellets():
+            if pellet.get_draw_rect().colliderect(rect):
                 pellet.draw(screen)
 
-        # Zeichne Speed Pellet
+    def get_layer(self):
+        """Cached surface with the maze background and all uneaten small pellets"""
+        if self.layer is None:
+            size = (self.maze.width * GRID_SIZE, self.maze.height * GRID_SIZE)
+            layer = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()  # Display-Format für schnelles Blitten
+            layer.fill(BLACK)
+            self.maze.draw(layer)
+            for pellet in self.pellets:
+                pellet.draw(layer)
+            self.layer = layer
+        return self.layer
+
+    def erase_from_layer(self, pellet):
+        """Entfernt ein gefressenes Pellet aus der Ebene (nur dieses Tile)"""
+        if self.layer is not None:
+            rect = pellet.get_draw_rect()
+            self.layer.set_clip(rect)
+            self.maze.draw_region(self.layer, rect)
+            self.layer.set_clip(None)
+
+    def get_special_pellets(self):
+        """Active (animated) power and speed pellets"""
+        specials = [p for p in self.active_power_pellets if not p.collected]
         if self.active_speed_pellet and not self.active_speed_pellet.collected:
-            self.active_speed_pellet.draw(screen)
+            specials.append(self.active_speed_pellet)
+        return specials
+
+    def pop_changed_rects(self):
+        """Return and clear the screen areas of pellets eaten since the last call"""
+        rects = self.changed_rects
+        self.changed_rects = []
+        return rects
 
     def check_collection(self, pacman):
         """Check if Pac-Man collected any pellets"""
@@ -315,14 +387,15 @@ class PelletManager:
             ),
         ]
 
-        # Prüfe normale Pellets
-        for pellet in self.pellets:
-            if not pellet.collected and pellet.spawned:
-                for check_x, check_y in positions_to_check:
-                    if pellet.grid_x == check_x and pellet.grid_y == check_y:
-                        pellet.collected = True
-                        total_points += pellet.get_points()
-                        break  # Aus der inner loop ausbrechen
+        # Prüfe normale Pellets - direkter Zugriff über den Grid-Index
+        width = self.maze.width
+        height = self.maze.height
+        pellet_grid = self.pellet_grid
+        for check_x, check_y in positions_to_check:
+            if 0 <= check_x < width and 0 <= check_y < height:
+                index = check_y * width + check_x
+                if pellet_grid[index]:
+                    total_points += self._collect_index(index)
 
         # Prüfe Power Pellets
         for pellet in self.active_power_pellets[:]:  # Copy list for safe removal
@@ -336,7 +409,7 @@ class PelletManager:
                         self.active_power_pellets.remove(pellet)
                         # Reset timer für nächstes
                         self.power_pellet_timer = 0
-                        self.power_pellet_spawn_delay = random.randint(
+                        self.power_pellet_spawn_delay = self.rng.randint(
                             360, 600
                         )  # 6-10 Sekunden
                         break
@@ -354,7 +427,7 @@ class PelletManager:
                     # Reset für nächstes Speed Pellet
                     self.active_speed_pellet = None
                     self.speed_pellet_timer = 0
-                    self.speed_pellet_spawn_delay = random.randint(
+                    self.speed_pellet_spawn_delay = self.rng.randint(
                         720, 900
                     )  # 12-15 Sekunden
                     break
@@ -378,43 +451,32 @@ class PelletManager:
 
     def all_collected(self):
         """Check if all pellets have been collected"""
-        for pellet in self.pellets:
-            if not pellet.collected and not pellet.is_power_pellet:
-                return False
-        # Prüfe auch ob noch nicht-gespawnte normale Pellets existieren
-        for pellet in self.pellets:
-            if (
-                not pellet.collected
-                and not pellet.is_power_pellet
-                and not pellet.spawned
-            ):
-                return False
-        return True
+        return self.remaining == 0
 
     def get_remaining_count(self):
         """Get count of remaining pellets (nur normale Pellets)"""
-        count = 0
-        for pellet in self.pellets:
-            if not pellet.collected and not pellet.is_power_pellet:
-                count += 1
-        return count
+        return self.remaining
 
     def get_pellet_at(self, x, y):
         """Get pellet at specific grid position"""
-        for pellet in self.pellets:
-            if (
-                pellet.grid_x == x
-                and pellet.grid_y == y
-                and not pellet.collected
-                and pellet.spawned
-            ):
-                return pellet
+        if 0 <= x < self.maze.width and 0 <= y < self.maze.height:
+            index = y * self.maze.width + x
+            if self.pellet_grid[index]:
+                return self.pellet_lookup[index]
         return None
 
     def collect_pellet_at(self, x, y):
         """Manually collect pellet at position"""
-        pellet = self.get_pellet_at(x, y)
-        if pellet:
-            pellet.collected = True
-            return pellet.get_points()
+        if self.get_pellet_at(x, y):
+            return self._collect_index(y * self.maze.width + x)
         return 0
+
+    def _collect_index(self, index):
+        """Markiert das Pellet am Grid-Index als gefressen und gibt die Punkte zurück"""
+        pellet = self.pellet_lookup[index]
+        self.pellet_grid[index] = 0
+        self.remaining -= 1
+        pellet.collected = True
+        self.erase_from_layer(pellet)
+        self.changed_rects.append(pellet.get_draw_rect())
+        return pellet.get_points()
@@ -8,9 +8,139 @@ import math
 from .constants import *
 from .nodes import find_nearest_node, find_node_by_grid
 
+# Pulsieren des Speed-Boost-Rings pro Timer-Wert (vorberechnet statt sin pro Frame)
+BOOST_PULSE = [int(math.sin(timer * 0.1) * 3) for timer in range(361)]
+
+# Mundwinkel (Start, Ende) pro Blickrichtung
+MOUTH_ANGLES = {
+    "right": (45, 315),
+    "left": (225, 135),
+    "up": (315, 225),
+    "down": (135, 45),
+}
+
+_sprite_cache = {}
+
+# Todesanimation: 12 Frames à 45x45 Pixel, Pac-Man selbst ist darin 39 Pixel groß
+DEATH_SPRITE_PATH = "assets/images/maze/Teil_017_pacman_die.png"
+DEATH_FRAME_COUNT = 12
+DEATH_FRAME_SIZE = 45
+DEATH_SPRITE_SCALE = PACMAN_SIZE / 39
+
+_death_frames = None
+
+
+def build_pacman_sprites(size):
+    """
+    Rendert alle Pacman-Frames einmal vor: pro Richtung mit offenem Mund und
+    geschlossen, jeweils in normaler Farbe und mit Speed Boost, dazu die
+    Ringe für den Speed-Boost-Effekt. Ergebnis wird pro Größe gecacht.
+    """
+    if size in _sprite_cache:
+        return _sprite_cache[size]
+
+    radius = int(size / 2)
+    half = radius + 2  # Platz für den 2 Pixel breiten Umriss
+    sprites = {}
+
+    for boosted in (False, True):
+        color = CYAN if boosted else YELLOW
+
+        for direction, (start_angle, end_angle) in MOUTH_ANGLES.items():
+            # Pac-Man als Kreissegment, Mittelpunkt in der Mitte der Surface
+            points = [(half, half)]
+            if start_angle > end_angle:
+                # Über 0 Grad hinweg
+                angles = list(range(start_angle, 360, 5))
+                angles += list(range(0, end_angle + 1, 5))
+            else:
+                angles = list(range(start_angle, end_angle + 1, 5))
+            for angle in angles:
+                rad = math.radians(angle)
+                x = half + int(size / 2 * math.cos(rad))
+                y = half + int(size / 2 * math.sin(rad))
+                points.append((x, y))
+            points.append((half, half))
+
+            sprite = _new_sprite_surface(half)
+            pygame.draw.polygon(sprite, color, points)
+            # Umriss für bessere Sichtbarkeit
+            pygame.draw.polygon(sprite, color, points, 2)
+            sprites[(direction, boosted)] = sprite
+
+        # Mund geschlossen - voller Kreis
+        sprite = _new_sprite_surface(half)
+        pygame.draw.circle(sprite, color, (half, half), radius)
+        pygame.draw.circle(sprite, color, (half, half), radius, 2)
+        sprites[("closed", boosted)] = sprite
+
+    for pulse in set(BOOST_PULSE) | {-3, 3}:
+        ring_radius = radius + 5 + pulse
+        sprite = _new_sprite_surface(ring_radius + 1)
+        pygame.draw.circle(
+            sprite, (150, 255, 255), (ring_radius + 1, ring_radius + 1), ring_radius, 1
+        )
+        sprites[("ring", pulse)] = sprite
+
+    _sprite_cache[size] = sprites
+    return sprites
+
+
+def _new_sprite_surface(half):
+    """Transparente Surface mit Kantenlänge 2 * half"""
+    surface = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+
+def build_death_frames():
+    """
+    Lädt die Frames der Todesanimation einmal, skaliert auf Pac-Man-Größe.
+    Fehlt das Bild, wird ein sich öffnender Pac-Man selbst gezeichnet.
+    """
+    global _death_frames
+    if _death_frames is not None:
+        return _death_frames
+
+    size = round(DEATH_FRAME_SIZE * DEATH_SPRITE_SCALE)
+    try:
+        sheet = pygame.image.load(DEATH_SPRITE_PATH)
+        if pygame.display.get_surface() is not None:
+            sheet = sheet.convert_alpha()
+        frames = []
+        for i in range(DEATH_FRAME_COUNT):
+            frame = sheet.subsurface(
+                (i * DEATH_FRAME_SIZE, 0, DEATH_FRAME_SIZE, DEATH_FRAME_SIZE)
+            )
+            frames.append(pygame.transform.smoothscale(frame, (size, size)))
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"Konnte Todesanimation nicht laden, zeichne sie selbst: {e}")
+        frames = []
+        half = size // 2
+        for i in range(DEATH_FRAME_COUNT):
+            # Mund öffnet sich von oben, bis Pac-Man ganz verschwunden ist
+            opening = 360 * (i + 1) // DEATH_FRAME_COUNT
+            frame = _new_sprite_surface(half)
+            points = [(half, half)]
+            for angle in range(270 + opening // 2, 270 + 360 - opening // 2 + 1, 5):
+                rad = math.radians(angle)
+                points.append(
+                    (
+                        half + int(PACMAN_SIZE / 2 * math.cos(rad)),
+                        half + int(PACMAN_SIZE / 2 * math.sin(rad)),
+                    )
+                )
+            if len(points) > 2:
+                pygame.draw.polygon(frame, YELLOW, points)
+            frames.append(frame)
+
+    _death_frames = frames
+    return frames
+
 
 class Pacman:
-    def __init__(self, start_x, start_y):
+    def __init__(self, start_x, start_y, load_assets=True):
         self.start_x = start_x
         self.start_y = start_y
 
@@ -58,7 +188,16 @@ class Pacman:
         self.is_moving = False
         self.is_eating = False  # NEU: Flag für das Essen von Pellets
 
-        # Sprite laden
+        # Sprite laden (nicht im Headless-Modus)
+        self.sprite_sheet = None
+        self.sprite_loaded = False
+        self.sprites = None  # Vorgerenderte Frames, siehe build_pacman_sprites
+        if load_assets:
+            self.load_sprite()
+            self.sprites = build_pacman_sprites(self.size)
+
+    def load_sprite(self):
+        """Lädt das Pacman-Tileset"""
         try:
             self.sprite_sheet = pygame.image.load(
                 "assets/images/maze/Teil_017_Pacman_Tileset.png"
@@ -249,85 +388,51 @@ class Pacman:
         self.is_eating = eating
 
     def draw(self, screen):
-        """Zeichnet Pacman"""
+        """Zeichnet Pacman - ein einzelner Blit aus dem Sprite-Cache"""
+        if self.sprites is None:
+            self.sprites = build_pacman_sprites(self.size)
+
         # Berechne den Mittelpunkt
         center_x = int(self.x + self.size / 2)
         center_y = int(self.y + self.size / 2)
 
-        # Wähle Farbe basierend auf Speed Boost
-        color = CYAN if self.speed_boost_active else YELLOW
-
+        # Mund offen nur in Bewegung, sonst geschlossener Kreis
         if self.mouth_open and self.is_moving:
-            # Mund offen - Pac-Man Form
-            # Winkel basierend auf Richtung
-            if self.current_direction == "right":
-                start_angle = 45
-                end_angle = 315
-            elif self.current_direction == "left":
-                start_angle = 225
-                end_angle = 135
-            elif self.current_direction == "up":
-                start_angle = 315
-                end_angle = 225
-            elif self.current_direction == "down":
-                start_angle = 135
-                end_angle = 45
-            else:
-                # Fallback wenn keine Richtung
-                start_angle = 45
-                end_angle = 315
+            mouth = self.current_direction or "right"
+        else:
+            mouth = "closed"
 
-            # Zeichne Pac-Man als Kreissegment
-            # Erstelle Punkte für den Pac-Man
-            points = [(center_x, center_y)]
+        sprite = self.sprites[(mouth, self.speed_boost_active)]
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (center_x - half, center_y - half))
 
-            # Berechne die Punkte entlang des Kreisbogens
-            # Gehe in die richtige Richtung (im oder gegen Uhrzeigersinn)
-            if start_angle > end_angle:
-                # Über 0 Grad hinweg
-                for angle in range(start_angle, 360, 5):
-                    rad = math.radians(angle)
-                    x = center_x + int(self.size / 2 * math.cos(rad))
-                    y = center_y + int(self.size / 2 * math.sin(rad))
-                    points.append((x, y))
-                for angle in range(0, end_angle + 1, 5):
-                    rad = math.radians(angle)
-                    x = center_x + int(self.size / 2 * math.cos(rad))
-                    y = center_y + int(self.size / 2 * math.sin(rad))
-                    points.append((x, y))
+        # Speed boost visual effect - pulsierender Ring um Pac-Man
+        if self.speed_boost_active:
+            timer = self.speed_boost_timer
+            if 0 <= timer < len(BOOST_PULSE):
+                pulse = BOOST_PULSE[timer]
             else:
-                # Normaler Bogen
-                for angle in range(start_angle, end_angle + 1, 5):
-                    rad = math.radians(angle)
-                    x = center_x + int(self.size / 2 * math.cos(rad))
-                    y = center_y + int(self.size / 2 * math.sin(rad))
-                    points.append((x, y))
-
-            # Schließe die Form
-            points.append((center_x, center_y))
-
-            if len(points) > 2:
-                pygame.draw.polygon(screen, color, points)
-                # Zeichne Umriss für bessere Sichtbarkeit
-                pygame.draw.polygon(screen, color, points, 2)
-        else:
-            # Mund geschlossen - voller Kreis
-            pygame.draw.circle(screen, color, (center_x, center_y), int(self.size / 2))
-            pygame.draw.circle(
-                screen, color, (center_x, center_y), int(self.size / 2), 2
-            )
+                pulse = int(math.sin(timer * 0.1) * 3)
+            ring = self.sprites[("ring", pulse)]
+            half = ring.get_width() // 2
+            screen.blit(ring, (center_x - half, center_y - half))
+
+    def draw_dying(self, screen, progress):
+        """Zeichnet die Todesanimation, progress von 0 (Start) bis 1 (Ende)"""
+        frames = build_death_frames()
+        index = min(int(progress * len(frames)), len(frames) - 1)
+        sprite = frames[index]
+        center_x = int(self.x + self.size / 2)
+        center_y = int(self.y + self.size / 2)
+        half = sprite.get_width() // 2
+        screen.blit(sprite, (center_x - half, center_y - half))
 
-        # Speed boost visual effect
-        if self.speed_boost_active:
-            # Zeichne einen pulsierenden Ring um Pac-Man
-            pulse = int(math.sin(self.speed_boost_timer * 0.1) * 3)
-            pygame.draw.circle(
-                screen,
-                (150, 255, 255),
-                (center_x, center_y),
-                int(self.size / 2) + 5 + pulse,
-                1,
-            )
+    def get_draw_rect(self):
+        """Bereich, den draw() auf dem Bildschirm belegt (inklusive Speed-Ring)"""
+        center_x = int(self.x + self.size / 2)
+        center_y = int(self.y + self.size / 2)
+        half = int(self.size / 2) + 10
+        return pygame.Rect(center_x - half, center_y - half, half * 2, half * 2)
 
     def reset(self, start_x=None, start_y=None):
         """Setzt Pacman auf die Startposition zurück"""
@@ -0,0 +1,237 @@
+"""
+Frame Profiler
+Opt-in timing of the game subsystems (update and draw calls) per frame,
+kept in a fixed-size ring buffer with an on-screen graph and CSV/JSON export
+"""
+
+import csv
+import json
+import time
+import numpy as np
+import pygame
+from .constants import *
+
+PROFILER_PERCENTILES = (50, 95, 99)
+PROFILER_PANEL_WIDTH = 240
+PROFILER_GRAPH_HEIGHT = 60
+PROFILER_LINE_HEIGHT = 14
+
+
+class FrameProfiler:
+    """
+    Measures the game subsystems with time.perf_counter_ns
+    One frame = one Game.update() plus the following Game.draw(),
+    the last `capacity` frames are kept (older frames are overwritten)
+    """
+
+    def __init__(self, capacity=FPS * 10):
+        self.capacity = capacity
+        self.sections = []
+        self.samples = None  # (capacity, sections) in nanoseconds
+        self.current = []  # Sections of the running frame
+        self.frame_count = 0  # Completed frames in total
+
+        # On-screen graph (toggled with F3)
+        self.overlay_visible = False
+        self.overlay_refresh = FPS // 4  # Rebuild the panel every N frames
+        self.overlay_surface = None
+        self.overlay_frame = -1
+        self.font = None
+
+    # ------------------------------------------------------------------
+    # Instrumentation
+    # ------------------------------------------------------------------
+
+    def instrument(self, game, draw=True):
+        """
+        Wrap the update and draw calls of a Game and all its components
+        draw=False (headless) leaves out the draw sections - they never run
+        """
+        self.wrap(game, "update", "update", starts_frame=True)
+        self.wrap(game.pacman, "update", "pacman")
+        # Geister-KI in den Phasen von GhostSquad.update
+        self.wrap(game.ghost_squad, "update_modes", "ghost_modes")
+        self.wrap(game.ghost_squad, "set_targets", "ghost_targets")
+        self.wrap(game.ghost_squad, "move", "ghost_moves")
+        self.wrap(game.pellet_manager, "update", "pellets")
+        self.wrap(game.pellet_manager, "check_collection", "collection")
+        self.wrap(game, "check_ghost_collisions", "collisions")
+
+        if draw:
+            self.wrap(game, "draw", "draw")
+            self.wrap(game.pellet_manager, "draw", "draw_pellets")
+            self.wrap(game.pellet_manager, "draw_region", "draw_pellets")
+            self.wrap(game.pacman, "draw", "draw_pacman")
+            for ghost in game.ghosts:
+                self.wrap(ghost, "draw", f"draw_{ghost.name}")
+            self.wrap(game, "draw_ui", "draw_ui")
+
+        self.samples = np.zeros((self.capacity, len(self.sections)), dtype=np.int64)
+        self.current = [0] * len(self.sections)
+
+    def wrap(self, owner, method_name, section, starts_frame=False):
+        """Replace owner.method_name by a timed version (only on this instance)"""
+        if section not in self.sections:
+            self.sections.append(section)
+        index = self.sections.index(section)
+        method = getattr(owner, method_name)
+        clock = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            if starts_frame:
+                self.next_frame()
+            start = clock()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.current[index] += clock() - start
+
+        setattr(owner, method_name, timed)
+
+    def next_frame(self):
+        """Store the running frame in the ring buffer and start a new one"""
+        current = self.current
+        if any(current):
+            self.samples[self.frame_count % self.capacity] = current
+            self.frame_count += 1
+            for i in range(len(current)):
+                current[i] = 0
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def get_samples(self, frames=None):
+        """The last `frames` stored frames (oldest first) as a NumPy array"""
+        count = min(self.frame_count, self.capacity)
+        if frames is not None:
+            count = min(count, frames)
+        if self.samples is None or count == 0:
+            return np.zeros((0, len(self.sections)), dtype=np.int64)
+        end = self.frame_count % self.capacity
+        order = (np.arange(end - count, end)) % self.capacity
+        return self.samples[order]
+
+    def get_frame_times(self, frames=None):
+        """Update + draw time of each stored frame in nanoseconds"""
+        samples = self.get_samples(frames)
+        columns = [
+            self.sections.index(name)
+            for name in ("update", "draw")
+            if name in self.sections
+        ]
+        return samples[:, columns].sum(axis=1)
+
+    def get_percentiles(self, frames=None):
+        """{section: (p50, p95, p99)} in milliseconds"""
+        samples = self.get_samples(frames)
+        if len(samples) == 0:
+            return {}
+        values = np.percentile(samples, PROFILER_PERCENTILES, axis=0) / 1e6
+        return {
+            name: tuple(float(v) for v in values[:, i])
+            for i, name in enumerate(self.sections)
+        }
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def export(self, path, frames=None):
+        """Write the last `frames` frames to path (.json, everything else CSV)"""
+        if path.lower().endswith(".json"):
+            self.export_json(path, frames)
+        else:
+            self.export_csv(path, frames)
+
+    def export_csv(self, path, frames=None):
+        """One row per frame, one column per section (nanoseconds)"""
+        samples = self.get_samples(frames)
+        first_frame = self.frame_count - len(samples)
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["frame"] + self.sections)
+            for i, row in enumerate(samples.tolist()):
+                writer.writerow([first_frame + i] + row)
+
+    def export_json(self, path, frames=None):
+        """Samples plus percentiles of the exported frames"""
+        samples = self.get_samples(frames)
+        data = {
+            "sections": self.sections,
+            "first_frame": self.frame_count - len(samples),
+            "samples_ns": samples.tolist(),
+            "percentiles_ms": {
+                name: dict(zip((f"p{p}" for p in PROFILER_PERCENTILES), values))
+                for name, values in self.get_percentiles(frames).items()
+            },
+        }
+        with open(path, "w") as file:
+            json.dump(data, file, indent=2)
+
+    # ------------------------------------------------------------------
+    # On-screen graph
+    # ------------------------------------------------------------------
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen graph"""
+        self.overlay_visible = not self.overlay_visible
+        self.overlay_surface = None
+
+    def get_overlay_rect(self):
+        """Screen area covered by the graph"""
+        height = (
+            PROFILER_LINE_HEIGHT * (len(self.sections) + 2) + PROFILER_GRAPH_HEIGHT + 10
+        )
+        return pygame.Rect(0, 0, PROFILER_PANEL_WIDTH, height)
+
+    def draw_overlay(self, screen):
+        """Draw the graph (the panel is only rebuilt every few frames)"""
+        if (
+            self.overlay_surface is None
+            or self.frame_count - self.overlay_frame >= self.overlay_refresh
+        ):
+            self.overlay_surface = self.build_overlay_surface()
+            self.overlay_frame = self.frame_count
+        screen.blit(self.overlay_surface, (0, 0))
+
+    def build_overlay_surface(self):
+        """Percentile table of all sections and the frame time graph"""
+        if self.font is None:
+            self.font = pygame.font.Font(None, 18)
+        rect = self.get_overlay_rect()
+        panel = pygame.Surface(rect.size)
+        panel.fill((10, 10, 30))
+        pygame.draw.rect(panel, (50, 50, 100), panel.get_rect(), 1)
+
+        header = "section        p50    p95    p99 ms"
+        panel.blit(self.font.render(header, True, WHITE), (5, 4))
+        y = 4 + PROFILER_LINE_HEIGHT
+        for name, values in self.get_percentiles().items():
+            panel.blit(self.font.render(name, True, WHITE), (5, y))
+            for column, value in enumerate(values):
+                text = self.font.render(f"{value:6.2f}", True, WHITE)
+                panel.blit(text, text.get_rect(right=130 + column * 45, y=y))
+            y += PROFILER_LINE_HEIGHT
+
+        # Frame time graph, the yellow line marks the budget of one frame
+        graph = pygame.Rect(5, y + 6, rect.width - 10, PROFILER_GRAPH_HEIGHT)
+        pygame.draw.rect(panel, BLACK, graph)
+        budget_ms = 1000 / FPS
+        scale = graph.height / (budget_ms * 2)
+        budget_y = graph.bottom - int(budget_ms * scale)
+        pygame.draw.line(panel, YELLOW, (graph.left, budget_y), (graph.right, budget_y))
+
+        frame_times = self.get_frame_times(graph.width) / 1e6
+        points = [
+            (
+                graph.left + i,
+                max(graph.top, graph.bottom - int(value * scale)),
+            )
+            for i, value in enumerate(frame_times)
+        ]
+        if len(points) > 1:
+            pygame.draw.lines(panel, GREEN, False, points)
+
+        panel.set_alpha(210)
+        return panel
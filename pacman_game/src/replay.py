@@ -0,0 +1,128 @@
+"""
+Replays
+Records the seed and the direction inputs of a game per logical frame and
+plays them back headless as fast as possible - with the same seed and the
+same inputs the game ends in exactly the same state.
+A state digest per frame (see state_hash.py) shows where playback diverges
+"""
+
+import json
+from .constants import *
+from .state_hash import state_digest
+
+REPLAY_VERSION = 3
+
+# Gespeicherter Anteil des State-Digests pro Frame (in Bytes)
+REPLAY_HASH_SIZE = 4
+
+# Kompakte Schreibweise der Richtungen in der Replay-Datei
+DIRECTION_LETTERS = {UP: "U", DOWN: "D", LEFT: "L", RIGHT: "R", STOP: "S"}
+LETTER_DIRECTIONS = {letter: d for d, letter in DIRECTION_LETTERS.items()}
+
+
+def game_summary(game):
+    """
+    End state of a game that a replay has to reproduce - a game that ends
+    during the death animation counts as already resolved (headless playback
+    has no animation, score and lives are final when it starts)
+    """
+    state = game.state
+    if state == DYING:
+        state = PLAYING if game.lives > 0 else GAME_OVER
+    return {"score": game.score, "lives": game.lives, "state": state}
+
+
+class ReplayRecorder:
+    """Collects the inputs of one game (started with Game.start_game)"""
+
+    def __init__(self, seed, hash_interval=1):
+        self.seed = seed
+        self.inputs = []  # [frame, letter] - frame = updates before the input
+        # State-Digest nach jedem hash_interval-ten Frame
+        self.hash_interval = hash_interval
+        self.hashes = bytearray()
+
+    def record(self, frame, direction):
+        """Remember a direction input given before update number `frame`"""
+        self.inputs.append([frame, DIRECTION_LETTERS[direction]])
+
+    def record_state(self, game):
+        """Store the state digest after update number game.frame (if due)"""
+        if game.frame % self.hash_interval == 0:
+            self.hashes += state_digest(game, REPLAY_HASH_SIZE)
+
+    def to_dict(self, game):
+        """Replay data including the frame count and end state of the game"""
+        return {
+            "version": REPLAY_VERSION,
+            "seed": self.seed,
+            "frames": game.frame,
+            "inputs": self.inputs,
+            "hash_interval": self.hash_interval,
+            "hashes": self.hashes.hex(),
+            "final": game_summary(game),
+        }
+
+    def save(self, path, game):
+        """Write the replay as compact JSON"""
+        with open(path, "w") as file:
+            json.dump(self.to_dict(game), file, separators=(",", ":"))
+
+
+def load_replay(path):
+    """Read a replay file written by ReplayRecorder.save"""
+    with open(path) as file:
+        replay = json.load(file)
+    if replay.get("version") != REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version: {replay.get('version')}")
+    return replay
+
+
+class ReplayPlayer:
+    """Re-runs a replay headless without frame limiter"""
+
+    def __init__(self, replay):
+        self.replay = replay
+        self.first_divergence = None  # Erster Frame mit anderem State-Digest
+
+    def run(self, game=None):
+        """Play the replay and return the game in its final state"""
+        if game is None:
+            from .game import Game
+
+            game = Game(None, headless=True)
+        game.start_game(self.replay["seed"])
+        interval = self.replay["hash_interval"]
+        game.replay.hash_interval = interval
+        expected = bytes.fromhex(self.replay["hashes"])
+        self.first_divergence = None
+
+        inputs = self.replay["inputs"]
+        next_input = 0
+        # Ohne schnellen Vorlauf läuft die Todesanimation mit (DYING), erst
+        # danach geht es mit dem nächsten Frame der Aufnahme weiter
+        while game.frame < self.replay["frames"] and game.state in (PLAYING, DYING):
+            while (
+                game.state == PLAYING
+                and next_input < len(inputs)
+                and inputs[next_input][0] == game.frame
+            ):
+                game.set_pacman_direction(LETTER_DIRECTIONS[inputs[next_input][1]])
+                next_input += 1
+            recorded = len(game.replay.hashes)
+            game.update()
+
+            # Neuen Digest mit der Aufzeichnung vergleichen - endet die Aufnahme
+            # in der Todesanimation, fehlt der Digest des letzten Frames
+            end = len(game.replay.hashes)
+            if self.first_divergence is None and recorded < end <= len(expected):
+                start = end - REPLAY_HASH_SIZE
+                if game.replay.hashes[start:end] != expected[start:end]:
+                    self.first_divergence = game.frame
+        return game
+
+    def verify(self, game=None):
+        """Play the replay, returns (identical states and end state?, game)"""
+        game = self.run(game)
+        identical = game_summary(game) == self.replay["final"]
+        return identical and self.first_divergence is None, game
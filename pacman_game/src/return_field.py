@@ -0,0 +1,134 @@
+"""
+Return Field
+Direction field that leads eaten ghosts home: for every walkable tile the
+first step of the shortest way to the ghost house entrance. Computed once
+per layout with a BFS and cached on disk next to the distance table
+"""
+
+import os
+from collections import deque
+import numpy as np
+from .constants import UP, DOWN, LEFT, RIGHT
+from .distances import CACHE_DIR, layout_hash
+
+# Richtungs-Codes im Feld - bei gleich langen Wegen UP > LEFT > DOWN > RIGHT
+FIELD_DIRECTIONS = [UP, LEFT, DOWN, RIGHT]
+NO_DIRECTION = -1
+
+# Format der Cache-Dateien (wie distances.TABLE_VERSION)
+FIELD_VERSION = 1
+
+# Ankunftsbereich um die Maze-Mitte (wie die Prüfung in Ghost.update_mode)
+HOUSE_RANGE_X = 1
+HOUSE_RANGE_Y = 2
+
+
+def get_house_tiles(maze):
+    """Walkable tiles in which an eaten ghost counts as back home"""
+    center_x = maze.width // 2
+    center_y = maze.height // 2
+    return [
+        (x, y)
+        for y in range(center_y - HOUSE_RANGE_Y, center_y + HOUSE_RANGE_Y + 1)
+        for x in range(center_x - HOUSE_RANGE_X, center_x + HOUSE_RANGE_X + 1)
+        if not maze.is_wall(x, y)
+    ]
+
+
+class ReturnField:
+    """
+    directions[y, x]: index into FIELD_DIRECTIONS or NO_DIRECTION (wall,
+    unreachable or already home), distances[y, x]: steps home or -1
+    """
+
+    def __init__(self, directions, distances):
+        self.directions = directions
+        self.distances = distances
+        # Tile -> Richtung als Tupel, damit Ghost.move nur einmal nachschlägt
+        self.lookup = {}
+        for y, x in zip(*np.nonzero(directions >= 0)):
+            self.lookup[(int(x), int(y))] = FIELD_DIRECTIONS[directions[y, x]]
+
+    @classmethod
+    def build(cls, maze):
+        """BFS from the house tiles over the tiles the ghosts can walk on"""
+        height, width = maze.height, maze.width
+        distances = np.full((height, width), -1, dtype=np.int16)
+        directions = np.full((height, width), NO_DIRECTION, dtype=np.int8)
+
+        queue = deque()
+        for x, y in get_house_tiles(maze):
+            distances[y, x] = 0
+            queue.append((x, y))
+
+        # Geister wählen nie eine Richtung aus dem Grid heraus, der Tunnel
+        # gehört für sie also nicht zum Weg
+        while queue:
+            x, y = queue.popleft()
+            steps = distances[y, x] + 1
+            for dx, dy in FIELD_DIRECTIONS:
+                next_x, next_y = x + dx, y + dy
+                if (
+                    0 <= next_x < width
+                    and 0 <= next_y < height
+                    and distances[next_y, next_x] < 0
+                    and not maze.is_wall(next_x, next_y)
+                ):
+                    distances[next_y, next_x] = steps
+                    queue.append((next_x, next_y))
+
+        # Richtung zum ersten Nachbarn, der einen Schritt näher liegt
+        for y in range(height):
+            for x in range(width):
+                steps = distances[y, x]
+                if steps <= 0:
+                    continue
+                for code, (dx, dy) in enumerate(FIELD_DIRECTIONS):
+                    next_x, next_y = x + dx, y + dy
+                    if (
+                        0 <= next_x < width
+                        and 0 <= next_y < height
+                        and distances[next_y, next_x] == steps - 1
+                    ):
+                        directions[y, x] = code
+                        break
+        return cls(directions, distances)
+
+    @classmethod
+    def load_or_build(cls, maze, cache_dir=CACHE_DIR):
+        """Lädt das Feld aus dem Cache oder berechnet und speichert es"""
+        path = os.path.join(
+            cache_dir, f"return_v{FIELD_VERSION}_{layout_hash(maze)}.npz"
+        )
+        try:
+            with np.load(path) as data:
+                return cls(data["directions"], data["distances"])
+        except (OSError, KeyError, ValueError):
+            pass
+
+        field = cls.build(maze)
+        field.save(path)
+        return field
+
+    def save(self, path):
+        """Speichert das Feld (atomar wie die Distanz-Tabelle)"""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as file:
+                np.savez(file, directions=self.directions, distances=self.distances)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"Konnte Rückweg-Feld nicht speichern: {e}")
+
+    def get_direction(self, grid_x, grid_y):
+        """First step home from (grid_x, grid_y) or None"""
+        return self.lookup.get((grid_x, grid_y))
+
+    def get_distance(self, grid_x, grid_y):
+        """Steps home from (grid_x, grid_y) or None"""
+        height, width = self.distances.shape
+        if 0 <= grid_x < width and 0 <= grid_y < height:
+            steps = int(self.distances[grid_y, grid_x])
+            return None if steps < 0 else steps
+        return None
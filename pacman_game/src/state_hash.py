@@ -0,0 +1,79 @@
+"""
+State Hashing
+Short BLAKE2b digest of everything that decides how a game continues
+(Pac-Man, ghosts, score, lives and pellets) - cheap enough to compute
+every frame, e.g. to find the first frame in which a replay desyncs
+"""
+
+import hashlib
+import struct
+import zlib
+
+# Pacman.current_direction / next_direction als Zahl
+DIRECTION_NUMBERS = {None: 0, "up": 1, "down": 2, "left": 3, "right": 4}
+
+# Pac-Man: x, y, Richtung, gewünschte Richtung, Boost-Timer
+# Pro Geist: Pixel-Position, Richtung, Modus, Timer, im Haus
+# Spiel: Score, Leben, Spawn-Timer, CRC32 des Pellet-Grids,
+#        Special-Pellet-Positionen (-1 = keins, 16 Bit für große Mazes)
+_PACMAN_FORMAT = "2d2bi"
+_GHOST_FORMAT = "2d2b4i?"
+_GAME_FORMAT = "4iI6h"
+_formats = {}
+
+
+def _get_struct(ghost_count):
+    """Compiled struct for a game with ghost_count ghosts"""
+    packer = _formats.get(ghost_count)
+    if packer is None:
+        packer = struct.Struct(
+            "<" + _PACMAN_FORMAT + _GHOST_FORMAT * ghost_count + _GAME_FORMAT
+        )
+        _formats[ghost_count] = packer
+    return packer
+
+
+def state_digest(game, digest_size=8):
+    """Digest of the game state as bytes (digest_size bytes long)"""
+    pacman = game.pacman
+    manager = game.pellet_manager
+
+    values = [
+        pacman.x,
+        pacman.y,
+        DIRECTION_NUMBERS[pacman.current_direction],
+        DIRECTION_NUMBERS[pacman.next_direction],
+        pacman.speed_boost_timer,
+    ]
+    for ghost in game.ghosts:
+        values += (
+            ghost.pixel_x,
+            ghost.pixel_y,
+            ghost.direction[0],
+            ghost.direction[1],
+            ghost.mode,
+            ghost.mode_timer,
+            ghost.house_exit_timer,
+            ghost.scatter_timer,
+            ghost.in_house,
+        )
+
+    specials = [(pellet.x, pellet.y) for pellet in manager.active_power_pellets]
+    speed_pellet = manager.active_speed_pellet
+    if speed_pellet:
+        specials.append((speed_pellet.x, speed_pellet.y))
+    specials += [(-1, -1)] * (3 - len(specials))
+    values += (
+        game.score,
+        game.lives,
+        manager.power_pellet_timer,
+        manager.speed_pellet_timer,
+        # CRC32 statt des ganzen Grids im BLAKE2b - deutlich schneller und
+        # erkennt jede Änderung einzelner Pellets
+        zlib.crc32(manager.pellet_grid),
+    )
+    for position in specials:
+        values += position
+
+    packed = _get_struct(len(game.ghosts)).pack(*values)
+    return hashlib.blake2b(packed, digest_size=digest_size).digest()
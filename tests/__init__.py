@@ -0,0 +1,15 @@
+"""
+Tests des Spiels - das Spiel liegt als Paket "src" in pacman_game (wie beim
+Start von main.py) und läuft hier ohne Fenster und Sound
+"""
+
+import os
+import sys
+
+GAME_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "pacman_game")
+)
+if GAME_DIR not in sys.path:
+    sys.path.insert(0, GAME_DIR)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
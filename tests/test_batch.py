@@ -0,0 +1,16 @@
+"""
+Conformance of the batch engine (src/batch.py) with the object engine
+"""
+
+import unittest
+from src.batch import verify_against_objects
+
+SEEDS = [0, 1, 2, 3]
+FRAMES = 1200
+
+
+class BatchConformanceTest(unittest.TestCase):
+    def test_batch_matches_object_engine(self):
+        results = verify_against_objects(SEEDS, FRAMES)
+        diverged = {seed: frame for seed, frame in results.items() if frame is not None}
+        self.assertEqual(diverged, {}, "first differing frame per seed")
@@ -0,0 +1,71 @@
+"""
+All-pairs distance table (src/distances.py) against a plain BFS over the tiles
+"""
+
+import unittest
+from collections import deque
+import numpy as np
+from src.distances import DistanceTable, UNREACHABLE, get_index_dtype
+from src.maze import Maze
+
+
+def bfs_distances(maze, start):
+    """Steps from start to every walkable tile, tunnel included"""
+    distances = {start: 0}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        for dx, dy in [(0, -1), (-1, 0), (0, 1), (1, 0)]:
+            tile = maze.get_tunnel_exit(x, y, dx, dy) or (x + dx, y + dy)
+            if tile not in distances and not maze.is_wall(*tile):
+                distances[tile] = distances[(x, y)] + 1
+                queue.append(tile)
+    return distances
+
+
+class DistanceTableTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.maze = Maze(load_assets=False)
+        cls.table = DistanceTable.build(cls.maze)
+
+    def test_distances_match_bfs_for_all_pairs(self):
+        tiles = self.maze.get_valid_positions()
+        for start in tiles:
+            expected = bfs_distances(self.maze, start)
+            row = [self.table.distance(start, goal) for goal in tiles]
+            self.assertEqual(row, [expected.get(goal) for goal in tiles], start)
+
+    def test_paths_are_shortest_and_connected(self):
+        tiles = self.maze.get_valid_positions()
+        for start in tiles[::7]:
+            for goal in tiles[::11]:
+                path = self.table.path(start, goal)
+                self.assertEqual(path[0], start)
+                self.assertEqual(path[-1], goal)
+                self.assertEqual(len(path) - 1, self.table.distance(start, goal))
+                for a, b in zip(path, path[1:]):
+                    self.assertEqual(self.table.distance(a, b), 1)
+                if start != goal:
+                    self.assertEqual(self.table.next_step(start, goal), path[1])
+
+    def test_tunnel_is_one_step(self):
+        maze = self.maze
+        left = (maze.LEFT_TUNNEL_X, maze.TUNNEL_ROW)
+        right = (maze.RIGHT_TUNNEL_X, maze.TUNNEL_ROW)
+        self.assertEqual(self.table.distance(left, right), 1)
+        self.assertEqual(self.table.next_step(left, right), right)
+
+    def test_walls_and_outside_have_no_distance(self):
+        self.assertIsNone(self.table.distance((0, 0), (1, 1)))
+        self.assertIsNone(self.table.distance((1, 1), (-5, 3)))
+        self.assertEqual(self.table.path((0, 0), (1, 1)), [])
+        # Im Original-Maze ist jedes Tile von jedem aus erreichbar
+        self.assertNotIn(UNREACHABLE, self.table.dist)
+
+    def test_index_dtype_grows_with_the_maze(self):
+        self.assertEqual(get_index_dtype(300), np.int16)
+        self.assertEqual(get_index_dtype(2**15 - 1), np.int16)
+        self.assertEqual(get_index_dtype(2**15), np.int32)
+        with self.assertRaises(ValueError):
+            get_index_dtype(2**31)
@@ -0,0 +1,70 @@
+"""
+Flow field toward Pac-Man (src/flow_field.py)
+"""
+
+import unittest
+from src.constants import STOP
+from src.distances import DistanceTable
+from src.maze import Maze
+from src.nodes import SLOT_OFFSETS
+
+SOURCES = [(1, 1), (26, 29), (13, 23), (6, 14), (0, 14), (27, 14)]
+
+
+class FlowFieldTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.maze = Maze(load_assets=False)
+        cls.table = DistanceTable.build(cls.maze)
+
+    def setUp(self):
+        self.field = self.maze.get_flow_field()
+        self.field.update(-5, -5)  # Jeder Test beginnt ohne Quelle
+
+    def test_distances_match_the_table(self):
+        tiles = self.maze.get_valid_positions()
+        for source in SOURCES:
+            self.field.update(*source)
+            self.assertEqual(self.field.source, source)
+            distances = [self.field.get_distance(*tile) for tile in tiles]
+            expected = [self.table.distance(tile, source) for tile in tiles]
+            self.assertEqual(distances, expected, source)
+
+    def test_directions_lead_to_the_source(self):
+        node_map = self.maze.node_map
+        for source in SOURCES:
+            self.field.update(*source)
+            self.assertEqual(self.field.get_direction(*source), STOP)
+            for node in self.maze.nodes:
+                # Den Richtungen folgen (über den Tunnel wie die Nodes)
+                steps = 0
+                current = node
+                while (current.grid_x, current.grid_y) != source:
+                    direction = self.field.get_direction(current.grid_x, current.grid_y)
+                    current = current.links[SLOT_OFFSETS.index(direction)]
+                    steps += 1
+                tile = (node.grid_x, node.grid_y)
+                self.assertEqual(steps, self.table.distance(tile, source), tile)
+                self.assertIs(node_map[tile], node)
+
+    def test_source_outside_the_graph(self):
+        # Pac-Man im Tunnel außerhalb des Grids oder auf einer Wand
+        for tile in [(-1, 14), (28, 14), (0, 0)]:
+            self.field.update(*tile)
+            self.assertIsNone(self.field.source)
+            self.assertIsNone(self.field.get_distance(1, 1))
+            self.assertIsNone(self.field.get_direction(1, 1))
+
+    def test_walls_have_no_distance(self):
+        self.field.update(1, 1)
+        self.assertIsNone(self.field.get_distance(0, 0))
+        self.assertIsNone(self.field.get_direction(0, 0))
+
+    def test_only_a_new_tile_changes_the_field(self):
+        rebuilds = self.field.rebuilds
+        self.assertTrue(self.field.update(1, 1))
+        self.assertFalse(self.field.update(1, 1))
+        self.assertFalse(self.field.update(1.0, 1.0))
+        self.assertTrue(self.field.update(2, 1))
+        self.assertEqual(self.field.rebuilds, rebuilds + 2)
+        self.assertEqual(self.field.get_distance(1, 1), 1)
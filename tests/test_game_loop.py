@@ -0,0 +1,121 @@
+"""
+Fixed-step accumulator and time scaling of the game loop (src/game_loop.py)
+"""
+
+import unittest
+from src.constants import FPS
+from src.game import Game
+from src.game_loop import (
+    FixedStepLoop,
+    MAX_FRAME_TIME,
+    MAX_UPDATES_PER_FRAME,
+    TIME_SCALES,
+    UNLIMITED,
+    format_time_scale,
+)
+
+STEP = 1 / FPS
+
+
+def count_updates(loop, deltas, time_scale=1.0):
+    """Total updates the loop runs for the given frame deltas"""
+    return sum(loop.advance(elapsed, time_scale) for elapsed in deltas)
+
+
+class FixedStepLoopTest(unittest.TestCase):
+    def test_one_update_per_step(self):
+        loop = FixedStepLoop()
+        self.assertEqual(count_updates(loop, [STEP] * FPS), FPS)
+        self.assertEqual(loop.dropped_time, 0.0)
+
+    def test_rendering_faster_than_simulation(self):
+        # 144 Hz Bildschirm: mal 0, mal 1 Update, in Summe 60 pro Sekunde
+        loop = FixedStepLoop()
+        counts = [loop.advance(1 / 144) for _ in range(144)]
+        self.assertEqual(set(counts), {0, 1})
+        self.assertIn(sum(counts), (FPS - 1, FPS))
+
+    def test_rendering_slower_than_simulation(self):
+        # 30 Hz: zwei Updates pro gezeichnetem Frame
+        loop = FixedStepLoop()
+        counts = [loop.advance(1 / 30) for _ in range(30)]
+        self.assertEqual(sum(counts), FPS)
+        self.assertTrue(all(count in (1, 2, 3) for count in counts))
+
+    def test_alpha_is_the_elapsed_part_of_the_next_step(self):
+        loop = FixedStepLoop()
+        self.assertEqual(loop.advance(STEP * 0.25), 0)
+        self.assertAlmostEqual(loop.get_alpha(), 0.25)
+        self.assertEqual(loop.advance(STEP * 0.5), 0)
+        self.assertAlmostEqual(loop.get_alpha(), 0.75)
+        self.assertEqual(loop.advance(STEP * 0.5), 1)
+        self.assertAlmostEqual(loop.get_alpha(), 0.25)
+
+    def test_long_stall_is_clamped(self):
+        loop = FixedStepLoop()
+        # 3 Sekunden Aussetzer zählen nur MAX_FRAME_TIME, davon läuft höchstens
+        # MAX_UPDATES_PER_FRAME, der Rest wird verworfen
+        self.assertEqual(loop.advance(3.0), MAX_UPDATES_PER_FRAME)
+        due = round(MAX_FRAME_TIME / STEP)
+        self.assertAlmostEqual(
+            loop.dropped_time, (due - MAX_UPDATES_PER_FRAME) * STEP, places=9
+        )
+        # Danach geht es normal weiter, ohne aufgestauten Rückstand
+        self.assertEqual(loop.advance(STEP), 1)
+
+    def test_max_updates_per_frame(self):
+        loop = FixedStepLoop(max_updates=2)
+        self.assertEqual(loop.advance(STEP * 4), 2)
+        self.assertAlmostEqual(loop.dropped_time, STEP * 2)
+
+    def test_updates_yields_advance_count(self):
+        loop = FixedStepLoop()
+        self.assertEqual(len(list(loop.updates(STEP * 3))), 3)
+
+
+class TimeScaleTest(unittest.TestCase):
+    def test_scale_multiplies_the_updates(self):
+        deltas = [STEP] * FPS
+        for time_scale in (0.25, 0.5, 2.0, 4.0):
+            with self.subTest(time_scale=time_scale):
+                updates = count_updates(FixedStepLoop(), deltas, time_scale)
+                self.assertEqual(updates, round(FPS * time_scale))
+
+    def test_fast_forward_allows_more_updates_per_frame(self):
+        # x16 bei 30 Hz: 32 Updates pro Frame, das Limit wächst mit
+        loop = FixedStepLoop()
+        self.assertEqual(loop.advance(1 / 30, 16.0), 32)
+        self.assertEqual(loop.dropped_time, 0.0)
+        # Ein Aussetzer wird auch im Zeitraffer begrenzt
+        self.assertEqual(loop.advance(3.0, 16.0), MAX_UPDATES_PER_FRAME * 16)
+
+    def test_slow_motion_interpolates(self):
+        loop = FixedStepLoop()
+        self.assertEqual(loop.advance(STEP, 0.25), 0)
+        self.assertAlmostEqual(loop.get_alpha(), 0.25)
+
+    def test_unlimited_runs_until_the_budget_is_used(self):
+        loop = FixedStepLoop()
+        loop.accumulator = STEP / 2
+        self.assertGreater(len(list(loop.updates(STEP, UNLIMITED))), 1)
+        self.assertEqual(loop.accumulator, 0.0)
+
+    def test_time_scales(self):
+        self.assertEqual(TIME_SCALES, sorted(TIME_SCALES))
+        self.assertIn(1.0, TIME_SCALES)
+        self.assertEqual(TIME_SCALES[-1], UNLIMITED)
+        labels = [format_time_scale(scale) for scale in TIME_SCALES]
+        self.assertEqual(labels, ["x0.25", "x0.5", "x1", "x2", "x4", "x16", "max"])
+
+    def test_game_snaps_to_a_known_scale(self):
+        game = Game(None, headless=True, seed=0)
+        game.set_time_scale(3.0)
+        self.assertIn(game.time_scale, (2.0, 4.0))
+        self.assertTrue(game.fast_forward)
+        game.set_time_scale(0.3)
+        self.assertEqual(game.time_scale, 0.25)
+        self.assertFalse(game.fast_forward)
+        # Menüs laufen immer in Echtzeit
+        self.assertEqual(game.get_time_scale(), 1.0)
+        game.start_game()
+        self.assertEqual(game.get_time_scale(), 0.25)
@@ -0,0 +1,91 @@
+"""
+Junction graph (src/junctions.py) against the all-pairs distance table
+"""
+
+import unittest
+import numpy as np
+from src.distances import DistanceTable
+from src.junctions import JunctionGraph, NO_VERTEX
+from src.maze import Maze
+
+
+class JunctionGraphTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.maze = Maze(load_assets=False)
+        cls.graph = JunctionGraph(cls.maze.nodes)
+        cls.table = DistanceTable.build(cls.maze)
+
+    def get_indices(self, tiles):
+        """Node indices of a list of tiles"""
+        node_map = self.maze.node_map
+        return np.array([node_map[tile].index for tile in tiles])
+
+    def test_far_fewer_vertices_than_nodes(self):
+        self.assertLess(self.graph.get_vertex_count(), len(self.maze.nodes) // 4)
+
+    def test_vertices_and_corridors_cover_every_node_once(self):
+        graph = self.graph
+        for node in self.maze.nodes:
+            vertex = graph.vertex_of[node.index]
+            if vertex != NO_VERTEX:
+                self.assertIs(graph.vertices[vertex], node)
+                self.assertIsNone(graph.corridor_of[node.index])
+                self.assertNotEqual(graph.get_degree(node), 2)
+            else:
+                corridor, position = graph.corridor_of[node.index]
+                self.assertEqual(corridor.tiles[position], node.index)
+                self.assertEqual(graph.get_degree(node), 2)
+
+    def test_corridors_are_chains_of_neighbours(self):
+        dist = self.table.dist
+        for corridor in self.graph.corridors:
+            indices = self.get_indices(self.graph.get_corridor_tiles(corridor))
+            self.assertTrue((dist[indices[:-1], indices[1:]] == 1).all(), corridor)
+            self.assertEqual(len(indices) - 1, corridor.get_length())
+
+    def test_anchors_are_reached_along_the_corridor(self):
+        for node in self.maze.nodes:
+            for vertex, steps in self.graph.get_anchors(node):
+                route = self.graph.walk_to_vertex(node, vertex)
+                self.assertEqual(len(route) - 1, steps)
+                # Über den Korridor nie kürzer als der kürzeste Weg
+                anchor = self.graph.vertices[vertex]
+                self.assertLessEqual(self.table.dist[node.index, anchor.index], steps)
+
+    def test_distance_and_path_for_every_pair(self):
+        # distance() und path() sind dünne Hüllen um search()
+        nodes = self.maze.nodes
+        dist = self.table.dist
+        for start in nodes:
+            lengths = []
+            ends = []
+            steps = []
+            for goal in nodes:
+                length, route = self.graph.search(start, goal)
+                lengths.append(length)
+                ends.append((route[0].index, route[-1].index, len(route) - 1))
+                steps += [(a.index, b.index) for a, b in zip(route, route[1:])]
+            self.assertEqual(lengths, dist[start.index].tolist(), start)
+            expected = [(start.index, goal.index, n) for goal, n in zip(nodes, lengths)]
+            self.assertEqual(ends, expected, start)
+            if steps:
+                first, second = np.array(steps).T
+                self.assertTrue((dist[first, second] == 1).all(), start)
+
+    def test_distance_and_path_wrappers(self):
+        maze = self.maze
+        pairs = [
+            ((1, 1), (26, 29)),  # Quer durchs Maze
+            ((3, 14), (24, 14)),  # Durch den Tunnel
+            ((2, 5), (4, 5)),  # Im selben Korridor
+            ((6, 8), (6, 8)),
+        ]
+        for start, goal in pairs:
+            start_node = maze.node_map[start]
+            goal_node = maze.node_map[goal]
+            length, route = self.graph.search(start_node, goal_node)
+            self.assertEqual(self.graph.distance(start_node, goal_node), length)
+            self.assertEqual(length, self.table.distance(start, goal))
+            path = self.graph.path(start_node, goal_node)
+            self.assertEqual(path, [(node.grid_x, node.grid_y) for node in route])
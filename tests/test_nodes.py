@@ -0,0 +1,71 @@
+"""
+Node graph of the maze (src/nodes.py)
+"""
+
+import unittest
+import numpy as np
+from src.maze import Maze
+from src.nodes import (
+    SLOT_LEFT,
+    SLOT_RIGHT,
+    graph_from_arrays,
+    graph_to_arrays,
+    find_nearest_node,
+)
+
+
+class NodeGraphTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.maze = Maze(load_assets=False)
+
+    def test_arrays_round_trip(self):
+        maze = self.maze
+        arrays = graph_to_arrays(maze.nodes)
+        nodes, node_map = graph_from_arrays(arrays, maze.width, maze.height)
+
+        self.assertEqual(len(nodes), len(maze.nodes))
+        for original, node in zip(maze.nodes, nodes):
+            self.assertEqual(
+                (node.grid_x, node.grid_y, node.index),
+                (
+                    original.grid_x,
+                    original.grid_y,
+                    original.index,
+                ),
+            )
+            self.assertEqual(node.tunnel_mask, original.tunnel_mask)
+            self.assertEqual(
+                [link.index if link else None for link in node.links],
+                [link.index if link else None for link in original.links],
+            )
+            self.assertIs(node_map[(node.grid_x, node.grid_y)], node)
+
+        again = graph_to_arrays(nodes)
+        for name, values in arrays.items():
+            self.assertTrue(np.array_equal(again[name], values), name)
+            self.assertEqual(again[name].dtype, values.dtype, name)
+
+        # Auch die Nearest-Tabelle wird neu aufgebaut
+        for tile in [(0, 0), (-2, 14), (29, 14), (13, 14)]:
+            self.assertEqual(
+                find_nearest_node(node_map, *tile).index,
+                find_nearest_node(maze.node_map, *tile).index,
+            )
+
+    def test_tunnel_links(self):
+        maze = self.maze
+        left = maze.node_map[(maze.LEFT_TUNNEL_X, maze.TUNNEL_ROW)]
+        right = maze.node_map[(maze.RIGHT_TUNNEL_X, maze.TUNNEL_ROW)]
+        self.assertIs(left.links[SLOT_LEFT], right)
+        self.assertIs(right.links[SLOT_RIGHT], left)
+        self.assertTrue(left.is_tunnel(SLOT_LEFT))
+        self.assertFalse(left.is_tunnel(SLOT_RIGHT))
+        tunnel_nodes = [node for node in maze.nodes if node.tunnel_mask]
+        self.assertEqual(tunnel_nodes, [left, right])
+
+        # neighbors / get_neighbor_in_direction kennen wie bisher nur die
+        # direkt angrenzenden Nodes
+        self.assertEqual(left.neighbors, [left.links[SLOT_RIGHT]])
+        self.assertIsNone(left.get_neighbor_in_direction("left"))
+        self.assertIs(left.get_neighbor_in_direction("right"), left.links[SLOT_RIGHT])
@@ -0,0 +1,141 @@
+"""
+Path service (src/pathing.py): A*, junction search and the LRU cache
+"""
+
+import random
+import unittest
+from src.distances import DistanceTable
+from src.maze import Maze
+from src.pathing import PathService, JUNCTION_DISTANCE
+
+SAMPLES = 400
+
+
+class PathServiceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        maze = Maze(load_assets=False)
+        cls.table = DistanceTable.build(maze)
+        tiles = maze.get_valid_positions()
+        rng = random.Random(0)
+        cls.pairs = [(rng.choice(tiles), rng.choice(tiles)) for _ in range(SAMPLES)]
+        # Wege durch den Tunnel: die Gegenseite ist über den Tunnel kürzer
+        row = maze.TUNNEL_ROW
+        cls.pairs += [
+            ((x, row), (maze.width - 1 - y, row)) for x in range(6) for y in range(6)
+        ]
+        cls.pairs += [((6, 11), (21, 17)), ((3, 14), (27, 14))]
+
+    def setUp(self):
+        self.maze = Maze(load_assets=False)
+        self.service = self.maze.path_service
+
+    def assertShortestPath(self, path, start, goal):
+        """path leads from start to goal in single steps and is shortest"""
+        self.assertEqual(path[0], start)
+        self.assertEqual(path[-1], goal)
+        self.assertEqual(len(path) - 1, self.table.distance(start, goal), (start, goal))
+        for a, b in zip(path, path[1:]):
+            self.assertEqual(self.table.distance(a, b), 1, (a, b))
+
+    def test_tile_search_is_shortest(self):
+        for start, goal in self.pairs:
+            self.assertShortestPath(self.service.search_tiles(start, goal), start, goal)
+
+    def test_junction_search_is_shortest(self):
+        for start, goal in self.pairs:
+            path = self.service.search_junctions(start, goal)
+            self.assertShortestPath(path, start, goal)
+
+    def test_find_path_is_shortest(self):
+        long_queries = 0
+        for start, goal in self.pairs:
+            self.assertShortestPath(self.maze.find_path(start, goal), start, goal)
+            self.assertEqual(
+                self.service.distance(start, goal), self.table.distance(start, goal)
+            )
+            if self.service.heuristic(start, goal) >= JUNCTION_DISTANCE:
+                long_queries += 1
+        # Beide Suchen kommen in der Stichprobe vor
+        self.assertGreater(long_queries, 0)
+        self.assertLess(long_queries, len(self.pairs))
+
+    def test_tunnel_path(self):
+        maze = self.maze
+        left = (maze.LEFT_TUNNEL_X, maze.TUNNEL_ROW)
+        right = (maze.RIGHT_TUNNEL_X, maze.TUNNEL_ROW)
+        self.assertEqual(self.service.find_path(left, right), [left, right])
+        path = self.service.find_path((2, 14), (25, 14))
+        self.assertIn((left, right), list(zip(path, path[1:])))
+        self.assertEqual(len(path) - 1, 5)
+
+    def test_heuristic_never_overestimates(self):
+        for start, goal in self.pairs:
+            self.assertLessEqual(
+                self.service.heuristic(start, goal), self.table.distance(start, goal)
+            )
+
+    def test_walls_and_outside_have_no_path(self):
+        blocked = [
+            ((0, 0), (1, 1)),  # Start in der Wand
+            ((1, 1), (13, 14)),  # Ziel in der Wand
+            ((-3, 14), (1, 1)),  # Start außerhalb des Grids
+            ((1, 1), (5, 40)),  # Ziel außerhalb des Grids
+        ]
+        for start, goal in blocked:
+            with self.subTest(start=start, goal=goal):
+                self.assertEqual(self.service.find_path(start, goal), [])
+                self.assertIsNone(self.service.distance(start, goal))
+                self.assertEqual(self.service.search_tiles(start, goal), [])
+                self.assertEqual(self.service.search_junctions(start, goal), [])
+                self.assertEqual(self.maze.find_path(start, goal), [])
+
+    def test_cache_hits_and_copies(self):
+        path = self.service.find_path((1, 1), (26, 29))
+        path.append((0, 0))  # Der Cache gibt Kopien heraus
+        self.assertEqual(self.service.find_path((1, 1), (26, 29))[-1], (26, 29))
+        self.assertEqual((self.service.hits, self.service.misses), (1, 1))
+
+    def test_lru_evicts_at_capacity(self):
+        service = PathService(self.maze, cache_size=3)
+        a, b, c, d = (
+            ((1, 1), (26, 29)),
+            ((1, 5), (6, 8)),
+            ((12, 1), (15, 5)),
+            ((9, 11), (18, 17)),
+        )
+        for pair in (a, b, c):
+            service.find_path(*pair)
+        service.find_path(*a)  # a ist jetzt zuletzt benutzt, b am längsten nicht
+        service.find_path(*d)
+        self.assertEqual(len(service.cache), 3)
+        self.assertEqual(list(service.cache), [c, a, d])
+
+        misses = service.misses
+        service.find_path(*a)
+        self.assertEqual(service.misses, misses)
+        service.find_path(*b)
+        self.assertEqual(service.misses, misses + 1)
+        self.assertNotIn(c, service.cache)
+
+    def test_set_layout_clears_the_cache(self):
+        maze = self.maze
+        start, goal = (1, 5), (26, 5)
+        path = maze.find_path(start, goal)
+        self.assertEqual(len(path) - 1, 25)
+        self.assertTrue(self.service.cache)
+
+        # Den geraden Gang in Zeile 5 mit einer Wand sperren
+        layout = list(maze.layout_strings)
+        layout[5] = layout[5][:13] + "#" + layout[5][14:]
+        maze.set_layout(layout)
+        self.assertFalse(self.service.cache)
+        self.assertIsNone(self.service.neighbors)
+
+        detour = maze.find_path(start, goal)
+        self.assertNotIn((13, 5), detour)
+        self.assertEqual(
+            len(detour) - 1, DistanceTable.build(maze).distance(start, goal)
+        )
+        self.assertGreater(len(detour), len(path))
+        self.assertEqual(maze.find_path((13, 5), goal), [])
@@ -0,0 +1,23 @@
+"""
+Sections of the frame profiler (src/profiler.py) in headless runs
+"""
+
+import unittest
+from src.headless import HeadlessRunner
+
+FRAMES = 120
+
+
+class HeadlessProfileTest(unittest.TestCase):
+    def test_headless_profile_has_no_draw_sections(self):
+        runner = HeadlessRunner(profile=True, seed=3)
+        stats = runner.run(FRAMES)
+        profiler = runner.game.profiler
+
+        self.assertFalse([name for name in profiler.sections if "draw" in name])
+        self.assertEqual(list(stats["profile"]), profiler.sections)
+        # Jede gemeldete Section wurde in den Frames auch wirklich gemessen
+        samples = profiler.get_samples()
+        self.assertEqual(len(samples), FRAMES - 1)
+        self.assertTrue(samples.any(axis=0).all(), profiler.sections)
+        self.assertEqual(len(profiler.get_frame_times()), FRAMES - 1)
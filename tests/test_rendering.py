@@ -0,0 +1,80 @@
+"""
+Dirty-rect rendering (Game.draw_playing_dirty) against a full redraw
+"""
+
+import contextlib
+import io
+import os
+import random
+import unittest
+import pygame
+from src.constants import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    PLAYING,
+    DYING,
+    UP,
+    DOWN,
+    LEFT,
+    RIGHT,
+)
+from src.game import Game
+from tests import GAME_DIR
+
+SEED = 7
+FRAMES = 900
+DIRECTIONS = [UP, DOWN, LEFT, RIGHT]
+
+
+class DirtyRectRenderingTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Assets werden relativ zu pacman_game geladen (wie beim Start von main.py)
+        cls.previous_dir = os.getcwd()
+        os.chdir(GAME_DIR)
+        pygame.init()
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+        os.chdir(cls.previous_dir)
+
+    def create_game(self, use_dirty_rects):
+        """Seeded game drawing into its own offscreen surface"""
+        screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = Game(screen, seed=SEED)
+        game.use_dirty_rects = use_dirty_rects
+        game.start_game()
+        return game
+
+    def test_dirty_frames_match_full_redraw(self):
+        dirty = self.create_game(True)
+        full = self.create_game(False)
+        rng = random.Random(SEED)
+        dirty_frames = 0
+
+        for frame in range(FRAMES):
+            if frame % 15 == 0:
+                direction = rng.choice(DIRECTIONS)
+                dirty.set_pacman_direction(direction)
+                full.set_pacman_direction(direction)
+            dirty.update()
+            full.update()
+            # Auch zwischen zwei Updates interpoliert zeichnen
+            alpha = (frame % 4 + 1) / 4
+            dirty.draw(alpha)
+            full.draw(alpha)
+
+            self.assertEqual(dirty.state, full.state)
+            if dirty.get_dirty_rects() is not None:
+                dirty_frames += 1
+            pixels = pygame.image.tobytes(dirty.screen, "RGB")
+            expected = pygame.image.tobytes(full.screen, "RGB")
+            self.assertTrue(pixels == expected, f"pixels differ in frame {frame}")
+            if dirty.state not in (PLAYING, DYING):
+                break
+
+        # Der Vergleich muss wirklich über den Dirty-Rect-Pfad gelaufen sein
+        self.assertGreater(dirty_frames, FRAMES // 2)
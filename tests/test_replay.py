@@ -0,0 +1,195 @@
+"""
+Replays (src/replay.py): recording, playback and desync detection
+"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+import pygame
+from src.constants import (
+    SCREEN_WIDTH,
+    SCREEN_HEIGHT,
+    PLAYING,
+    DYING,
+    GAME_OVER,
+    UP,
+    DOWN,
+    LEFT,
+    RIGHT,
+)
+from src.game import Game
+from src.pellets import Pellet
+from src.replay import ReplayPlayer, REPLAY_VERSION, load_replay
+from src.state_hash import state_digest
+from tests import GAME_DIR
+
+SEED = 3
+MAX_FRAMES = 20000
+# Frame, in dem die Wiedergabe absichtlich vom Original abweicht
+CHANGED_FRAME = 250
+DIRECTIONS = [UP, DOWN, LEFT, RIGHT]
+
+
+def create_game(headless, seed=SEED):
+    """Headless game or a windowed one with death animation (offscreen)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        if headless:
+            return Game(None, headless=True, seed=seed)
+        return Game(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)), seed=seed)
+
+
+def play(game, stop):
+    """Steer Pac-Man randomly (seeded) until stop(game, deaths) is true"""
+    rng = random.Random(game.seed)
+    deaths = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        game.start_game()
+        while game.state in (PLAYING, DYING) and game.frame < MAX_FRAMES:
+            if game.state == PLAYING and game.frame % 15 == 0:
+                game.set_pacman_direction(rng.choice(DIRECTIONS))
+            lives = game.lives
+            game.update()
+            deaths += lives - game.lives
+            if stop(game, deaths):
+                break
+    return game.replay.to_dict(game)
+
+
+def verify(replay, headless):
+    """Play the replay headless or with death animations, (identical, game)"""
+    player = ReplayPlayer(replay)
+    with contextlib.redirect_stdout(io.StringIO()):
+        identical, game = player.verify(create_game(headless))
+    return identical, game, player
+
+
+class ReplayTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Assets werden relativ zu pacman_game geladen (wie beim Start von main.py)
+        cls.previous_dir = os.getcwd()
+        os.chdir(GAME_DIR)
+        pygame.init()
+        pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+        os.chdir(cls.previous_dir)
+
+    def assertVerifies(self, replay):
+        """The replay reproduces its run in both playback modes"""
+        for headless in (True, False):
+            identical, game, player = verify(replay, headless)
+            self.assertIsNone(player.first_divergence, f"headless={headless}")
+            self.assertTrue(identical, f"headless={headless}")
+            self.assertEqual(game.frame, replay["frames"])
+
+
+class ReplayDeathTest(ReplayTestCase):
+    def test_replay_ending_during_death_animation(self):
+        # Aufnahme mit Todesanimation, beendet mitten im zweiten Tod
+        game = create_game(headless=False)
+        dying_frames = []
+
+        def stop(game, deaths):
+            if deaths == 2 and game.state == DYING:
+                dying_frames.append(game.frame)
+            return len(dying_frames) == 20
+
+        replay = play(game, stop)
+        self.assertEqual(game.state, DYING)
+        self.assertEqual(replay["final"]["state"], PLAYING)
+        # Der Digest des Frames mit dem zweiten Tod fehlt in der Aufnahme
+        self.assertEqual(len(replay["hashes"]) // 2, (replay["frames"] - 1) * 4)
+        self.assertVerifies(replay)
+
+    def test_headless_replay_until_game_over(self):
+        game = create_game(headless=True)
+        replay = play(game, lambda game, deaths: False)
+        self.assertEqual(game.state, GAME_OVER)
+        self.assertVerifies(replay)
+
+
+class ReplayRoundTripTest(ReplayTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.game = create_game(headless=True)
+        cls.replay = play(cls.game, lambda game, deaths: game.frame == 600)
+
+    def test_saved_replay_verifies(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "replay.json")
+            self.game.replay.save(path, self.game)
+            replay = load_replay(path)
+        self.assertEqual(replay, self.replay)
+        self.assertEqual(replay["frames"], 600)
+        self.assertVerifies(replay)
+
+    def test_state_change_is_reported_in_its_frame(self):
+        game = create_game(headless=True)
+        update = game.update
+
+        def changed_update():
+            if game.frame + 1 == CHANGED_FRAME:
+                game.score += 10  # Nur ein einziges Feld, vor diesem Frame
+            update()
+
+        game.update = changed_update
+        player = ReplayPlayer(self.replay)
+        with contextlib.redirect_stdout(io.StringIO()):
+            identical, _ = player.verify(game)
+        self.assertFalse(identical)
+        self.assertEqual(player.first_divergence, CHANGED_FRAME)
+
+    def test_changed_digest_is_reported_in_its_frame(self):
+        replay = dict(self.replay)
+        hashes = bytearray.fromhex(replay["hashes"])
+        hashes[(CHANGED_FRAME - 1) * 4] ^= 1
+        replay["hashes"] = hashes.hex()
+        identical, _, player = verify(replay, headless=True)
+        self.assertFalse(identical)
+        self.assertEqual(player.first_divergence, CHANGED_FRAME)
+
+    def test_old_replay_version_is_rejected(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "replay.json")
+            with open(path, "w") as file:
+                json.dump(dict(self.replay, version=REPLAY_VERSION - 1), file)
+            with self.assertRaises(ValueError):
+                load_replay(path)
+
+
+class StateDigestTest(unittest.TestCase):
+    def create_started_game(self):
+        game = create_game(headless=True)
+        game.start_game()
+        return game
+
+    def test_every_part_of_the_state_changes_the_digest(self):
+        changes = {
+            "score": lambda game: setattr(game, "score", game.score + 10),
+            "lives": lambda game: setattr(game, "lives", game.lives - 1),
+            "pacman": lambda game: setattr(game.pacman, "x", game.pacman.x + 1),
+            "ghost": lambda game: setattr(game.ghosts[2], "mode_timer", 7),
+            "pellets": lambda game: game.pellet_manager.pellet_grid.__setitem__(40, 0),
+        }
+        for name, change in changes.items():
+            with self.subTest(name):
+                game = self.create_started_game()
+                digest = state_digest(game)
+                change(game)
+                self.assertNotEqual(state_digest(game), digest)
+
+    def test_special_pellets_on_large_mazes(self):
+        # Koordinaten über 127 passen nicht in ein Byte (großes Maze)
+        game = self.create_started_game()
+        game.pellet_manager.active_power_pellets = [Pellet(300, 200, True)]
+        digest = state_digest(game)
+        game.pellet_manager.active_power_pellets = [Pellet(300, 201, True)]
+        self.assertNotEqual(state_digest(game), digest)
@@ -0,0 +1,61 @@
+"""
+Return field of the eaten ghosts (src/return_field.py)
+"""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from src.distances import DistanceTable
+from src.maze import Maze
+from src.return_field import ReturnField, get_house_tiles, FIELD_VERSION
+
+
+class ReturnFieldTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.maze = Maze(load_assets=False)
+        cls.table = DistanceTable.build(cls.maze)
+        cls.field = ReturnField.build(cls.maze)
+        cls.house = get_house_tiles(cls.maze)
+
+    def get_home_distance(self, tile):
+        """Shortest way from tile to the nearest house tile (distance table)"""
+        return min(self.table.distance(tile, house) for house in self.house)
+
+    def test_directions_lead_home_on_the_shortest_way(self):
+        tiles = self.maze.get_valid_positions()
+        # Auch die beiden Tunnel-Tiles am Rand des Grids
+        self.assertIn((self.maze.LEFT_TUNNEL_X, self.maze.TUNNEL_ROW), tiles)
+        self.assertIn((self.maze.RIGHT_TUNNEL_X, self.maze.TUNNEL_ROW), tiles)
+        for tile in tiles:
+            steps = 0
+            x, y = tile
+            while (x, y) not in self.house:
+                dx, dy = self.field.get_direction(x, y)
+                x, y = x + dx, y + dy
+                self.assertFalse(self.maze.is_wall(x, y), tile)
+                steps += 1
+                self.assertLessEqual(steps, len(tiles), tile)  # Kein Kreislauf
+            self.assertEqual(steps, self.get_home_distance(tile), tile)
+            self.assertEqual(self.field.get_distance(*tile), steps, tile)
+
+    def test_house_walls_and_outside(self):
+        self.assertTrue(self.house)
+        for tile in self.house:
+            self.assertEqual(self.field.get_distance(*tile), 0)
+            self.assertIsNone(self.field.get_direction(*tile))
+        for tile in [(0, 0), (-1, 14), (28, 14), (5, 40)]:
+            self.assertIsNone(self.field.get_distance(*tile))
+            self.assertIsNone(self.field.get_direction(*tile))
+
+    def test_cache_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            built = ReturnField.load_or_build(self.maze, directory)
+            names = os.listdir(directory)
+            self.assertEqual(len(names), 1)
+            self.assertTrue(names[0].startswith(f"return_v{FIELD_VERSION}_"))
+            loaded = ReturnField.load_or_build(self.maze, directory)
+        self.assertTrue(np.array_equal(loaded.directions, built.directions))
+        self.assertTrue(np.array_equal(loaded.distances, self.field.distances))
+        self.assertEqual(loaded.lookup, self.field.lookup)